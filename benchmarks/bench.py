@@ -0,0 +1,297 @@
+"""
+.. module: bench
+   :synopsis: A reproducible benchmark suite for MVL. Times (and measures the
+   peak memory of) every operator on floats, LogicValues and arrays, and
+   LogicSystem construction and conversion as the number of values grows.
+   Results are saved as JSON, and can be compared against a stored baseline.
+
+   Usage::
+
+       make bench-baseline  # Record a baseline.
+       make bench           # Compare against it.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from json import dump, load
+from os import path
+from platform import platform, python_version
+from sys import exit as sys_exit
+from timeit import Timer
+from tracemalloc import get_traced_memory, start, stop
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.lukasiewicz import LogicSystem, LukasiewiczLogicValue
+from mvl.fuzzy import Gaussian, Mamdani, Rule, Sugeno, Triangular, Variable
+import mvl.bochvar as bochvar
+import mvl.goedel as goedel
+import mvl.lukasiewicz as lukasiewicz
+import mvl.post as post
+import mvl.product as product
+import mvl.tvl_operators as tvl_operators
+import mvl.vectorized.bochvar as v_bochvar
+import mvl.vectorized.goedel as v_goedel
+import mvl.vectorized.lukasiewicz as v_lukasiewicz
+import mvl.vectorized.post as v_post
+import mvl.vectorized.product as v_product
+import mvl.vectorized.tvl_operators as v_tvl_operators
+
+
+DIRECTORY: str = path.dirname(path.abspath(__file__))
+DEFAULT_OUTPUT: str = path.join(DIRECTORY, 'results.json')
+DEFAULT_BASELINE: str = path.join(DIRECTORY, 'baseline.json')
+DEFAULT_THRESHOLD: float = 1.25
+""" How many times slower than the baseline a workload must be to be reported
+as a regression.
+"""
+
+Workload = Tuple[str, Callable[[], object]]
+""" A type defining a named benchmark: a function taking no arguments.
+"""
+
+OPERATORS = [
+    # (module name, scalar module, array module, binary ops, unary ops)
+    ('lukasiewicz', lukasiewicz, v_lukasiewicz,
+        ['s_and', 'w_and', 's_or', 'w_or', 'implies', 'equivalent'],
+        ['not_']),
+    ('goedel', goedel, v_goedel, ['and_', 'or_', 'implies'], ['not_']),
+    ('product', product, v_product, ['mult', 'and_', 'implies'], ['not_']),
+    ('post', post, v_post, ['and_', 'or_'], []),
+    ('tvl_operators', tvl_operators, v_tvl_operators,
+        ['and_', 'or_', 'implies', 'iff', 'xor'], ['not_']),
+    ('bochvar', bochvar, v_bochvar, ['and_', 'or_', 'implies', 'iff'],
+        ['not_']),
+]
+
+SYSTEM_SIZES: List[int] = [3, 5, 11, 101, 1001]
+
+
+## Begin workloads #############################################################
+
+def operator_workloads(batch_size: int) -> Iterator[Workload]:
+    """ Yields a scalar, LogicValue and batch workload for every operator.
+    """
+    random = np.random.default_rng(0)
+    kleene_values = bochvar.bochvar.values
+    batch_a = random.choice([0, 0.5, 1], batch_size)
+    batch_b = random.choice([0, 0.5, 1], batch_size)
+
+    for name, module, array_module, binary_ops, unary_ops in OPERATORS:
+        a, b = kleene_values[2], kleene_values[1]
+        for op_name in binary_ops:
+            op = getattr(module, op_name)
+            array_op = getattr(array_module, op_name)
+            prefix = 'operators.{}.{}'.format(name, op_name)
+            yield prefix + '.float', lambda op=op: op(1.0, 0.5)
+            yield prefix + '.logic_value', lambda op=op: op(a, b)
+            yield prefix + '.batch', lambda op=array_op: op(batch_a, batch_b)
+        for op_name in unary_ops:
+            op = getattr(module, op_name)
+            array_op = getattr(array_module, op_name)
+            prefix = 'operators.{}.{}'.format(name, op_name)
+            yield prefix + '.float', lambda op=op: op(0.5)
+            yield prefix + '.logic_value', lambda op=op: op(b)
+            yield prefix + '.batch', lambda op=array_op: op(batch_a)
+
+    # Post's not_ only works on post LogicValues.
+    post_system = LogicSystem(5, post.PostLukasiewiczLogicValue)
+    value = post_system.values[2]
+    yield 'operators.post.not_.logic_value', lambda: post.not_(value)
+    yield 'operators.post.not_.batch', lambda: v_post.not_(batch_a, 4)
+
+
+def system_workloads(batch_size: int) -> Iterator[Workload]:
+    """ Yields workloads for LogicSystem construction and conversion, for each
+    size in SYSTEM_SIZES.
+    """
+    floats = np.random.default_rng(0).random(batch_size)
+
+    for n_values in SYSTEM_SIZES:
+        def construct(n_values: int = n_values) -> LogicSystem:
+            # LogicSystems are cached, so forget this one to time building it.
+            LogicSystem._instances.pop(
+                (LogicSystem, n_values, LukasiewiczLogicValue), None
+            )
+            return LogicSystem(n_values, LukasiewiczLogicValue)
+
+        system = LogicSystem(n_values, LukasiewiczLogicValue)
+        prefix = 'systems.{}'.format(n_values)
+        yield prefix + '.construct', construct
+        yield prefix + '.mvl', lambda system=system: system.mvl(0.3)
+        yield prefix + '.quantize', lambda system=system: system.quantize(floats)
+
+    # Leave the cache as it was found.
+    for n_values in SYSTEM_SIZES:
+        LogicSystem(n_values, LukasiewiczLogicValue)
+
+
+def fuzzy_workloads(batch_size: int) -> Iterator[Workload]:
+    """ Yields workloads for evaluating a small Mamdani and Sugeno system over a
+    batch of samples.
+    """
+    service = Variable('service', {
+        'poor': Gaussian(0, 1.5),
+        'good': Gaussian(5, 1.5),
+        'excellent': Gaussian(10, 1.5),
+    })
+    tip = Variable('tip', {
+        'cheap': Triangular(0, 5, 10),
+        'average': Triangular(10, 15, 20),
+        'generous': Triangular(20, 25, 30),
+    }, universe=np.linspace(0, 30, 61))
+    terms = [('poor', 'cheap', 5), ('good', 'average', 15),
+        ('excellent', 'generous', 25)]
+    mamdani = Mamdani([service], [tip], [
+        Rule({'service': term}, {'tip': output}) for term, output, _ in terms
+    ])
+    sugeno = Sugeno([service], [
+        Rule({'service': term}, {'tip': value}) for term, _, value in terms
+    ])
+    samples = {'service': np.random.default_rng(0).uniform(0, 10, batch_size)}
+
+    yield 'fuzzy.mamdani.batch', lambda: mamdani(samples)
+    yield 'fuzzy.sugeno.batch', lambda: sugeno(samples)
+
+############################################################# End workloads ##
+## Begin measurement ###########################################################
+
+def time_workload(function: Callable[[], object], repeats: int) -> float:
+    """ Returns the fastest time (in seconds) of a single call of function,
+    over several repeats.
+    """
+    timer = Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeats, number=number)) / number
+
+
+def measure_memory(function: Callable[[], object]) -> int:
+    """ Returns the peak memory (in bytes) allocated by a single call of
+    function.
+    """
+    start()
+    try:
+        function()
+        return get_traced_memory()[1]
+    finally:
+        stop()
+
+
+def run(
+    batch_size: int,
+    repeats: int,
+    name_filter: Optional[str] = None,
+) -> Dict[str, Dict[str, float]]:
+    """ Runs every workload (whose name contains name_filter), and returns its
+    time and peak memory.
+    """
+    workloads = list(operator_workloads(batch_size))
+    workloads += list(system_workloads(batch_size))
+    workloads += list(fuzzy_workloads(batch_size))
+
+    results = {}
+    for name, function in workloads:
+        if name_filter and name_filter not in name:
+            continue
+        results[name] = {
+            'seconds': time_workload(function, repeats),
+            'peak_bytes': measure_memory(function),
+        }
+        print('{:<50} {:>12.3e} s {:>12} B'.format(
+            name, results[name]['seconds'], results[name]['peak_bytes']
+        ))
+    return results
+
+######################################################### End measurement ##
+## Begin comparison ############################################################
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> List[str]:
+    """ Returns a description of every workload which is more than threshold
+    times slower (or uses more than threshold times the memory) than in the
+    baseline.
+    """
+    regressions = []
+    for name, result in sorted(results.items()):
+        if name not in baseline:
+            continue
+        for metric in ['seconds', 'peak_bytes']:
+            old = baseline[name][metric]
+            new = result[metric]
+            if old > 0 and new / old > threshold:
+                regressions.append('{} {}: {:.3g} -> {:.3g} ({:.2f}x)'.format(
+                    name, metric, old, new, new / old
+                ))
+    return regressions
+
+
+def metadata(batch_size: int, repeats: int) -> Dict[str, object]:
+    """ Returns a description of the machine and settings used for a run.
+    """
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'python': python_version(),
+        'numpy': np.__version__,
+        'platform': platform(),
+        'batch_size': batch_size,
+        'repeats': repeats,
+    }
+
+######################################################## End comparison ##
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = ArgumentParser(description=__doc__.split('\n')[2].strip())
+    parser.add_argument('--output', default=DEFAULT_OUTPUT,
+        help='Where to save the results (default: %(default)s).')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+        help='The baseline to compare against (default: %(default)s).')
+    parser.add_argument('--save-baseline', action='store_true',
+        help='Save the results as the new baseline, instead of comparing.')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+        help='The slowdown reported as a regression (default: %(default)s).')
+    parser.add_argument('--batch-size', type=int, default=1000000,
+        help='The length of arrays in batch workloads (default: %(default)s).')
+    parser.add_argument('--repeats', type=int, default=5,
+        help='How many times to time each workload (default: %(default)s).')
+    parser.add_argument('--filter', default=None,
+        help='Only run workloads whose names contain this string.')
+    args = parser.parse_args(argv)
+
+    report = {
+        'metadata': metadata(args.batch_size, args.repeats),
+        'results': run(args.batch_size, args.repeats, args.filter),
+    }
+
+    output = args.baseline if args.save_baseline else args.output
+    with open(output, 'w') as file:
+        dump(report, file, indent=2, sort_keys=True)
+    print('Saved results to {}'.format(output))
+
+    if args.save_baseline:
+        return 0
+    if not path.exists(args.baseline):
+        print('No baseline at {}. Run with --save-baseline to record one.'
+            .format(args.baseline))
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = load(file)
+    if baseline['metadata'].get('batch_size') != args.batch_size:
+        print('Warning: the baseline used a different batch size.')
+    regressions = compare(report['results'], baseline['results'], args.threshold)
+    for regression in regressions:
+        print('REGRESSION ' + regression)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys_exit(main())
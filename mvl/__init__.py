@@ -0,0 +1,95 @@
+"""
+.. module: mvl
+   :synopsis: A package which implements various systems of n valued logic.
+
+   Importing mvl is cheap: its modules (and the logic systems they build) are
+   only imported the first time they are accessed, as in::
+
+       import mvl
+       mvl.kleene.and_(mvl.kleene.t, mvl.kleene.u)
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages. These are kept to modules which are always
+# loaded by the interpreter, so that importing mvl stays cheap.
+from sys import modules
+
+
+_SUBMODULES = [
+    'aio',
+    'algebra',
+    'batch',
+    'belnap',
+    'bochvar',
+    'formula',
+    'fuzzy',
+    'goedel',
+    'indexed',
+    'instrument',
+    'kleene',
+    'lazy',
+    'lukasiewicz',
+    'mdd',
+    'memo',
+    'pandas_ext',
+    'post',
+    'priest',
+    'product',
+    'reductions',
+    'sat',
+    'simplify',
+    'stream',
+    'tvl_operators',
+    'types',
+    'validity',
+    'vectorized',
+]
+""" The modules of the package, which are imported when they are first used.
+"""
+
+_ATTRIBUTES = {
+    'LogicSystem': 'lukasiewicz',
+    'LogicValue': 'lukasiewicz',
+    'LukasiewiczLogicValue': 'lukasiewicz',
+    'PriestLogicValue': 'lukasiewicz',
+    'Formula': 'formula',
+    'Var': 'formula',
+    'Const': 'formula',
+    'Apply': 'formula',
+}
+""" The names exported by the package, and the modules they are defined in.
+"""
+
+__all__ = _SUBMODULES + list(_ATTRIBUTES)
+
+
+def _import(name: str) -> object:
+    """ Imports a module of the package, and returns it.
+    """
+    qualified_name = '{}.{}'.format(__name__, name)
+    __import__(qualified_name)
+    return modules[qualified_name]
+
+
+def __getattr__(name: str) -> object:
+    """ Imports a module (or an attribute of one) the first time it is used,
+    and saves it in the package, so this is only called once per name.
+
+    Raises:
+        AttributeError: If name is not a module or attribute of the package.
+    """
+    if name in _SUBMODULES:
+        value = _import(name)
+    elif name in _ATTRIBUTES:
+        value = getattr(_import(_ATTRIBUTES[name]), name)
+    else:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(
+            __name__, name
+        ))
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,158 @@
+"""
+.. module: aio
+   :synopsis: Asyncio versions of the operators provided by MVL, whose
+   arguments are awaitables (like coroutines which look values up over the
+   network). Each module in this package mirrors the module of the same name
+   in the mvl package.
+
+   The arguments of an operator are awaited concurrently. As soon as the
+   arguments which have arrived decide the result (like «False» for an and
+   operator), the result is returned, and the arguments which are still
+   pending are cancelled.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from asyncio import FIRST_COMPLETED, Future, ensure_future, gather, wait
+from inspect import isawaitable
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Set,
+    Union,
+)
+
+# Imports from the local package.
+from mvl.algebra import left_absorbing, right_absorbing
+from mvl.types import Floatable
+
+
+Operand = Union[Awaitable[Floatable], Floatable]
+""" A type defining an argument of an asyncio operator: either an awaitable
+(such as a coroutine, task or future) which gives a value, or a value.
+"""
+
+
+async def resolve(a: Operand) -> Floatable:
+    """ Returns the value of an operand, awaiting it if it is awaitable.
+
+    Args:
+        a (Operand)
+
+    Returns:
+        Floatable: The value of a.
+    """
+    return await a if isawaitable(a) else a
+
+
+async def unary(op: Callable[[Floatable], float], a: Operand) -> float:
+    """ Applies a unary operator to an operand once it arrives.
+
+    Args:
+        op (Callable[[Floatable], float]): Any unary operator.
+        a (Operand)
+
+    Returns:
+        float: op(a)
+    """
+    return op(await resolve(a))
+
+
+async def binary(
+    op: Callable[[Floatable, Floatable], float],
+    a: Operand,
+    b: Operand,
+) -> float:
+    """ Applies a binary operator to two operands, which are awaited
+    concurrently. If the first of them to arrive decides the result by itself
+    (see mvl.algebra.LEFT_ABSORBING and RIGHT_ABSORBING), the other is
+    cancelled.
+
+    Args:
+        op (Callable[[Floatable, Floatable], float]): Any binary operator.
+        a (Operand)
+        b (Operand)
+
+    Returns:
+        float: op(a, b)
+    """
+    absorbing = [left_absorbing(op), right_absorbing(op)]
+    values: Dict[int, Floatable] = {}
+    tasks: Dict[Future, int] = {}
+    for position, operand in enumerate((a, b)):
+        if isawaitable(operand):
+            tasks[ensure_future(operand)] = position
+        else:
+            values[position] = operand
+
+    pending: Set[Future] = set(tasks)
+    try:
+        while True:
+            for position, value in values.items():
+                result = absorbing[position].get(float(value))
+                if result is not None:
+                    return result
+            if not pending:
+                return op(values[0], values[1])
+            done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+            for task in done:
+                values[tasks[task]] = task.result()
+    finally:
+        await _cancel(pending)
+
+
+async def fold(
+    op: Callable[[Floatable, Floatable], float],
+    operands: Iterable[Operand],
+    identity: Floatable,
+    absorbing: Optional[Floatable] = None,
+) -> float:
+    """ The asyncio version of mvl.reductions.fold. Applies an associative and
+    commutative binary operator to every operand, in the order they arrive.
+
+    If the result becomes equal to the operator's absorbing element, it can not
+    change any more, so it is returned and the operands which are still
+    pending are cancelled.
+
+    Args:
+        op (Callable[[Floatable, Floatable], float]): An associative and
+            commutative binary operator.
+        operands (Iterable[Operand]): The operands to combine.
+        identity (Floatable): The identity element of op, which is returned if
+            there are no operands.
+        absorbing (Optional[Floatable]): The absorbing element of op, if it has
+            one.
+
+    Returns:
+        float: The combination of every operand.
+    """
+    result = float(identity)
+    pending: Set[Future] = set()
+    try:
+        for operand in operands:
+            if isawaitable(operand):
+                pending.add(ensure_future(operand))
+            else:
+                result = op(result, operand)
+        while True:
+            if absorbing is not None and result == absorbing:
+                return float(result)
+            if not pending:
+                return float(result)
+            done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+            for task in done:
+                result = op(result, task.result())
+    finally:
+        await _cancel(pending)
+
+
+async def _cancel(tasks: Set[Future]) -> None:
+    """ Cancels tasks, and waits for them to finish being cancelled.
+    """
+    for task in tasks:
+        task.cancel()
+    await gather(*tasks, return_exceptions=True)
@@ -0,0 +1,82 @@
+"""
+.. module: aio.bochvar
+   :synopsis: Asyncio versions of the logical operators used in bochvar 3
+   valued logic. Because «Unknown» is contagious, each of these operators
+   gives «Unknown» as soon as any of its operands is «Unknown».
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from typing import Iterable
+
+# Imports from the local package.
+from mvl.aio import Operand, binary, fold
+from mvl.aio.tvl_operators import not_, iff
+import mvl.bochvar as bochvar
+
+
+async def and_(a: Operand, b: Operand) -> float:
+    """ The and operator (&) used by Bochvar. See mvl.bochvar.and_.
+
+    Args:
+        a (Operand)
+        b (Operand)
+
+    Returns:
+        float: a & b
+    """
+    return await binary(bochvar.and_, a, b)
+
+
+async def or_(a: Operand, b: Operand) -> float:
+    """ The or operator (|) used by Bochvar. See mvl.bochvar.or_.
+
+    Args:
+        a (Operand)
+        b (Operand)
+
+    Returns:
+        float: a | b
+    """
+    return await binary(bochvar.or_, a, b)
+
+
+async def implies(a: Operand, b: Operand) -> float:
+    """ The implication operator (→) used by Bochvar. See
+    mvl.bochvar.implies.
+
+    Args:
+        a (Operand)
+        b (Operand)
+
+    Returns:
+        float: a → b
+    """
+    return await binary(bochvar.implies, a, b)
+
+
+async def all_(operands: Iterable[Operand]) -> float:
+    """ The and operator used by Bochvar (&), applied to any number of
+    operands. Gives «True» for no operands. See mvl.bochvar.all_.
+
+    Args:
+        operands (Iterable[Operand])
+
+    Returns:
+        float: a & b & ...
+    """
+    return await fold(bochvar.and_, operands, bochvar.t, bochvar.u)
+
+
+async def any_(operands: Iterable[Operand]) -> float:
+    """ The or operator used by Bochvar (|), applied to any number of
+    operands. Gives «False» for no operands. See mvl.bochvar.any_.
+
+    Args:
+        operands (Iterable[Operand])
+
+    Returns:
+        float: a | b | ...
+    """
+    return await fold(bochvar.or_, operands, bochvar.f, bochvar.u)
@@ -0,0 +1,125 @@
+"""
+.. module: aio.tvl_operators
+   :synopsis: Asyncio versions of the logical operators used in kleene and
+   priest 3 valued logic systems.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from typing import Iterable
+
+# Imports from the local package.
+from mvl.aio import Operand, binary, fold, unary
+import mvl.tvl_operators as tvl_operators
+
+
+async def not_(a: Operand) -> float:
+    """ The negation operator (!), applied once a arrives. See
+    mvl.tvl_operators.not_.
+
+    Args:
+        a (Operand)
+
+    Returns:
+        float: ! a
+    """
+    return await unary(tvl_operators.not_, a)
+
+
+async def and_(a: Operand, b: Operand) -> float:
+    """ The and operator (&), which gives «False» as soon as either operand
+    is «False». See mvl.tvl_operators.and_.
+
+    Args:
+        a (Operand)
+        b (Operand)
+
+    Returns:
+        float: a & b
+    """
+    return await binary(tvl_operators.and_, a, b)
+
+
+async def or_(a: Operand, b: Operand) -> float:
+    """ The or operator (|), which gives «True» as soon as either operand is
+    «True». See mvl.tvl_operators.or_.
+
+    Args:
+        a (Operand)
+        b (Operand)
+
+    Returns:
+        float: a | b
+    """
+    return await binary(tvl_operators.or_, a, b)
+
+
+async def implies(a: Operand, b: Operand) -> float:
+    """ The implication operator (→), which gives «True» as soon as a is
+    «False» or b is «True». See mvl.tvl_operators.implies.
+
+    Args:
+        a (Operand)
+        b (Operand)
+
+    Returns:
+        float: a → b
+    """
+    return await binary(tvl_operators.implies, a, b)
+
+
+async def iff(a: Operand, b: Operand) -> float:
+    """ The bicondition operator (↔), which gives «Unknown» as soon as either
+    operand is «Unknown». See mvl.tvl_operators.iff.
+
+    Args:
+        a (Operand)
+        b (Operand)
+
+    Returns:
+        float: a ↔ b
+    """
+    return await binary(tvl_operators.iff, a, b)
+
+
+async def xor(a: Operand, b: Operand) -> float:
+    """ The xor operator, which gives «Unknown» as soon as either operand is
+    «Unknown». See mvl.tvl_operators.xor.
+
+    Args:
+        a (Operand)
+        b (Operand)
+
+    Returns:
+        float: a xor b
+    """
+    return await binary(tvl_operators.xor, a, b)
+
+
+async def all_(operands: Iterable[Operand]) -> float:
+    """ The and operator (&), applied to any number of operands, which gives
+    «False» as soon as any operand is «False». Gives «True» for no operands.
+    See mvl.tvl_operators.all_.
+
+    Args:
+        operands (Iterable[Operand])
+
+    Returns:
+        float: a & b & ...
+    """
+    return await fold(tvl_operators.and_, operands, 1, 0)
+
+
+async def any_(operands: Iterable[Operand]) -> float:
+    """ The or operator (|), applied to any number of operands, which gives
+    «True» as soon as any operand is «True». Gives «False» for no operands.
+    See mvl.tvl_operators.any_.
+
+    Args:
+        operands (Iterable[Operand])
+
+    Returns:
+        float: a | b | ...
+    """
+    return await fold(tvl_operators.or_, operands, 0, 1)
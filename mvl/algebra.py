@@ -0,0 +1,209 @@
+"""
+.. module: algebra
+   :synopsis: Algebraic properties of the operators provided by MVL, which let
+   other modules work out results without evaluating every argument, and
+   simplify formulas.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from typing import Callable, Dict, Optional, Set
+
+# Imports from the local package.
+import mvl.bochvar as bochvar
+import mvl.goedel as goedel
+import mvl.lukasiewicz as lukasiewicz
+import mvl.product as product
+import mvl.tvl_operators as tvl_operators
+
+
+_U: float = float(bochvar.u)
+
+LEFT_ABSORBING: Dict[Callable, Dict[float, float]] = {
+    lukasiewicz.s_and: {0.0: 0.0},
+    lukasiewicz.w_and: {0.0: 0.0},
+    lukasiewicz.s_or: {1.0: 1.0},
+    lukasiewicz.w_or: {1.0: 1.0},
+    lukasiewicz.implies: {0.0: 1.0},
+    goedel.and_: {0.0: 0.0},
+    goedel.or_: {1.0: 1.0},
+    goedel.implies: {0.0: 1.0},
+    product.mult: {0.0: 0.0},
+    product.and_: {0.0: 0.0},
+    product.implies: {0.0: 1.0},
+    tvl_operators.implies: {0.0: 1.0},
+    tvl_operators.iff: {_U: _U},
+    tvl_operators.xor: {_U: _U},
+    bochvar.and_: {_U: _U},
+    bochvar.or_: {_U: _U},
+    bochvar.implies: {_U: _U},
+}
+""" For each binary operator, the values of its first argument which decide its
+result on their own, mapped to that result. For example, goedel.and_(0, b) is 0
+whatever b is, and bochvar.and_(u, b) is u whatever b is.
+"""
+
+RIGHT_ABSORBING: Dict[Callable, Dict[float, float]] = {
+    lukasiewicz.s_and: {0.0: 0.0},
+    lukasiewicz.w_and: {0.0: 0.0},
+    lukasiewicz.s_or: {1.0: 1.0},
+    lukasiewicz.w_or: {1.0: 1.0},
+    lukasiewicz.implies: {1.0: 1.0},
+    goedel.and_: {0.0: 0.0},
+    goedel.or_: {1.0: 1.0},
+    goedel.implies: {1.0: 1.0},
+    product.mult: {0.0: 0.0},
+    product.and_: {0.0: 0.0},
+    product.implies: {1.0: 1.0},
+    tvl_operators.implies: {1.0: 1.0},
+    tvl_operators.iff: {_U: _U},
+    tvl_operators.xor: {_U: _U},
+    bochvar.and_: {_U: _U},
+    bochvar.or_: {_U: _U},
+    bochvar.implies: {_U: _U},
+}
+""" For each binary operator, the values of its second argument which decide
+its result on their own, mapped to that result. For example,
+lukasiewicz.implies(a, 1) is 1 whatever a is.
+"""
+
+LEFT_IDENTITY: Dict[Callable, float] = {
+    lukasiewicz.s_and: 1.0,
+    lukasiewicz.w_and: 1.0,
+    lukasiewicz.s_or: 0.0,
+    lukasiewicz.w_or: 0.0,
+    lukasiewicz.implies: 1.0,
+    lukasiewicz.equivalent: 1.0,
+    goedel.and_: 1.0,
+    goedel.or_: 0.0,
+    goedel.implies: 1.0,
+    product.mult: 1.0,
+    product.and_: 1.0,
+    product.implies: 1.0,
+    tvl_operators.implies: 1.0,
+    tvl_operators.iff: 1.0,
+    tvl_operators.xor: 0.0,
+}
+""" For each binary operator, the value e (if it has one) for which
+op(e, b) == b for every b. For example, lukasiewicz.implies(1, b) is b.
+
+Bochvar's operators are left out: 1 is only their identity on the values of
+the 3 valued system, and bochvar.and_(1, 0.3) is 1.
+"""
+
+RIGHT_IDENTITY: Dict[Callable, float] = {
+    lukasiewicz.s_and: 1.0,
+    lukasiewicz.w_and: 1.0,
+    lukasiewicz.s_or: 0.0,
+    lukasiewicz.w_or: 0.0,
+    lukasiewicz.equivalent: 1.0,
+    goedel.and_: 1.0,
+    goedel.or_: 0.0,
+    product.mult: 1.0,
+    product.and_: 1.0,
+    tvl_operators.iff: 1.0,
+    tvl_operators.xor: 0.0,
+}
+""" For each binary operator, the value e (if it has one) for which
+op(a, e) == a for every a. Implications have no right identity.
+"""
+
+IDEMPOTENT: Set[Callable] = {
+    lukasiewicz.w_and,
+    lukasiewicz.w_or,
+    goedel.and_,
+    goedel.or_,
+    product.and_,
+}
+""" The binary operators for which op(a, a) == a. Lukasiewicz's strong
+operators and product.mult are not idempotent: 0.5 && 0.5 is 0. Nor are
+Bochvar's operators, off the values of the 3 valued system.
+"""
+
+INVOLUTIONS: Set[Callable] = {
+    lukasiewicz.not_,
+}
+""" The unary operators for which op(op(a)) == a. This holds for the negation
+of lukasiewicz logics (which kleene, priest and bochvar also use), but not for
+the negations of goedel and product logics, where !!0.5 is 1, or for post.not_,
+which cycles through every value.
+"""
+
+
+def left_absorbing(op: Callable) -> Dict[float, float]:
+    """ Returns the values of the first argument of op which decide its result,
+    mapped to that result. See LEFT_ABSORBING.
+
+    Operators wrapped by functools.wraps (like memoized or instrumented
+    operators) have the same absorbing elements as the operator they wrap.
+
+    Args:
+        op (Callable): A binary operator.
+
+    Returns:
+        Dict[float, float]: The absorbing elements, or an empty dict if op has
+            none (or is not provided by MVL).
+    """
+    return LEFT_ABSORBING.get(_unwrap(op), {})
+
+
+def right_absorbing(op: Callable) -> Dict[float, float]:
+    """ Returns the values of the second argument of op which decide its
+    result, mapped to that result. See RIGHT_ABSORBING and left_absorbing.
+
+    Args:
+        op (Callable): A binary operator.
+
+    Returns:
+        Dict[float, float]: The absorbing elements, or an empty dict if op has
+            none (or is not provided by MVL).
+    """
+    return RIGHT_ABSORBING.get(_unwrap(op), {})
+
+
+def left_identity(op: Callable) -> Optional[float]:
+    """ Returns the left identity of op. See LEFT_IDENTITY.
+
+    Args:
+        op (Callable): A binary operator.
+
+    Returns:
+        Optional[float]: The identity, or None if op has none (or is not
+            provided by MVL).
+    """
+    return LEFT_IDENTITY.get(_unwrap(op))
+
+
+def right_identity(op: Callable) -> Optional[float]:
+    """ Returns the right identity of op. See RIGHT_IDENTITY.
+
+    Args:
+        op (Callable): A binary operator.
+
+    Returns:
+        Optional[float]: The identity, or None if op has none (or is not
+            provided by MVL).
+    """
+    return RIGHT_IDENTITY.get(_unwrap(op))
+
+
+def is_idempotent(op: Callable) -> bool:
+    """ Returns whether op(a, a) == a for every a. See IDEMPOTENT.
+    """
+    return _unwrap(op) in IDEMPOTENT
+
+
+def is_involution(op: Callable) -> bool:
+    """ Returns whether op(op(a)) == a for every a. See INVOLUTIONS.
+    """
+    return _unwrap(op) in INVOLUTIONS
+
+
+def _unwrap(op: Callable) -> Callable:
+    """ Returns the operator wrapped by op (following functools.wraps), or op
+    itself if it doesn't wrap one.
+    """
+    while hasattr(op, '__wrapped__'):
+        op = op.__wrapped__
+    return op
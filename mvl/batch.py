@@ -0,0 +1,169 @@
+"""
+.. module: batch
+   :synopsis: Evaluates many formulas against many records, sharing the work
+   across a pool of processes.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from os import cpu_count
+from typing import (
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.formula import Formula
+from mvl.types import Floatable
+
+
+Record = Mapping[str, Floatable]
+""" A type defining a single record, mapping the name of each variable to its
+value.
+"""
+
+DEFAULT_CHUNK_SIZE: int = 1024
+""" The number of records sent to a process at once. Smaller chunks balance
+the work between processes better, while larger chunks spend less time sending
+records between processes.
+"""
+
+_Compiled = List[Tuple[Callable[..., float], Tuple[str, ...]]]
+
+_worker_formulas: _Compiled = []
+""" The compiled formulas of the batch a worker process is evaluating. These
+are set once, when the process starts, rather than sent with every chunk.
+"""
+
+
+def evaluate_batch(
+    formulas: Sequence[Formula],
+    records: Iterable[Record],
+    processes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> np.ndarray:
+    """ Evaluates every formula against every record.
+
+    Records are read lazily, and split into chunks of chunk_size records, which
+    are evaluated in a pool of processes. A bounded number of chunks is in
+    flight at once, so idle processes always have a chunk to pick up, and
+    records are not read much faster than they are evaluated. Each process
+    compiles the formulas once (see Formula.compile), and the results of the
+    chunks are collected in order, so the result is exactly the same as
+    calling each formula on each record in turn.
+
+    Args:
+        formulas (Sequence[Formula]): The formulas to evaluate. Their operators
+            must be picklable (so not lambdas) if more than one process is
+            used.
+        records (Iterable[Record]): The records to evaluate the formulas
+            against. Each record must have a value for every variable of every
+            formula. Other fields are ignored.
+        processes (Optional[int]): The number of processes to evaluate chunks
+            of records in. Defaults to the number of CPUs. If this is 1, no
+            processes are started.
+        chunk_size (int): The number of records to evaluate at once.
+
+    Returns:
+        np.ndarray: A float array with a row for each record (in order) and a
+            column for each formula (in order), holding the value of the
+            formula for the record.
+    """
+    formulas = tuple(formulas)
+    if processes is None:
+        processes = cpu_count() or 1
+    chunks = _chunks(records, chunk_size)
+
+    if processes <= 1:
+        compiled = _compile(formulas)
+        results = [_evaluate_chunk(compiled, chunk) for chunk in chunks]
+    else:
+        results = list(_evaluate_in_pool(formulas, chunks, processes))
+
+    if not results:
+        return np.empty((0, len(formulas)))
+    return np.concatenate(results)
+
+
+def _evaluate_in_pool(
+    formulas: Tuple[Formula, ...],
+    chunks: Iterator[List[Record]],
+    processes: int,
+) -> Iterator[np.ndarray]:
+    """ Evaluates chunks of records in a pool of processes, and yields their
+    results in order.
+    """
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        initializer=_initialize_worker,
+        initargs=(formulas,),
+    ) as executor:
+        pending: Deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_evaluate_worker_chunk, chunk))
+            if len(pending) >= 2 * processes:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _chunks(
+    records: Iterable[Record],
+    chunk_size: int,
+) -> Iterator[List[Record]]:
+    """ Splits records into lists of chunk_size records (the last of which may
+    be shorter).
+    """
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _compile(formulas: Tuple[Formula, ...]) -> _Compiled:
+    """ Compiles each formula, keeping the names of its variables.
+    """
+    return [(formula.compile(), formula.variables) for formula in formulas]
+
+
+def _evaluate_chunk(
+    compiled: _Compiled,
+    records: List[Record],
+) -> np.ndarray:
+    """ Evaluates every compiled formula against every record.
+    """
+    results = np.empty((len(records), len(compiled)))
+    for j, (function, variables) in enumerate(compiled):
+        results[:, j] = [
+            function(*[record[name] for name in variables])
+            for record in records
+        ]
+    return results
+
+
+def _initialize_worker(formulas: Tuple[Formula, ...]) -> None:
+    """ Compiles the formulas of a batch when a worker process starts.
+    """
+    global _worker_formulas
+    _worker_formulas = _compile(formulas)
+
+
+def _evaluate_worker_chunk(records: List[Record]) -> np.ndarray:
+    """ Evaluates the formulas of a worker process against a chunk of records.
+    """
+    return _evaluate_chunk(_worker_formulas, records)
@@ -0,0 +1,336 @@
+"""
+.. module: belnap
+   :synopsis: A module for Belnap's 4 valued logic.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from typing import Callable, Dict, Iterable, Tuple
+
+# Imports from the local package.
+from mvl.types import Floatable
+
+
+class BelnapValue:
+    """ A value of Belnap's 4 valued logic, which records what a reasoner has
+    been told about a statement: whether it has been told that the statement is
+    true, and whether it has been told that the statement is false.
+
+    This gives 4 values: «True» (t) and «False» (f), when only one of these
+    has been told; «Neither» (n), when nothing has been told; and «Both» (b),
+    when the statement has been told to be both true and false (for example,
+    by conflicting sources).
+
+    The values are not ordered as numbers in [0, 1] (n and b are incomparable
+    in the truth ordering), so unlike the LogicValues of the other modules they
+    can not be converted into floats. There is only one instance of each value,
+    which is shared by every function in this module.
+
+    Values are designated (and so are «true» as a python bool) iff they have
+    been told to be true, so t and b are designated.
+
+    Attributes:
+        told_true (bool): Whether the statement has been told to be true.
+        told_false (bool): Whether the statement has been told to be false.
+        name (str): The name of the value, used in its representation.
+    """
+    __slots__ = ('told_true', 'told_false', 'name')
+    class_name: str = 'BelnapValue'
+    _instances: Dict[Tuple[bool, bool], 'BelnapValue'] = {}
+
+    def __new__(cls, told_true: bool, told_false: bool) -> 'BelnapValue':
+        """ Returns the value with the given bits.
+
+        Args:
+            told_true (bool): Whether the statement has been told to be true.
+            told_false (bool): Whether the statement has been told to be false.
+
+        Returns:
+            BelnapValue: One of t, f, n and b.
+        """
+        key = (bool(told_true), bool(told_false))
+        value = cls._instances.get(key)
+        if value is None:
+            value = object.__new__(cls)
+            object.__setattr__(value, 'told_true', key[0])
+            object.__setattr__(value, 'told_false', key[1])
+            object.__setattr__(value, 'name', '')
+            cls._instances[key] = value
+        return value
+
+    def __setattr__(self, key: str, value: object) -> None:
+        """ Only allows the name of a value to be changed.
+
+        Raises:
+            AttributeError: If the attribute is not name.
+        """
+        if key != 'name':
+            raise AttributeError(
+                '{} is immutable: can not set {}'.format(self.class_name, key)
+            )
+        object.__setattr__(self, key, value)
+
+    def __reduce__(self) -> Tuple:
+        """ Values are pickled by their bits, so that unpickling them returns
+        the same object.
+        """
+        return (BelnapValue, (self.told_true, self.told_false))
+
+    @property
+    def code(self) -> int:
+        """ The bits of the value as an int: told_true | told_false << 1. This
+        gives n = 0, t = 1, f = 2 and b = 3, and is the index of the value in
+        values.
+        """
+        return self.told_true | self.told_false << 1
+
+    def __bool__(self) -> bool:
+        """ Returns whether the value is designated (has been told to be
+        true).
+        """
+        return self.told_true
+
+    def __repr__(self) -> str:
+        if self.name != '':
+            return '{}.{}'.format(self.class_name, self.name)
+        return '{}({}, {})'.format(
+            self.class_name, self.told_true, self.told_false
+        )
+
+
+n: BelnapValue = BelnapValue(False, False)
+""" The Belnap value «Neither», for statements with no information.
+"""
+
+t: BelnapValue = BelnapValue(True, False)
+""" The Belnap value «True».
+"""
+
+f: BelnapValue = BelnapValue(False, True)
+""" The Belnap value «False».
+"""
+
+b: BelnapValue = BelnapValue(True, True)
+""" The Belnap value «Both», for statements with conflicting information.
+"""
+
+n.name = 'Neither'
+t.name = 'True'
+f.name = 'False'
+b.name = 'Both'
+
+values: Tuple[BelnapValue, ...] = (n, t, f, b)
+""" The 4 Belnap values, in the order of their codes (see BelnapValue.code).
+"""
+
+designated: Tuple[BelnapValue, ...] = (t, b)
+""" The designated Belnap values, which have been told to be true.
+"""
+
+
+def from_tvl(a: Floatable) -> BelnapValue:
+    """ Converts a 3 valued logic value (as used by kleene, priest and
+    bochvar) into a Belnap value. «Unknown» becomes «Neither».
+
+    Args:
+        a (Floatable): One of 0, 0.5 and 1.
+
+    Returns:
+        BelnapValue: f, n or t.
+
+    Raises:
+        ValueError: If a is not 0, 0.5 or 1.
+    """
+    a = float(a)
+    if a == 1:
+        return t
+    if a == 0:
+        return f
+    if a == 0.5:
+        return n
+    raise ValueError('3 valued logic values must be 0, 0.5 or 1')
+
+
+def not_(a: BelnapValue) -> BelnapValue:
+    """ The Belnap «not» operator (!), which swaps what has been told:
+
+    ! t := f, ! f := t, ! n := n, ! b := b
+
+    Args:
+        a (BelnapValue)
+
+    Returns:
+        BelnapValue: ! a
+    """
+    return BelnapValue(a.told_false, a.told_true)
+
+
+def and_(a: BelnapValue, b: BelnapValue) -> BelnapValue:
+    """ The Belnap «and» operator (&), the meet of the truth ordering (in which
+    f < n < t and f < b < t). a & b is told true iff both a and b are, and told
+    false iff either of them is.
+
+    Args:
+        a (BelnapValue)
+        b (BelnapValue)
+
+    Returns:
+        BelnapValue: a & b
+    """
+    return BelnapValue(
+        a.told_true and b.told_true, a.told_false or b.told_false
+    )
+
+
+def or_(a: BelnapValue, b: BelnapValue) -> BelnapValue:
+    """ The Belnap «or» operator (|), the join of the truth ordering. a | b is
+    told true iff either a or b is, and told false iff both of them are.
+
+    Args:
+        a (BelnapValue)
+        b (BelnapValue)
+
+    Returns:
+        BelnapValue: a | b
+    """
+    return BelnapValue(
+        a.told_true or b.told_true, a.told_false and b.told_false
+    )
+
+
+def implies(a: BelnapValue, b: BelnapValue) -> BelnapValue:
+    """ The Belnap «implies» operator (→), defined by:
+
+    a → b := ! a | b
+
+    Args:
+        a (BelnapValue)
+        b (BelnapValue)
+
+    Returns:
+        BelnapValue: a → b
+    """
+    return or_(not_(a), b)
+
+
+def consensus(a: BelnapValue, b: BelnapValue) -> BelnapValue:
+    """ The meet of the knowledge ordering (⊗), in which n < t < b and
+    n < f < b. a ⊗ b holds only what a and b have both been told, so it is
+    the information two sources agree on.
+
+    Args:
+        a (BelnapValue)
+        b (BelnapValue)
+
+    Returns:
+        BelnapValue: a ⊗ b
+    """
+    return BelnapValue(
+        a.told_true and b.told_true, a.told_false and b.told_false
+    )
+
+
+def gullibility(a: BelnapValue, b: BelnapValue) -> BelnapValue:
+    """ The join of the knowledge ordering (⊕). a ⊕ b holds everything either
+    a or b has been told, so it is the result of accepting what both of two
+    sources say: conflicting sources give b, and missing ones add nothing.
+
+    Args:
+        a (BelnapValue)
+        b (BelnapValue)
+
+    Returns:
+        BelnapValue: a ⊕ b
+    """
+    return BelnapValue(
+        a.told_true or b.told_true, a.told_false or b.told_false
+    )
+
+
+def truth_le(a: BelnapValue, b: BelnapValue) -> bool:
+    """ Returns whether a <= b in the truth ordering (where f < n < t and
+    f < b < t, and n and b are incomparable).
+
+    Args:
+        a (BelnapValue)
+        b (BelnapValue)
+
+    Returns:
+        bool
+    """
+    return ((b.told_true or not a.told_true)
+        and (a.told_false or not b.told_false))
+
+
+def knowledge_le(a: BelnapValue, b: BelnapValue) -> bool:
+    """ Returns whether a <= b in the knowledge ordering (where n < t < b and
+    n < f < b, and t and f are incomparable): whether b has been told
+    everything that a has.
+
+    Args:
+        a (BelnapValue)
+        b (BelnapValue)
+
+    Returns:
+        bool
+    """
+    return ((b.told_true or not a.told_true)
+        and (b.told_false or not a.told_false))
+
+
+def _fold(
+    op: Callable[[BelnapValue, BelnapValue], BelnapValue],
+    values: Iterable[BelnapValue],
+    identity: BelnapValue,
+    absorbing: BelnapValue,
+) -> BelnapValue:
+    """ Combines values with op, stopping once the result is absorbing. See
+    mvl.reductions.fold, which works on floats.
+    """
+    result = identity
+    for value in values:
+        result = op(result, value)
+        if result is absorbing:
+            break
+    return result
+
+
+def all_(values: Iterable[BelnapValue]) -> BelnapValue:
+    """ The Belnap «and» (&) of any number of values, stopping as soon as the
+    result is f. Gives t for no values.
+
+    Args:
+        values (Iterable[BelnapValue])
+
+    Returns:
+        BelnapValue: a & b & ...
+    """
+    return _fold(and_, values, t, f)
+
+
+def any_(values: Iterable[BelnapValue]) -> BelnapValue:
+    """ The Belnap «or» (|) of any number of values, stopping as soon as the
+    result is t. Gives f for no values.
+
+    Args:
+        values (Iterable[BelnapValue])
+
+    Returns:
+        BelnapValue: a | b | ...
+    """
+    return _fold(or_, values, f, t)
+
+
+def fuse(values: Iterable[BelnapValue]) -> BelnapValue:
+    """ The knowledge join (⊕) of any number of values, as given by several
+    sources about the same statement, stopping as soon as the result is b.
+    Gives n for no values.
+
+    Args:
+        values (Iterable[BelnapValue])
+
+    Returns:
+        BelnapValue: a ⊕ b ⊕ ...
+    """
+    return _fold(gullibility, values, n, b)
@@ -6,7 +6,10 @@
 """
 
 
+from typing import Iterable
+
 from mvl.lukasiewicz import LogicSystem, LogicValue, LukasiewiczLogicValue
+from mvl.reductions import fold
 from mvl.types import Floatable
 
 
@@ -122,5 +125,31 @@ def implies(a: Floatable, b: Floatable) -> float:
         return float(u)
     return float(bool(b) ** bool(a)) # Equivalent to normal boolean implication.
 
+def all_(values: Iterable[Floatable]) -> float:
+    """ The and operator used by Bochvar (&), applied to any number of values.
+    Because «Unknown» is contagious, this stops as soon as an «Unknown» value
+    is found. Gives «True» for no values.
+
+    Args:
+        values (Iterable[LogicValue])
+
+    Returns:
+        LogicValue: a & b & ...
+    """
+    return fold(and_, values, t, u)
+
+def any_(values: Iterable[Floatable]) -> float:
+    """ The or operator used by Bochvar (|), applied to any number of values.
+    Because «Unknown» is contagious, this stops as soon as an «Unknown» value
+    is found. Gives «False» for no values.
+
+    Args:
+        values (Iterable[LogicValue])
+
+    Returns:
+        LogicValue: a | b | ...
+    """
+    return fold(or_, values, f, u)
+
 ####################################################### End logical operators ##
 
@@ -0,0 +1,371 @@
+"""
+.. module: formula
+   :synopsis: Formulas over named variables, built from the operators provided
+   by MVL, which can be compiled into fast python functions.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from keyword import iskeyword
+from typing import Any, Callable, Dict, List, Mapping, Tuple, Union
+
+# Imports from the local package.
+from mvl.types import Floatable
+import mvl.bochvar as bochvar
+import mvl.goedel as goedel
+import mvl.lukasiewicz as lukasiewicz
+import mvl.product as product
+import mvl.tvl_operators as tvl_operators
+
+
+## Begin formula classes #######################################################
+
+class Formula:
+    """ A formula over named variables. Formulas are immutable, and are equal
+    (and hash the same) iff they have the same structure.
+
+    Formulas are built from Vars, Consts and Applys, for example::
+
+        Apply(kleene.and_, Var('a'), Apply(kleene.not_, Var('b')))
+
+    Calling a formula evaluates it with a compiled function (see
+    Formula.compile), taking the values of its variables as positional
+    arguments (in the order given by Formula.variables) or keyword arguments.
+    """
+
+    def __init__(self, key: Tuple) -> None:
+        self._key: Tuple = key
+        self._hash: int = hash(key)
+        self._compiled: Callable = None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Formula):
+            return NotImplemented
+        return self._key == other._key
+
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    @property
+    def variables(self) -> Tuple[str, ...]:
+        """ The names of the variables in the formula, in the order that they
+        first appear.
+        """
+        names: Dict[str, None] = {}
+        for node in self.nodes():
+            if isinstance(node, Var):
+                names.setdefault(node.name)
+        return tuple(names)
+
+    def nodes(self) -> List['Formula']:
+        """ Returns every distinct subformula of this formula (including
+        itself), ordered so that each subformula comes after its arguments.
+        """
+        seen: Dict['Formula', None] = {}
+        stack: List[Tuple['Formula', bool]] = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node in seen:
+                continue
+            if expanded or not isinstance(node, Apply):
+                seen[node] = None
+                continue
+            stack.append((node, True))
+            for arg in reversed(node.args):
+                stack.append((arg, False))
+        return list(seen)
+
+    def evaluate(self, env: Mapping[str, Floatable]) -> float:
+        """ Evaluates the formula by calling its operators directly. This is
+        slower than calling the formula, but does not need compiling.
+
+        Args:
+            env (Mapping[str, Floatable]): The value of each variable.
+
+        Returns:
+            float: The value of the formula.
+        """
+        results: Dict[Formula, Any] = {}
+        for node in self.nodes():
+            if isinstance(node, Var):
+                results[node] = env[node.name]
+            elif isinstance(node, Const):
+                results[node] = node.value
+            else:
+                results[node] = node.op(*[results[arg] for arg in node.args])
+        return float(results[self])
+
+    def compile(self) -> Callable[..., float]:
+        """ Compiles the formula into a single python function.
+
+        Compound operators which MVL defines in terms of other operators (like
+        tvl_operators.iff) are expanded, the operators provided by MVL are
+        inlined as arithmetic on floats, and every subformula which occurs more
+        than once is only computed once. Each variable is converted into a float
+        only once. Operators which are not provided by MVL (or can not be
+        inlined, like post.not_) are called as normal, with the values of their
+        arguments.
+
+        The compiled function is cached, so compiling a formula a second time
+        is free.
+
+        Returns:
+            Callable[..., float]: A function taking the value of each variable
+                (see Formula.variables), and returning the value of the formula.
+        """
+        if self._compiled is None:
+            source, namespace = _generate(self)
+            exec(source, namespace)
+            self._compiled = namespace[_FUNCTION_NAME]
+        return self._compiled
+
+    def source(self) -> str:
+        """ Returns:
+            str: The python source code of the function returned by
+                Formula.compile.
+        """
+        return _generate(self)[0]
+
+    def __call__(self, *args: Floatable, **kwargs: Floatable) -> float:
+        return self.compile()(*args, **kwargs)
+
+
+class Var(Formula):
+    """ A variable in a formula.
+
+    Attributes:
+        name (str): The name of the variable. This must be a valid python
+            identifier.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Raises:
+            ValueError: If name can not be used as a variable name.
+        """
+        if (not name.isidentifier() or iskeyword(name)
+                or name.startswith(_RESERVED_PREFIX)):
+            raise ValueError('{!r} can not be used as a variable name'.format(
+                name
+            ))
+        self.name: str = name
+        super().__init__(('var', name))
+
+    def __reduce__(self) -> Tuple:
+        return (Var, (self.name,))
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+class Const(Formula):
+    """ A constant in a formula.
+
+    Attributes:
+        value (Floatable): The value of the constant. This is usually a
+            LogicValue or a float. Constants are only equal if their values
+            are equal and are LogicValues of the same class (or both plain
+            numbers), as some operators (like those of post) depend on the
+            class of their arguments.
+    """
+
+    def __init__(self, value: Floatable) -> None:
+        self.value: Floatable = value
+        cls = type(value) if isinstance(value, lukasiewicz.LogicValue) else float
+        super().__init__(('const', cls, float(value)))
+
+    def __reduce__(self) -> Tuple:
+        return (Const, (self.value,))
+
+    def __repr__(self) -> str:
+        return repr(self.value)
+
+
+class Apply(Formula):
+    """ An operator applied to some formulas.
+
+    Attributes:
+        op (Callable): The operator. This is usually one of the operators
+            provided by MVL, but can be any function of floats or LogicValues.
+            Operators which wrap another (following functools.wraps, like
+            those of mvl.instrument) are replaced by the operator they wrap.
+        args (Tuple[Formula, ...]): The arguments of the operator. Arguments
+            which are not formulas are wrapped in a Const.
+    """
+
+    def __init__(self, op: Callable, *args: Union[Formula, Floatable]) -> None:
+        while hasattr(op, '__wrapped__'):
+            op = op.__wrapped__
+        self.op: Callable = op
+        self.args: Tuple[Formula, ...] = tuple(
+            arg if isinstance(arg, Formula) else Const(arg) for arg in args
+        )
+        super().__init__(('apply', self.op, self.args))
+
+    def __reduce__(self) -> Tuple:
+        return (Apply, (self.op,) + self.args)
+
+    def __repr__(self) -> str:
+        return '{}({})'.format(
+            getattr(self.op, '__name__', repr(self.op)),
+            ', '.join(repr(arg) for arg in self.args),
+        )
+
+####################################################### End formula classes ##
+## Begin compilation ###########################################################
+
+_RESERVED_PREFIX: str = '_mvl_'
+_FUNCTION_NAME: str = _RESERVED_PREFIX + 'formula'
+
+_U: str = repr(float(bochvar.u))
+
+_BUILTINS: Dict[str, Callable] = {
+    _RESERVED_PREFIX + builtin.__name__: builtin
+    for builtin in [abs, bool, float, max, min]
+}
+""" The builtins used by compiled formulas, under reserved names, so that
+variables with the same names (like max) do not shadow them.
+"""
+
+INLINE: Dict[Callable, str] = {
+    lukasiewicz.s_and: '_mvl_max(0, {0} + {1} - 1)',
+    lukasiewicz.w_and: '_mvl_min({0}, {1})',
+    lukasiewicz.s_or: '_mvl_min(1, {0} + {1})',
+    lukasiewicz.w_or: '_mvl_max({0}, {1})',
+    lukasiewicz.not_: '1 - {0}',
+    lukasiewicz.implies: '_mvl_min(1, 1 - {0} + {1})',
+    lukasiewicz.equivalent: '(1 - _mvl_abs({0} - {1}))',
+    goedel.and_: '_mvl_min({0}, {1})',
+    goedel.or_: '_mvl_max({0}, {1})',
+    goedel.not_: '_mvl_float({0} == 0)',
+    goedel.implies: '({1} if {0} > {1} else 1)',
+    product.mult: '{0} * {1}',
+    product.implies: '({1} / {0} if {0} > {1} else 1)',
+    product.not_: '_mvl_float({0} == 0)',
+    bochvar.and_: ('(' + _U + ' if {0} == ' + _U + ' or {1} == ' + _U
+        + ' else _mvl_float(_mvl_bool({0}) and _mvl_bool({1})))'),
+    bochvar.or_: ('(' + _U + ' if {0} == ' + _U + ' or {1} == ' + _U
+        + ' else _mvl_float(_mvl_bool({0}) or _mvl_bool({1})))'),
+    bochvar.implies: ('(' + _U + ' if {0} == ' + _U + ' or {1} == ' + _U
+        + ' else _mvl_float(_mvl_bool({1}) ** _mvl_bool({0})))'),
+}
+""" The python expressions which the operators provided by MVL are compiled
+into. {0} and {1} stand for the (float) values of the first and second
+arguments, and builtins are called by their names in _BUILTINS. Each
+expression computes exactly what the operator itself computes.
+"""
+
+DEFINITIONS: Dict[Callable, Callable[..., Formula]] = {
+    tvl_operators.implies: lambda a, b: Apply(
+        tvl_operators.or_, Apply(tvl_operators.not_, a), b
+    ),
+    tvl_operators.iff: lambda a, b: Apply(
+        tvl_operators.and_,
+        Apply(tvl_operators.implies, a, b),
+        Apply(tvl_operators.implies, b, a),
+    ),
+    tvl_operators.xor: lambda a, b: Apply(
+        tvl_operators.not_, Apply(tvl_operators.iff, a, b)
+    ),
+    product.and_: lambda a, b: Apply(
+        product.mult, a, Apply(product.implies, a, b)
+    ),
+}
+""" The compound operators provided by MVL, defined (exactly as they are
+implemented) in terms of other operators. These are expanded before a formula is
+compiled, so that their shared subformulas are only computed once.
+"""
+
+
+def expand(formula: Formula) -> Formula:
+    """ Expands every compound operator in formula into the operators it is
+    defined by. See DEFINITIONS.
+
+    Args:
+        formula (Formula)
+
+    Returns:
+        Formula: An equivalent formula, which only uses operators that are not
+            in DEFINITIONS.
+    """
+    expanded: Dict[Formula, Formula] = {}
+    for node in formula.nodes():
+        if not isinstance(node, Apply):
+            expanded[node] = node
+            continue
+        args = [expanded[arg] for arg in node.args]
+        if node.op in DEFINITIONS:
+            expanded[node] = expand(DEFINITIONS[node.op](*args))
+        else:
+            expanded[node] = Apply(node.op, *args)
+    return expanded[formula]
+
+
+def _generate(formula: Formula) -> Tuple[str, Dict[str, Any]]:
+    """ Generates the source code of the compiled version of formula, and the
+    namespace it needs to be executed in.
+    """
+    expanded = expand(formula)
+    nodes = expanded.nodes()
+    namespace: Dict[str, Any] = dict(_BUILTINS)
+
+    # Find which variables are used by inlined operators, and so need to be
+    # converted into floats, and which are passed straight to other operators.
+    float_vars: Dict[str, None] = {}
+    for node in nodes:
+        if isinstance(node, Apply) and node.op in INLINE:
+            for arg in node.args:
+                if isinstance(arg, Var):
+                    float_vars.setdefault(arg.name)
+    if isinstance(expanded, Var):
+        float_vars.setdefault(expanded.name)
+
+    floats: Dict[Formula, str] = {} # Float expressions for each node.
+    raws: Dict[Formula, str] = {} # Unconverted expressions for each node.
+    lines: List[str] = []
+
+    for i, name in enumerate(float_vars):
+        local = '{}v{}'.format(_RESERVED_PREFIX, i)
+        lines.append('{} = {}float({})'.format(local, _RESERVED_PREFIX, name))
+        floats[Var(name)] = local
+
+    for i, node in enumerate(nodes):
+        if isinstance(node, Var):
+            raws[node] = node.name
+        elif isinstance(node, Const):
+            raw = '{}c{}'.format(_RESERVED_PREFIX, i)
+            namespace[raw] = node.value
+            raws[node] = raw
+            floats[node] = repr(float(node.value))
+        else:
+            local = '{}t{}'.format(_RESERVED_PREFIX, i)
+            if node.op in INLINE:
+                expression = INLINE[node.op].format(
+                    *[floats[arg] for arg in node.args]
+                )
+            else:
+                op = '{}op{}'.format(_RESERVED_PREFIX, i)
+                namespace[op] = node.op
+                expression = '{}({})'.format(
+                    op, ', '.join(raws[arg] for arg in node.args)
+                )
+            lines.append('{} = {}'.format(local, expression))
+            floats[node] = raws[node] = local
+
+    result = floats[expanded]
+    if not isinstance(expanded, Var):
+        result = '{}float({})'.format(_RESERVED_PREFIX, result)
+    lines.append('return {}'.format(result))
+
+    source = 'def {}({}):\n{}\n'.format(
+        _FUNCTION_NAME,
+        ', '.join(formula.variables),
+        '\n'.join('    ' + line for line in lines),
+    )
+    return source, namespace
+
+########################################################### End compilation ##
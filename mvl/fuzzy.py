@@ -0,0 +1,495 @@
+"""
+.. module: fuzzy
+   :synopsis: Mamdani and Sugeno style fuzzy inference, which evaluates a rule
+   base over whole arrays of input samples at once, using the t-norms and
+   other operators provided by MVL.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.vectorized import ArrayLike
+from mvl.vectorized.formula import operator_for
+import mvl.goedel as goedel
+import mvl.product as product
+
+
+## Begin membership functions ##################################################
+
+class Trapezoidal:
+    """ A trapezoidal membership function, which rises linearly from 0 at a to
+    1 at b, stays at 1 until c, and falls linearly to 0 at d.
+
+    a may equal b (or be -inf), and c may equal d (or be inf), to give a
+    shoulder which stays at 1 beyond the end of the range.
+
+    Attributes:
+        a (float)
+        b (float)
+        c (float)
+        d (float)
+    """
+
+    def __init__(self, a: float, b: float, c: float, d: float) -> None:
+        """
+        Raises:
+            ValueError: If a <= b <= c <= d does not hold.
+        """
+        if not a <= b <= c <= d:
+            raise ValueError('a <= b <= c <= d must hold, not {}'.format(
+                (a, b, c, d)
+            ))
+        self.a: float = a
+        self.b: float = b
+        self.c: float = c
+        self.d: float = d
+
+    def __call__(self, x: ArrayLike) -> np.ndarray:
+        """ Returns the degree of membership of each element of x.
+        """
+        x = np.asarray(x, dtype=float)
+        # An infinite a (or d) gives a rise (or fall) which never starts, so
+        # the degree stays at 1 rather than dividing inf by inf.
+        if np.isinf(self.a):
+            rise = np.ones_like(x)
+        elif self.b > self.a:
+            rise = (x - self.a) / (self.b - self.a)
+        else:
+            rise = np.where(x >= self.a, 1.0, 0.0)
+        if np.isinf(self.d):
+            fall = np.ones_like(x)
+        elif self.d > self.c:
+            fall = (self.d - x) / (self.d - self.c)
+        else:
+            fall = np.where(x <= self.d, 1.0, 0.0)
+        return np.clip(np.minimum(rise, fall), 0.0, 1.0)
+
+    def __repr__(self) -> str:
+        return '{}({}, {}, {}, {})'.format(
+            type(self).__name__, self.a, self.b, self.c, self.d
+        )
+
+
+class Triangular(Trapezoidal):
+    """ A triangular membership function, which rises linearly from 0 at a to 1
+    at b, and falls linearly to 0 at c.
+    """
+
+    def __init__(self, a: float, b: float, c: float) -> None:
+        super().__init__(a, b, b, c)
+
+    def __repr__(self) -> str:
+        return 'Triangular({}, {}, {})'.format(self.a, self.b, self.d)
+
+
+class Gaussian:
+    """ A gaussian membership function, which is 1 at mean.
+
+    Attributes:
+        mean (float)
+        sigma (float): The standard deviation.
+    """
+
+    def __init__(self, mean: float, sigma: float) -> None:
+        """
+        Raises:
+            ValueError: If sigma is not positive.
+        """
+        if not sigma > 0:
+            raise ValueError('sigma must be positive, not {}'.format(sigma))
+        self.mean: float = mean
+        self.sigma: float = sigma
+
+    def __call__(self, x: ArrayLike) -> np.ndarray:
+        """ Returns the degree of membership of each element of x.
+        """
+        z = (np.asarray(x, dtype=float) - self.mean) / self.sigma
+        return np.exp(-0.5 * z * z)
+
+    def __repr__(self) -> str:
+        return 'Gaussian({}, {})'.format(self.mean, self.sigma)
+
+
+MembershipFunction = Callable[[np.ndarray], np.ndarray]
+""" A type defining a function from an array of crisp values to an array of
+their degrees of membership of a fuzzy set.
+"""
+
+################################################## End membership functions ##
+## Begin rule bases ############################################################
+
+class Variable:
+    """ A linguistic variable, like temperature, and the fuzzy sets (terms) its
+    values can belong to, like cold and hot.
+
+    Attributes:
+        name (str): The name of the variable.
+        terms (Dict[str, MembershipFunction]): The membership function of each
+            term.
+        universe (Optional[np.ndarray]): The crisp values the variable can
+            take, sampled finely enough to defuzzify over. This is only needed
+            for the outputs of Mamdani systems.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        terms: Mapping[str, MembershipFunction],
+        universe: Optional[ArrayLike] = None,
+    ) -> None:
+        self.name: str = name
+        self.terms: Dict[str, MembershipFunction] = dict(terms)
+        self.universe: Optional[np.ndarray] = (
+            None if universe is None else np.asarray(universe, dtype=float)
+        )
+
+    def __repr__(self) -> str:
+        return 'Variable({!r}, {})'.format(self.name, list(self.terms))
+
+
+class Linear:
+    """ The output of a rule of a Sugeno system: a linear function of the
+    inputs, constant + Σ coefficient * input.
+
+    Attributes:
+        constant (float)
+        coefficients (Dict[str, float]): The coefficient of each input.
+    """
+
+    def __init__(
+        self,
+        constant: float = 0.0,
+        coefficients: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        self.constant: float = constant
+        self.coefficients: Dict[str, float] = dict(coefficients or {})
+
+    def __call__(self, inputs: Mapping[str, np.ndarray]) -> np.ndarray:
+        """ Returns the value of the function for each sample of inputs.
+        """
+        result = self.constant
+        for name, coefficient in self.coefficients.items():
+            result = result + coefficient * inputs[name]
+        return result
+
+    def __repr__(self) -> str:
+        return 'Linear({}, {})'.format(self.constant, self.coefficients)
+
+
+class Rule:
+    """ A fuzzy rule: if every input in antecedent has its term, then every
+    output in consequent has its term (or, in Sugeno systems, its value).
+
+    Attributes:
+        antecedent (Dict[str, str]): The term of each input variable.
+        consequent (Dict[str, Union[str, float, Linear]]): The term of each
+            output variable (for Mamdani systems), or its value (a constant,
+            or a Linear function of the inputs, for Sugeno systems).
+        weight (float): How much the rule counts, from 0 to 1. The firing
+            strength of the rule is multiplied by this.
+    """
+
+    def __init__(
+        self,
+        antecedent: Mapping[str, str],
+        consequent: Mapping[str, Union[str, float, Linear]],
+        weight: float = 1.0,
+    ) -> None:
+        self.antecedent: Dict[str, str] = dict(antecedent)
+        self.consequent: Dict[str, Union[str, float, Linear]] = dict(consequent)
+        self.weight: float = weight
+
+    def __repr__(self) -> str:
+        return 'Rule({}, {}, weight={})'.format(
+            self.antecedent, self.consequent, self.weight
+        )
+
+
+class _RuleBase:
+    """ The parts shared by Mamdani and Sugeno systems: validating the rule
+    base, and computing the firing strength of each rule.
+    """
+
+    def __init__(
+        self,
+        inputs: Sequence[Variable],
+        rules: Sequence[Rule],
+        and_: Callable,
+    ) -> None:
+        self.inputs: Dict[str, Variable] = {v.name: v for v in inputs}
+        self.rules: List[Rule] = list(rules)
+        self.and_: Callable = and_
+        self._and: Callable = operator_for(and_)
+
+        for rule in self.rules:
+            for name, term in rule.antecedent.items():
+                _check_term(self.inputs, name, term)
+
+    def firing_strengths(
+        self,
+        inputs: Mapping[str, ArrayLike],
+    ) -> np.ndarray:
+        """ Returns the firing strength of each rule for each sample.
+
+        The membership of each term used by a rule is computed once per call,
+        and the terms of each antecedent are combined with and_.
+
+        Args:
+            inputs (Mapping[str, ArrayLike]): The crisp samples of each input
+                variable. These are broadcast against each other.
+
+        Returns:
+            np.ndarray: An array of firing strengths, with a row for each rule
+                and a column for each sample.
+        """
+        samples = {
+            name: np.asarray(inputs[name], dtype=float) for name in self.inputs
+        }
+        shape = np.broadcast(*samples.values()).shape if samples else ()
+        memberships: Dict[Tuple[str, str], np.ndarray] = {}
+
+        strengths = np.empty((len(self.rules),) + shape)
+        for i, rule in enumerate(self.rules):
+            strength = np.ones(shape)
+            for name, term in rule.antecedent.items():
+                key = (name, term)
+                if key not in memberships:
+                    memberships[key] = self.inputs[name].terms[term](
+                        samples[name]
+                    )
+                strength = self._and(strength, memberships[key])
+            strengths[i] = strength * rule.weight
+        return strengths
+
+
+class Mamdani(_RuleBase):
+    """ A Mamdani fuzzy inference system.
+
+    Each rule's firing strength (its antecedent terms combined with and_) is
+    combined with the fuzzy set of each of its consequent terms using
+    implication. The resulting fuzzy sets of every rule are combined with
+    aggregation, and then defuzzified by taking their centroid. Every step is
+    evaluated over every sample at once, using the array versions of the
+    operators (see mvl.vectorized.formula.operator_for).
+
+    For example, the classic min-max system uses goedel.and_ (the minimum) for
+    and_ and implication, and goedel.or_ (the maximum) for aggregation, while
+    product.mult for implication scales the output sets instead of clipping
+    them.
+
+    Attributes:
+        inputs (Dict[str, Variable]): The input variables, by name.
+        outputs (Dict[str, Variable]): The output variables, by name. Each must
+            have a universe.
+        rules (List[Rule]): The rule base.
+        and_ (Callable): The t-norm used to combine the terms of antecedents.
+        implication (Callable): The operator used to combine firing strengths
+            with consequent terms.
+        aggregation (Callable): The operator used to combine the outputs of the
+            rules.
+    """
+
+    def __init__(
+        self,
+        inputs: Sequence[Variable],
+        outputs: Sequence[Variable],
+        rules: Sequence[Rule],
+        and_: Callable = goedel.and_,
+        implication: Callable = goedel.and_,
+        aggregation: Callable = goedel.or_,
+    ) -> None:
+        """
+        Raises:
+            ValueError: If a rule uses a variable or term which does not exist,
+                or an output does not have a universe.
+        """
+        super().__init__(inputs, rules, and_)
+        self.outputs: Dict[str, Variable] = {v.name: v for v in outputs}
+        self.implication: Callable = implication
+        self.aggregation: Callable = aggregation
+        self._implication: Callable = operator_for(implication)
+        self._aggregation: Callable = operator_for(aggregation)
+
+        for output in self.outputs.values():
+            if output.universe is None:
+                raise ValueError('The output {!r} needs a universe'.format(
+                    output.name
+                ))
+        # The membership of every output term over its universe, which is the
+        # same for every call.
+        self._consequents: Dict[str, List[Tuple[int, np.ndarray]]] = {
+            name: [] for name in self.outputs
+        }
+        for i, rule in enumerate(self.rules):
+            for name, term in rule.consequent.items():
+                _check_term(self.outputs, name, term)
+                output = self.outputs[name]
+                self._consequents[name].append(
+                    (i, output.terms[term](output.universe))
+                )
+
+    def aggregate(
+        self,
+        inputs: Mapping[str, ArrayLike],
+    ) -> Dict[str, np.ndarray]:
+        """ Returns the aggregated (not yet defuzzified) fuzzy set of each output
+        for each sample.
+
+        Args:
+            inputs (Mapping[str, ArrayLike]): The crisp samples of each input
+                variable. These are broadcast against each other.
+
+        Returns:
+            Dict[str, np.ndarray]: For each output, the degree of membership of
+                each point of its universe (the last axis) for each sample.
+        """
+        strengths = self.firing_strengths(inputs)
+        shape = strengths.shape[1:]
+        results = {}
+        for name, consequents in self._consequents.items():
+            universe = self.outputs[name].universe
+            aggregated = np.zeros(shape + universe.shape)
+            for i, membership in consequents:
+                implied = self._implication(
+                    strengths[i][..., np.newaxis], membership
+                )
+                aggregated = self._aggregation(aggregated, implied)
+            results[name] = aggregated
+        return results
+
+    def __call__(
+        self,
+        inputs: Mapping[str, ArrayLike],
+    ) -> Dict[str, np.ndarray]:
+        """ Evaluates the system, and defuzzifies each output by its centroid.
+
+        Args:
+            inputs (Mapping[str, ArrayLike]): The crisp samples of each input
+                variable. These are broadcast against each other.
+
+        Returns:
+            Dict[str, np.ndarray]: The crisp value of each output for each
+                sample. Samples for which no rule fires are NaN.
+        """
+        return {
+            name: centroid(self.outputs[name].universe, aggregated)
+            for name, aggregated in self.aggregate(inputs).items()
+        }
+
+
+class Sugeno(_RuleBase):
+    """ A Sugeno (Takagi-Sugeno-Kang) fuzzy inference system.
+
+    Each rule gives every output in its consequent a crisp value: a constant
+    (zero order), or a Linear function of the inputs (first order). The value
+    of an output is the average of these values, weighted by the firing
+    strength of each rule (its antecedent terms combined with and_). Every step
+    is evaluated over every sample at once.
+
+    Attributes:
+        inputs (Dict[str, Variable]): The input variables, by name.
+        outputs (List[str]): The names of the outputs.
+        rules (List[Rule]): The rule base.
+        and_ (Callable): The t-norm used to combine the terms of antecedents.
+    """
+
+    def __init__(
+        self,
+        inputs: Sequence[Variable],
+        rules: Sequence[Rule],
+        and_: Callable = product.mult,
+    ) -> None:
+        """
+        Raises:
+            ValueError: If a rule uses a variable or term which does not exist.
+        """
+        super().__init__(inputs, rules, and_)
+        self.outputs: List[str] = list(dict.fromkeys(
+            name for rule in self.rules for name in rule.consequent
+        ))
+
+    def __call__(
+        self,
+        inputs: Mapping[str, ArrayLike],
+    ) -> Dict[str, np.ndarray]:
+        """ Evaluates the system.
+
+        Args:
+            inputs (Mapping[str, ArrayLike]): The crisp samples of each input
+                variable. These are broadcast against each other.
+
+        Returns:
+            Dict[str, np.ndarray]: The crisp value of each output for each
+                sample. Samples for which no rule fires are NaN.
+        """
+        strengths = self.firing_strengths(inputs)
+        samples = {
+            name: np.asarray(inputs[name], dtype=float) for name in self.inputs
+        }
+        results = {}
+        for name in self.outputs:
+            total = np.zeros(strengths.shape[1:])
+            weights = np.zeros(strengths.shape[1:])
+            for i, rule in enumerate(self.rules):
+                if name not in rule.consequent:
+                    continue
+                value = rule.consequent[name]
+                if isinstance(value, Linear):
+                    value = value(samples)
+                total = total + strengths[i] * value
+                weights = weights + strengths[i]
+            results[name] = _divide(total, weights)
+        return results
+
+
+def centroid(universe: np.ndarray, membership: np.ndarray) -> np.ndarray:
+    """ Defuzzifies fuzzy sets over a universe by taking their centroids.
+
+    Args:
+        universe (np.ndarray): The points of the universe.
+        membership (np.ndarray): The degree of membership of each point (the
+            last axis) of each fuzzy set.
+
+    Returns:
+        np.ndarray: The centroid of each fuzzy set, or NaN for empty sets.
+    """
+    return _divide(membership @ universe, membership.sum(axis=-1))
+
+
+def _divide(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """ Returns a / b, with NaN wherever b is 0.
+    """
+    a, b = np.broadcast_arrays(a, b)
+    return np.divide(a, b, out=np.full(a.shape, np.nan), where=b != 0)
+
+
+def _check_term(
+    variables: Mapping[str, Variable],
+    name: str,
+    term: object,
+) -> None:
+    """ Checks that variables has a variable called name, with the given term.
+
+    Raises:
+        ValueError: If it doesn't.
+    """
+    if name not in variables:
+        raise ValueError('There is no variable called {!r}'.format(name))
+    if term not in variables[name].terms:
+        raise ValueError('{!r} has no term {!r}'.format(name, term))
+
+########################################################### End rule bases ##
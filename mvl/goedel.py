@@ -5,7 +5,11 @@
 .. moduleauthor: Andrew J. Young
 """
 
+# Imports from third party packages.
+from typing import Iterable
+
 # Imports from the local package.
+from mvl.reductions import fold
 from mvl.types import Floatable
 from mvl.lukasiewicz import (
     LogicValue,
@@ -87,3 +91,28 @@ def implies(a: Floatable, b: Floatable) -> float:
         return b
     return 1
 
+
+def all_(values: Iterable[Floatable]) -> float:
+    """ Goedel's «and» (&) of any number of values (their minimum), stopping as
+    soon as the result is 0. Gives 1 for no values.
+
+    Args:
+        values (Iterable[LogicValue])
+
+    Returns:
+        LogicValue: a & b & ...
+    """
+    return fold(and_, values, 1, 0)
+
+
+def any_(values: Iterable[Floatable]) -> float:
+    """ Goedel's «or» (|) of any number of values (their maximum), stopping as
+    soon as the result is 1. Gives 0 for no values.
+
+    Args:
+        values (Iterable[LogicValue])
+
+    Returns:
+        LogicValue: a | b | ...
+    """
+    return fold(or_, values, 0, 1)
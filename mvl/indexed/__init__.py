@@ -0,0 +1,98 @@
+"""
+.. module: indexed
+   :synopsis: Versions of the operators of finite valued logics which work on
+   the indices of logic values, rather than on their truth degrees. Each module
+   in this package mirrors the module of the same name in the mvl package.
+
+   In a logic system with m + 1 values, the value with index i has the truth
+   degree i / m. Operators on indices compute on integers between 0 and m, so
+   their results are exact (whereas, for example, 0.7 - 0.1 != 0.6), and they
+   work on compact uint8 or uint16 arrays, as returned by LogicSystem.quantize.
+   Every operator is written so that no intermediate result leaves the range
+   [0, m], so unsigned arrays never overflow. Indices outside this range give
+   undefined results.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from importlib import import_module
+from typing import Callable, Dict, Sequence, Tuple, Union
+
+import numpy as np
+
+
+IndexLike = Union[np.ndarray, Sequence[int], int]
+""" A type defining all objects which can be converted into an array of value
+indices.
+"""
+
+
+def as_indices(a: IndexLike) -> np.ndarray:
+    """ Converts a into an array of value indices, keeping its integer type.
+
+    Args:
+        a (IndexLike): The indices to convert.
+
+    Returns:
+        np.ndarray: The indices.
+
+    Raises:
+        TypeError: If a does not hold integers.
+    """
+    a = np.asarray(a)
+    if a.size == 0: # An empty list is an array of floats.
+        return a.astype(np.int64)
+    if a.dtype.kind not in 'ui':
+        raise TypeError('Indices must be integers, not {}'.format(a.dtype))
+    return a
+
+
+_MODULES: Dict[str, str] = {
+    'mvl.lukasiewicz': 'mvl.indexed.lukasiewicz',
+    'mvl.goedel': 'mvl.indexed.goedel',
+    'mvl.post': 'mvl.indexed.post',
+    'mvl.tvl_operators': 'mvl.indexed.tvl_operators',
+    'mvl.bochvar': 'mvl.indexed.bochvar',
+}
+
+# Operators which are mapped onto an operator of a different module. Only
+# product.not_ is closed over finite systems, so it is the only operator of
+# product logic here.
+_ALIASES: Dict[Tuple[str, str], Tuple[str, str]] = {
+    ('mvl.product', 'not_'): ('mvl.indexed.goedel', 'not_'),
+}
+
+
+def operator_for(op: Callable) -> Callable:
+    """ Returns the index version of an operator of a finite valued logic.
+
+    Operators are mapped onto the operator of the same name in the mirroring
+    module of mvl.indexed (so mvl.goedel.and_ is mapped onto
+    mvl.indexed.goedel.and_). product.not_ is mapped onto goedel's, which it
+    is equal to. The other operators of product logic are not closed over
+    finite systems (1/2 * 1/2 is not a value of a 3 valued system), and so do
+    not have index versions.
+
+    Args:
+        op (Callable): An operator provided by MVL.
+
+    Returns:
+        Callable: A function taking the indices of op's arguments, followed by
+            the max_index of the logic system (its number of values, minus 1).
+
+    Raises:
+        ValueError: If op does not have an index version.
+    """
+    module_name = getattr(op, '__module__', None)
+    name = getattr(op, '__name__', None)
+    alias = _ALIASES.get((module_name, name))
+    if alias is not None:
+        module_name, name = alias
+    else:
+        module_name = _MODULES.get(module_name)
+    if module_name is not None:
+        indexed_op = getattr(import_module(module_name), name, None)
+        if indexed_op is not None:
+            return indexed_op
+    raise ValueError('{!r} does not have an index version'.format(op))
@@ -0,0 +1,172 @@
+"""
+.. module: indexed.bochvar
+   :synopsis: Index versions of the logical operators used in bochvar 3 valued
+   logic, where f, u and t have the indices 0, 1 and 2.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from typing import Optional
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.indexed import IndexLike, as_indices
+from mvl.indexed.tvl_operators import MAX_INDEX, not_, iff
+
+
+_U: int = 1
+
+
+def _check(max_index: int) -> None:
+    """ Raises a ValueError unless max_index is that of a 3 valued system, as
+    Bochvar's operators are only defined on f, u and t.
+    """
+    if max_index != MAX_INDEX:
+        raise ValueError('Bochvar operators need a 3 valued logic system, not '
+            'one with {} values'.format(max_index + 1))
+
+
+def _known(
+    a: np.ndarray,
+    b: np.ndarray,
+    result: np.ndarray,
+) -> np.ndarray:
+    """ Returns the index of t wherever result is True, and of f wherever it
+    is False, unless either a or b is «Unknown», where it returns u.
+    """
+    dtype = np.result_type(a, b)
+    return np.where(
+        (a == _U) | (b == _U), _U, np.where(result, MAX_INDEX, 0)
+    ).astype(dtype)
+
+
+def and_(a: IndexLike, b: IndexLike, max_index: int = MAX_INDEX) -> np.ndarray:
+    """ The and operator (&) used by Bochvar, on value indices. See
+    mvl.bochvar.and_.
+
+    Args:
+        a (IndexLike)
+        b (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+            This must be 2.
+
+    Returns:
+        np.ndarray: a & b
+
+    Raises:
+        ValueError: If max_index is not 2.
+    """
+    _check(max_index)
+    a = as_indices(a)
+    b = as_indices(b)
+    return _known(a, b, (a != 0) & (b != 0))
+
+
+def or_(a: IndexLike, b: IndexLike, max_index: int = MAX_INDEX) -> np.ndarray:
+    """ The or operator (|) used by Bochvar, on value indices. See
+    mvl.bochvar.or_.
+
+    Args:
+        a (IndexLike)
+        b (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+            This must be 2.
+
+    Returns:
+        np.ndarray: a | b
+
+    Raises:
+        ValueError: If max_index is not 2.
+    """
+    _check(max_index)
+    a = as_indices(a)
+    b = as_indices(b)
+    return _known(a, b, (a != 0) | (b != 0))
+
+
+def implies(
+    a: IndexLike,
+    b: IndexLike,
+    max_index: int = MAX_INDEX,
+) -> np.ndarray:
+    """ The implication operator (→) used by Bochvar, on value indices. See
+    mvl.bochvar.implies.
+
+    Args:
+        a (IndexLike)
+        b (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+            This must be 2.
+
+    Returns:
+        np.ndarray: a → b
+
+    Raises:
+        ValueError: If max_index is not 2.
+    """
+    _check(max_index)
+    a = as_indices(a)
+    b = as_indices(b)
+    return _known(a, b, (a == 0) | (b != 0))
+
+
+def all_(
+    a: IndexLike,
+    max_index: int = MAX_INDEX,
+    axis: Optional[int] = None,
+) -> np.ndarray:
+    """ The and operator used by Bochvar (&), applied to every value index
+    along an axis. See mvl.bochvar.all_.
+
+    Args:
+        a (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+            This must be 2.
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a & b & ...
+
+    Raises:
+        ValueError: If max_index is not 2.
+    """
+    _check(max_index)
+    a = as_indices(a)
+    return np.where(
+        np.any(a == _U, axis=axis),
+        _U,
+        np.where(np.all(a != 0, axis=axis), MAX_INDEX, 0),
+    ).astype(a.dtype)
+
+
+def any_(
+    a: IndexLike,
+    max_index: int = MAX_INDEX,
+    axis: Optional[int] = None,
+) -> np.ndarray:
+    """ The or operator used by Bochvar (|), applied to every value index along
+    an axis. See mvl.bochvar.any_.
+
+    Args:
+        a (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+            This must be 2.
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a | b | ...
+
+    Raises:
+        ValueError: If max_index is not 2.
+    """
+    _check(max_index)
+    a = as_indices(a)
+    return np.where(
+        np.any(a == _U, axis=axis),
+        _U,
+        np.where(np.any(a != 0, axis=axis), MAX_INDEX, 0),
+    ).astype(a.dtype)
@@ -0,0 +1,47 @@
+"""
+.. module: indexed.goedel
+   :synopsis: Index versions of the operators used in goedel logics.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+import numpy as np
+
+# Imports from the local package.
+from mvl.indexed import IndexLike, as_indices
+from mvl.indexed.lukasiewicz import w_and as and_
+from mvl.indexed.lukasiewicz import w_or as or_
+from mvl.indexed.lukasiewicz import w_all as all_
+from mvl.indexed.lukasiewicz import w_any as any_
+
+
+def not_(a: IndexLike, max_index: int) -> np.ndarray:
+    """ Goedel's «not» operator (!) on value indices. See mvl.goedel.not_.
+
+    Args:
+        a (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+
+    Returns:
+        np.ndarray: ! a
+    """
+    a = as_indices(a)
+    return np.where(a == 0, max_index, 0).astype(a.dtype)
+
+
+def implies(a: IndexLike, b: IndexLike, max_index: int) -> np.ndarray:
+    """ Goedel's «implies» operator (→) on value indices. See
+    mvl.goedel.implies.
+
+    Args:
+        a (IndexLike)
+        b (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+
+    Returns:
+        np.ndarray: a → b
+    """
+    a = as_indices(a)
+    b = as_indices(b)
+    return np.where(a > b, b, max_index).astype(np.result_type(a, b))
@@ -0,0 +1,225 @@
+"""
+.. module: indexed.lukasiewicz
+   :synopsis: Index versions of the operators used in lukasiewicz logics.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from typing import Optional
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.indexed import IndexLike, as_indices
+
+
+def s_and(a: IndexLike, b: IndexLike, max_index: int) -> np.ndarray:
+    """ Lukasiewicz's «strong and» operator (&&) on value indices. See
+    mvl.lukasiewicz.s_and.
+
+    max {0, a + b - m} is computed as a - min {a, m - b}, which never leaves
+    the range [0, m].
+
+    Args:
+        a (IndexLike)
+        b (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+
+    Returns:
+        np.ndarray: a && b
+    """
+    a = as_indices(a)
+    b = as_indices(b)
+    return a - np.minimum(a, max_index - b)
+
+
+def w_and(a: IndexLike, b: IndexLike, max_index: int) -> np.ndarray:
+    """ Lukasiewicz's «weak and» operator (&) on value indices. See
+    mvl.lukasiewicz.w_and.
+
+    Args:
+        a (IndexLike)
+        b (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+
+    Returns:
+        np.ndarray: a & b
+    """
+    return np.minimum(as_indices(a), as_indices(b))
+
+
+def s_or(a: IndexLike, b: IndexLike, max_index: int) -> np.ndarray:
+    """ Lukasiewicz's «strong or» operator (||) on value indices, as a
+    saturating add. See mvl.lukasiewicz.s_or.
+
+    min {m, a + b} is computed as a + min {b, m - a}, which never leaves the
+    range [0, m].
+
+    Args:
+        a (IndexLike)
+        b (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+
+    Returns:
+        np.ndarray: a || b
+    """
+    a = as_indices(a)
+    b = as_indices(b)
+    return a + np.minimum(b, max_index - a)
+
+
+def w_or(a: IndexLike, b: IndexLike, max_index: int) -> np.ndarray:
+    """ Lukasiewicz's «weak or» operator (|) on value indices. See
+    mvl.lukasiewicz.w_or.
+
+    Args:
+        a (IndexLike)
+        b (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+
+    Returns:
+        np.ndarray: a | b
+    """
+    return np.maximum(as_indices(a), as_indices(b))
+
+
+def not_(a: IndexLike, max_index: int) -> np.ndarray:
+    """ Lukasiewicz's «not» operator (!) on value indices. See
+    mvl.lukasiewicz.not_.
+
+    Args:
+        a (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+
+    Returns:
+        np.ndarray: ! a
+    """
+    return max_index - as_indices(a)
+
+
+def implies(a: IndexLike, b: IndexLike, max_index: int) -> np.ndarray:
+    """ Lukasiewicz's «implies» operator (→) on value indices. See
+    mvl.lukasiewicz.implies.
+
+    min {m, m - a + b} is computed as m - (a - min {a, b}), which never leaves
+    the range [0, m].
+
+    Args:
+        a (IndexLike)
+        b (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+
+    Returns:
+        np.ndarray: a → b
+    """
+    a = as_indices(a)
+    b = as_indices(b)
+    return max_index - (a - np.minimum(a, b))
+
+
+def equivalent(a: IndexLike, b: IndexLike, max_index: int) -> np.ndarray:
+    """ Lukasiewicz's «equivalent» operator (↔) on value indices. See
+    mvl.lukasiewicz.equivalent.
+
+    Args:
+        a (IndexLike)
+        b (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+
+    Returns:
+        np.ndarray: a ↔ b
+    """
+    a = as_indices(a)
+    b = as_indices(b)
+    return max_index - (np.maximum(a, b) - np.minimum(a, b))
+
+
+def s_all(
+    a: IndexLike,
+    max_index: int,
+    axis: Optional[int] = None,
+) -> np.ndarray:
+    """ Lukasiewicz's «strong and» (&&) of every value index along an axis,
+    using the closed form:
+
+    max {0, Σ a - (k - 1) m}
+
+    where k is the number of values. The sum is computed with 64 bit integers,
+    and the result has the type of a. See mvl.lukasiewicz.s_all.
+
+    Args:
+        a (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a && b && ...
+    """
+    a = as_indices(a)
+    count = a.size if axis is None else a.shape[axis]
+    total = a.sum(axis=axis, dtype=np.int64) - (count - 1) * max_index
+    return np.maximum(0, total).astype(a.dtype)
+
+
+def s_any(
+    a: IndexLike,
+    max_index: int,
+    axis: Optional[int] = None,
+) -> np.ndarray:
+    """ Lukasiewicz's «strong or» (||) of every value index along an axis,
+    using the closed form min {m, Σ a}. See mvl.lukasiewicz.s_any.
+
+    Args:
+        a (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a || b || ...
+    """
+    a = as_indices(a)
+    total = a.sum(axis=axis, dtype=np.uint64)
+    return np.minimum(max_index, total).astype(a.dtype)
+
+
+def w_all(
+    a: IndexLike,
+    max_index: int,
+    axis: Optional[int] = None,
+) -> np.ndarray:
+    """ Lukasiewicz's «weak and» (&) of every value index along an axis (their
+    minimum). See mvl.lukasiewicz.w_all.
+
+    Args:
+        a (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a & b & ...
+    """
+    return np.min(as_indices(a), axis=axis, initial=max_index)
+
+
+def w_any(
+    a: IndexLike,
+    max_index: int,
+    axis: Optional[int] = None,
+) -> np.ndarray:
+    """ Lukasiewicz's «weak or» (|) of every value index along an axis (their
+    maximum). See mvl.lukasiewicz.w_any.
+
+    Args:
+        a (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a | b | ...
+    """
+    return np.max(as_indices(a), axis=axis, initial=0)
@@ -0,0 +1,29 @@
+"""
+.. module: indexed.post
+   :synopsis: Index versions of the operators used in post logics.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+import numpy as np
+
+# Imports from the local package.
+from mvl.indexed import IndexLike, as_indices
+from mvl.indexed.goedel import and_, or_, all_, any_
+
+
+def not_(a: IndexLike, max_index: int) -> np.ndarray:
+    """ Post's «not» operator (!) on value indices: the cyclic shift
+    (a - 1) mod (m + 1). See mvl.post.not_.
+
+    Args:
+        a (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+
+    Returns:
+        np.ndarray: ! a
+    """
+    a = as_indices(a)
+    # Written so that unsigned indices never wrap around below 0.
+    return np.where(a == 0, max_index, np.maximum(a, 1) - 1).astype(a.dtype)
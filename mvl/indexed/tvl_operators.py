@@ -0,0 +1,154 @@
+"""
+.. module: indexed.tvl_operators
+   :synopsis: Index versions of the logical operators used in kleene and
+   priest 3 valued logic systems, where f, u and t have the indices 0, 1 and 2.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from typing import Optional
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.indexed import IndexLike
+import mvl.indexed.lukasiewicz as lukasiewicz
+
+
+MAX_INDEX: int = 2
+""" The max_index of every 3 valued logic system.
+"""
+
+
+def not_(a: IndexLike, max_index: int = MAX_INDEX) -> np.ndarray:
+    """ The negation operator (!) on value indices. See
+    mvl.tvl_operators.not_.
+
+    Args:
+        a (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+
+    Returns:
+        np.ndarray: ! a
+    """
+    return lukasiewicz.not_(a, max_index)
+
+
+def and_(a: IndexLike, b: IndexLike, max_index: int = MAX_INDEX) -> np.ndarray:
+    """ The and operator (&) on value indices. See mvl.tvl_operators.and_.
+
+    Args:
+        a (IndexLike)
+        b (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+
+    Returns:
+        np.ndarray: a & b
+    """
+    return lukasiewicz.w_and(a, b, max_index)
+
+
+def or_(a: IndexLike, b: IndexLike, max_index: int = MAX_INDEX) -> np.ndarray:
+    """ The or operator (|) on value indices. See mvl.tvl_operators.or_.
+
+    Args:
+        a (IndexLike)
+        b (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+
+    Returns:
+        np.ndarray: a | b
+    """
+    return lukasiewicz.w_or(a, b, max_index)
+
+
+def implies(
+    a: IndexLike,
+    b: IndexLike,
+    max_index: int = MAX_INDEX,
+) -> np.ndarray:
+    """ The implication operator (→) on value indices. See
+    mvl.tvl_operators.implies.
+
+    Args:
+        a (IndexLike)
+        b (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+
+    Returns:
+        np.ndarray: a → b
+    """
+    return or_(not_(a, max_index), b, max_index)
+
+
+def iff(a: IndexLike, b: IndexLike, max_index: int = MAX_INDEX) -> np.ndarray:
+    """ The bicondition operator (↔) on value indices. See
+    mvl.tvl_operators.iff.
+
+    Args:
+        a (IndexLike)
+        b (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+
+    Returns:
+        np.ndarray: a ↔ b
+    """
+    return and_(
+        implies(a, b, max_index), implies(b, a, max_index), max_index
+    )
+
+
+def xor(a: IndexLike, b: IndexLike, max_index: int = MAX_INDEX) -> np.ndarray:
+    """ The xor operator on value indices. See
+    mvl.tvl_operators.xor.
+
+    Args:
+        a (IndexLike)
+        b (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+
+    Returns:
+        np.ndarray: a xor b
+    """
+    return not_(iff(a, b, max_index), max_index)
+
+
+def all_(
+    a: IndexLike,
+    max_index: int = MAX_INDEX,
+    axis: Optional[int] = None,
+) -> np.ndarray:
+    """ The and operator (&) of every value index along an axis. See
+    mvl.tvl_operators.all_.
+
+    Args:
+        a (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a & b & ...
+    """
+    return lukasiewicz.w_all(a, max_index, axis)
+
+
+def any_(
+    a: IndexLike,
+    max_index: int = MAX_INDEX,
+    axis: Optional[int] = None,
+) -> np.ndarray:
+    """ The or operator (|) of every value index along an axis. See
+    mvl.tvl_operators.any_.
+
+    Args:
+        a (IndexLike)
+        max_index (int): The number of values in the logic system, minus 1.
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a | b | ...
+    """
+    return lukasiewicz.w_any(a, max_index, axis)
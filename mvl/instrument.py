@@ -0,0 +1,429 @@
+"""
+.. module: instrument
+   :synopsis: Opt-in profiling of the operators provided by MVL, and of
+   formulas, which counts their calls, times them, and records the types of
+   their arguments.
+
+   While instrumentation is enabled, the code of each operator in lukasiewicz,
+   goedel, product, post, tvl_operators and bochvar is replaced by code which
+   records each call. The operators themselves are not replaced, so every
+   reference to them (in other modules such as kleene, in formulas, or saved
+   in a dict of rules) records calls, and they still pickle by reference.
+   Disabling it puts the original code back, so instrumentation costs nothing
+   while it is off.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from contextlib import contextmanager
+from functools import wraps
+from inspect import isfunction, signature
+from json import dump, dumps
+from sys import modules
+from threading import Lock
+from time import perf_counter
+from types import CodeType, FunctionType
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO
+
+# Imports from the local package.
+from mvl.formula import Formula
+from mvl.lukasiewicz import LogicValue
+
+
+INSTRUMENTED_MODULES: List[str] = [
+    'mvl.lukasiewicz',
+    'mvl.goedel',
+    'mvl.product',
+    'mvl.post',
+    'mvl.tvl_operators',
+    'mvl.bochvar',
+]
+""" The modules whose operators are instrumented.
+"""
+
+SORT_KEYS: List[str] = ['time', 'calls', 'name']
+""" The ways a report can be sorted.
+"""
+
+
+class Stats:
+    """ The statistics recorded for one operator or formula.
+
+    Attributes:
+        name (str): The qualified name of the operator, or the representation
+            of the formula. The representation of a formula is only computed
+            when it is first asked for.
+        formula (Optional[Formula]): The formula the statistics are for, if
+            they are for a formula.
+        calls (int): The number of times it was called.
+        time (float): The total time spent in it, in seconds. This includes the
+            time spent in the operators it calls, which are recorded as well.
+        types (Dict[str, int]): The number of arguments of each type it was
+            called with. LogicValues of any class are counted as 'LogicValue',
+            and numpy arrays as 'ndarray'.
+    """
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        formula: Optional[Formula] = None,
+    ) -> None:
+        self._name: Optional[str] = name
+        self.formula: Optional[Formula] = formula
+        self.calls: int = 0
+        self.time: float = 0.0
+        self.types: Dict[str, int] = {}
+
+    def record(self, time: float, args: tuple) -> None:
+        """ Records a single call.
+
+        Args:
+            time (float): The time the call took, in seconds.
+            args (tuple): The arguments it was called with.
+        """
+        self.calls += 1
+        self.time += time
+        for arg in args:
+            name = _type_name(arg)
+            self.types[name] = self.types.get(name, 0) + 1
+
+    @property
+    def name(self) -> str:
+        if self._name is None:
+            self._name = repr(self.formula)
+        return self._name
+
+    def add(self, other: 'Stats') -> None:
+        """ Adds the calls recorded by other to these statistics.
+
+        Args:
+            other (Stats)
+        """
+        self.calls += other.calls
+        self.time += other.time
+        for name, count in other.types.items():
+            self.types[name] = self.types.get(name, 0) + count
+
+    def to_dict(self) -> Dict[str, Any]:
+        """ Returns:
+            Dict[str, Any]: The statistics, as a JSON serializable dict.
+        """
+        return {
+            'name': self.name,
+            'calls': self.calls,
+            'time': self.time,
+            'types': dict(sorted(self.types.items())),
+        }
+
+    def __repr__(self) -> str:
+        return 'Stats({!r}, calls={}, time={:.6f})'.format(
+            self.name, self.calls, self.time
+        )
+
+
+_operators: Dict[str, Stats] = {}
+_formulas: Dict[Formula, Stats] = {}
+_originals: Dict[Callable, CodeType] = {} # The code of each operator.
+_copies: Dict[str, Callable] = {} # Uninstrumented copies, by name.
+_formula_call: Optional[Callable] = None
+_enabled: bool = False
+_lock: Lock = Lock()
+
+
+def enable() -> None:
+    """ Starts recording calls to operators and formulas. Enabling
+    instrumentation when it is already enabled does nothing.
+
+    Formulas which inline their operators (see Formula.compile) only record
+    calls to the formula itself.
+    """
+    global _formula_call, _enabled
+    with _lock:
+        _enabled = True
+        for op in _operators_of(_mvl_modules()):
+            if op not in _originals:
+                _instrument(op)
+
+        if _formula_call is None:
+            _formula_call = Formula.__call__
+            Formula.__call__ = _instrument_formula(_formula_call)
+
+
+def disable() -> None:
+    """ Stops recording calls, and puts the original code of the operators
+    back. The statistics recorded so far are kept until reset is called.
+    """
+    global _formula_call, _enabled
+    with _lock:
+        _enabled = False
+        for op, code in _originals.items():
+            op.__code__ = code
+            del op.__signature__
+        _originals.clear()
+        _copies.clear()
+
+        if _formula_call is not None:
+            Formula.__call__ = _formula_call
+            _formula_call = None
+
+
+def is_enabled() -> bool:
+    """ Returns:
+        bool: Whether instrumentation is enabled.
+    """
+    return _enabled
+
+
+@contextmanager
+def instrumented() -> Iterator[None]:
+    """ A context manager which enables instrumentation inside its block::
+
+        with instrumented():
+            run_rules()
+        print(report())
+    """
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+
+def reset() -> None:
+    """ Deletes the statistics recorded so far.
+    """
+    with _lock:
+        _operators.clear()
+        _formulas.clear()
+
+
+def operator_stats() -> Dict[str, Stats]:
+    """ Returns:
+        Dict[str, Stats]: The statistics of each operator which has been called,
+            by its qualified name (like 'mvl.goedel.and_').
+    """
+    return dict(_operators)
+
+
+def formula_stats() -> Dict[str, Stats]:
+    """ Returns:
+        Dict[str, Stats]: The statistics of each formula which has been called,
+            by its representation. The statistics of equal formulas are added
+            together.
+    """
+    with _lock:
+        entries = list(_formulas.values())
+    merged: Dict[str, Stats] = {}
+    for entry in entries:
+        total = merged.get(entry.name)
+        if total is None:
+            total = merged[entry.name] = Stats(entry.name)
+        total.add(entry)
+    return merged
+
+
+def report(sort: str = 'time', limit: Optional[int] = None) -> str:
+    """ Returns a table of the statistics of each operator and formula.
+
+    Args:
+        sort (str): What to sort the rows by. One of 'time' (the default,
+            slowest first); 'calls' (most called first); or 'name'.
+        limit (Optional[int]): The maximum number of operators (and of
+            formulas) to include.
+
+    Returns:
+        str: The report.
+
+    Raises:
+        ValueError: If sort is not a valid sort key.
+    """
+    if sort not in SORT_KEYS:
+        raise ValueError('sort must be one of {}, not {!r}'.format(
+            SORT_KEYS, sort
+        ))
+    lines = []
+    for title, stats in [
+        ('Operator', operator_stats()), ('Formula', formula_stats()),
+    ]:
+        rows = _sorted(stats.values(), sort)[:limit]
+        if not rows:
+            continue
+        if lines:
+            lines.append('')
+        lines.append('{:>10} {:>12} {:>12}  {}  {}'.format(
+            'calls', 'time (s)', 'per call', title, 'argument types'
+        ))
+        for row in rows:
+            lines.append('{:>10} {:>12.6f} {:>12.3e}  {}  {}'.format(
+                row.calls,
+                row.time,
+                row.time / row.calls,
+                row.name,
+                ', '.join(
+                    '{}: {}'.format(name, count)
+                    for name, count in sorted(row.types.items())
+                ),
+            ))
+    return '\n'.join(lines)
+
+
+def to_dict() -> Dict[str, List[Dict[str, Any]]]:
+    """ Returns:
+        Dict[str, List[Dict[str, Any]]]: The statistics of the operators and
+            the formulas (under the keys 'operators' and 'formulas'), each
+            sorted by time, as JSON serializable dicts.
+    """
+    return {
+        'operators': [
+            stats.to_dict()
+            for stats in _sorted(operator_stats().values(), 'time')
+        ],
+        'formulas': [
+            stats.to_dict()
+            for stats in _sorted(formula_stats().values(), 'time')
+        ],
+    }
+
+
+def to_json(file: Optional[TextIO] = None) -> Optional[str]:
+    """ Dumps the statistics (see to_dict) as JSON.
+
+    Args:
+        file (Optional[TextIO]): The file to write to. If None, the JSON is
+            returned instead.
+
+    Returns:
+        Optional[str]: The JSON, if file is None.
+    """
+    if file is None:
+        return dumps(to_dict(), indent=2)
+    dump(to_dict(), file, indent=2)
+    return None
+
+
+def _mvl_modules() -> list:
+    """ Returns the loaded modules of the mvl package.
+    """
+    return [
+        module for name, module in list(modules.items())
+        if module is not None and (name == 'mvl' or name.startswith('mvl.'))
+    ]
+
+
+def _operators_of(mvl_modules: list) -> Dict[Callable, None]:
+    """ Returns the public functions of the loaded instrumented modules, each
+    once (in the order they were found).
+    """
+    ops: Dict[Callable, None] = {}
+    for module in mvl_modules:
+        for value in list(vars(module).values()):
+            if (isfunction(value)
+                    and value.__module__ in INSTRUMENTED_MODULES
+                    and not value.__name__.startswith('_')
+                    and value.__closure__ is None):
+                ops.setdefault(value)
+    return ops
+
+
+_NAME_PLACEHOLDER: str = '_mvl_instrumented_name'
+
+
+def _trampoline(*args: Any, **kwargs: Any) -> Any:
+    """ The code given to instrumented operators, with _NAME_PLACEHOLDER
+    replaced by the name of the operator. It runs with the globals of the
+    operator's module, so it imports what it needs.
+    """
+    from mvl.instrument import _call
+    return _call('_mvl_instrumented_name', args, kwargs)
+
+
+def _instrument(op: FunctionType) -> None:
+    """ Replaces the code of op with code which records its calls, and calls
+    an uninstrumented copy of op. Keeping op itself (rather than replacing it
+    with a wrapper) keeps every reference to it instrumented, and lets it be
+    pickled by reference.
+    """
+    name = '{}.{}'.format(op.__module__, op.__name__)
+    copy = FunctionType(
+        op.__code__, op.__globals__, op.__name__, op.__defaults__
+    )
+    copy.__kwdefaults__ = op.__kwdefaults__
+    code = _trampoline.__code__
+    code = code.replace(
+        co_name=op.__code__.co_name,
+        co_consts=tuple(
+            name if const == _NAME_PLACEHOLDER else const
+            for const in code.co_consts
+        ),
+    )
+    # The signature is read from the code, which is now (*args, **kwargs).
+    op.__signature__ = signature(op)
+    _copies[name] = copy
+    _originals[op] = op.__code__
+    op.__code__ = code
+
+
+def _call(name: str, args: tuple, kwargs: Dict[str, Any]) -> Any:
+    """ Calls the copy of the operator name, recording the call.
+    """
+    op = _copies[name]
+    start = perf_counter()
+    try:
+        return op(*args, **kwargs)
+    finally:
+        _record(_operators, name, perf_counter() - start, args)
+
+
+def _instrument_formula(call: Callable) -> Callable:
+    """ Returns the instrumented version of Formula.__call__.
+    """
+    @wraps(call)
+    def instrumented_call(self: Formula, *args: Any, **kwargs: Any) -> float:
+        start = perf_counter()
+        try:
+            return call(self, *args, **kwargs)
+        finally:
+            time = perf_counter() - start
+            with _lock:
+                # Formulas cache their hash, so this is cheap, whereas their
+                # representation is only computed for reports. Equal formulas
+                # share an entry, so only one of them is kept alive.
+                entry = _formulas.get(self)
+                if entry is None:
+                    entry = _formulas[self] = Stats(formula=self)
+                entry.record(time, args + tuple(kwargs.values()))
+    return instrumented_call
+
+
+def _record(
+    stats: Dict[str, Stats],
+    name: str,
+    time: float,
+    args: tuple,
+) -> None:
+    """ Records a call in the statistics named name.
+    """
+    with _lock:
+        entry = stats.get(name)
+        if entry is None:
+            entry = stats[name] = Stats(name)
+        entry.record(time, args)
+
+
+def _sorted(stats: Any, sort: str) -> List[Stats]:
+    """ Sorts statistics by one of SORT_KEYS.
+    """
+    if sort == 'name':
+        return sorted(stats, key=lambda s: s.name)
+    if sort == 'calls':
+        return sorted(stats, key=lambda s: (-s.calls, s.name))
+    return sorted(stats, key=lambda s: (-s.time, s.name))
+
+
+def _type_name(arg: object) -> str:
+    """ Returns the name an argument's type is recorded under.
+    """
+    if isinstance(arg, LogicValue):
+        return 'LogicValue'
+    return type(arg).__name__
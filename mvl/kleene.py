@@ -7,7 +7,9 @@
 
 # Imports from the local package.
 from mvl.lukasiewicz import LogicSystem, LogicValue, LukasiewiczLogicValue
-from mvl.tvl_operators import not_, and_, or_, iff, xor, implies
+from mvl.tvl_operators import (
+    not_, and_, or_, iff, xor, implies, all_, any_
+)
 
 
 kleene: LogicSystem = LogicSystem(3, LukasiewiczLogicValue)
@@ -0,0 +1,114 @@
+"""
+.. module: lazy
+   :synopsis: Versions of the operators provided by MVL which take zero
+   argument functions (thunks) as arguments, and only call them when their
+   value can change the result.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from typing import Callable, Mapping, Optional, Union
+
+# Imports from the local package.
+from mvl.algebra import left_absorbing
+from mvl.types import Floatable
+
+
+Operand = Union[Floatable, Callable[[], Floatable]]
+""" A type defining an argument of a lazy operator: either a value, or a
+function taking no arguments which returns one.
+"""
+
+
+def force(a: Operand) -> Floatable:
+    """ Returns the value of an operand, calling it if it is a thunk.
+
+    Args:
+        a (Operand)
+
+    Returns:
+        Floatable: The value of a.
+    """
+    return a() if callable(a) else a
+
+
+class LazyOperator:
+    """ A binary operator which evaluates its second argument only if the
+    first one doesn't decide the result by itself.
+
+    For example, the lazy version of kleene.and_ never calls its second
+    argument when the first is kleene.f, and the lazy version of goedel.or_
+    never calls it when the first is 1::
+
+        lazy_and = lazy(kleene.and_)
+        lazy_and(lambda: is_red(apple), lambda: is_ripe(apple))
+
+    Attributes:
+        op (Callable): The binary operator.
+        absorbing (Mapping[float, float]): The values of the first argument
+            which decide the result, mapped to that result.
+        evaluated (int): The number of times the second argument has been
+            called.
+        skipped (int): The number of times calling the second argument was
+            avoided.
+    """
+
+    def __init__(
+        self,
+        op: Callable[[Floatable, Floatable], float],
+        absorbing: Optional[Mapping[float, float]] = None,
+    ) -> None:
+        """
+        Args:
+            op (Callable[[Floatable, Floatable], float]): The binary operator.
+            absorbing (Optional[Mapping[float, float]]): The values of the first
+                argument which decide the result. Defaults to
+                mvl.algebra.left_absorbing(op).
+        """
+        self.op: Callable[[Floatable, Floatable], float] = op
+        self.absorbing: Mapping[float, float] = (
+            left_absorbing(op) if absorbing is None else absorbing
+        )
+        self.evaluated: int = 0
+        self.skipped: int = 0
+
+    def __call__(self, a: Operand, b: Operand) -> float:
+        a = force(a)
+        result = self.absorbing.get(float(a))
+        if result is not None:
+            if callable(b):
+                self.skipped += 1
+            return result
+
+        if callable(b):
+            self.evaluated += 1
+            b = b()
+        return self.op(a, b)
+
+    def reset(self) -> None:
+        """ Resets the counts of evaluated and skipped arguments.
+        """
+        self.evaluated = 0
+        self.skipped = 0
+
+    def __repr__(self) -> str:
+        return 'LazyOperator({}, evaluated={}, skipped={})'.format(
+            getattr(self.op, '__name__', repr(self.op)),
+            self.evaluated,
+            self.skipped,
+        )
+
+
+def lazy(op: Callable[[Floatable, Floatable], float]) -> LazyOperator:
+    """ Returns the lazy version of a binary operator. See LazyOperator.
+
+    Args:
+        op (Callable[[Floatable, Floatable], float]): Any binary operator from
+            tvl_operators, bochvar, goedel, product or lukasiewicz (or from the
+            logics which use them, like kleene and priest).
+
+    Returns:
+        LazyOperator: The lazy operator.
+    """
+    return LazyOperator(op)
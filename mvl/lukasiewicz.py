@@ -7,12 +7,26 @@
 .. moduleauthor: Andrew J. Young
 """
 
-from typing import List, Callable
+from functools import partial
+from math import ceil, floor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 
+from mvl.reductions import fold
 from mvl.types import Floatable
 
 
+ROUNDING_MODES: Tuple[str, ...] = ('nearest', 'floor', 'ceil')
+""" The ways in which LogicSystem can round a float onto one of its values.
+"""
+
+ROUNDING_TOLERANCE: float = 1e-9
+""" How far (in units of one value index) a float may be from a logic value and
+still be treated as exactly equal to it when rounding down or up. This stops
+floats like 0.7 * 10 (== 7.000000000000001) from being rounded up to 8.
+"""
+
+
 class LogicValue:
     """ A representation of a general lukasiewicz-goedel logic value.
 
@@ -20,13 +34,19 @@ class LogicValue:
     be finite or infinite in length (but for practical reasons, the latter is
     not implemented using classes).
 
+    LogicValues are immutable: once set, their numerical representation can not
+    be changed. They hash the same as their float representation, so they can be
+    used as dict keys and set members, and are interchangeable with equal floats
+    when used as such.
+
     Attributes:
         name (str): An alternative name for the logic value, used in the
-            representation of the class. See __repr__.
+            representation of the class. See __repr__. Unlike the other
+            attributes, this can be changed after the value is created.
         class_name (str): The name of the class, used in its representation. See
             __repr__. Equal to 'LogicValue'
     """
-    name: str = ''
+    __slots__ = ('val', 'name', '_system', '_index')
     class_name: str = 'LogicValue'
 
     def __eq__(self, other: Floatable) -> bool:
@@ -40,11 +60,37 @@ class LogicValue:
         """
         return not self.__eq__(other)
 
+    def __hash__(self) -> int:
+        return hash(float(self))
+
     def __nonzero__(self) -> bool:
         return self.__bool__()
 
     def __init__(self, val: float) -> None:
         self.val: float = val
+        self.name: str = ''
+
+    def __setattr__(self, key: str, value: object) -> None:
+        """ Only allows attributes (other than name) to be set once, which is
+        when the value is created.
+
+        Raises:
+            AttributeError: If the attribute has already been set.
+        """
+        if key != 'name' and hasattr(self, key):
+            raise AttributeError(
+                '{} is immutable: can not set {}'.format(self.class_name, key)
+            )
+        object.__setattr__(self, key, value)
+
+    def __reduce_ex__(self, protocol: int) -> Tuple:
+        """ Values which belong to a LogicSystem are pickled by reference to
+        that system, so that unpickling them returns the same object.
+        """
+        system = getattr(self, '_system', None)
+        if system is None:
+            return super().__reduce_ex__(protocol)
+        return (_system_value, (system, self._index))
 
     @classmethod
     def from_frac(cls, index: int, max_index: int) -> None:
@@ -83,6 +129,7 @@ class LukasiewiczLogicValue(LogicValue):
         class_name (str): The name of the class, used in its representation. See
             __repr__. Equal to 'LukasiewiczLogicValue'.
     """
+    __slots__ = ()
     class_name: str = 'LukasiewiczLogicValue'
 
     def __bool__(self) -> bool:
@@ -99,6 +146,7 @@ class PriestLogicValue(LogicValue):
         class_name (str): The name of the class, used in its representation. See
             __repr__. Equal to 'PriestLogicValue'.
     """
+    __slots__ = ()
     class_name: str = 'PriestLogicValue'
 
     def __bool__(self) -> bool:
@@ -109,6 +157,10 @@ class LogicSystem:
     """ A class for creating logical systems and the associated logical values,
     and for converting numerical values into LogicValues.
 
+    LogicSystems are cached by their arguments: LogicSystem(n, cls) always
+    returns the same object for the same n and cls, and so its values are shared
+    singletons which can be compared by identity.
+
     Attributes:
         n_values (int): The number of values in the LogicSystem. Equal to
             len(LogicSystem.values).
@@ -118,12 +170,27 @@ class LogicSystem:
 
     n_values: int = 0
     values: List[LogicValue] = []
+    _instances: Dict[Tuple[type, int, Callable], 'LogicSystem'] = {}
+
+    def __new__(cls, n_values: int, logic_value_class: Callable) -> 'LogicSystem':
+        key = (cls, n_values, logic_value_class)
+        instance = LogicSystem._instances.get(key)
+        if instance is None:
+            instance = super().__new__(cls)
+            LogicSystem._instances[key] = instance
+        return instance
 
     def __init__(self, n_values: int, logic_value_class: Callable) -> None:
+        if self.values: # This is a cached instance, which is already set up.
+            return
         self.n_values: int = n_values
         self.logic_value_class: Callable = logic_value_class
+        self._truth_tables: Dict[Callable, 'TruthTable'] = {}
         self._gen_classes() # Sets self.values to a list of LogicValues.
 
+    def __reduce__(self) -> Tuple:
+        return (type(self), (self.n_values, self.logic_value_class))
+
     def _gen_classes(self) -> None:
         """ Generates self.n_values LogicValues, in order, for the current
         logical system, and saves these objects in self.values.
@@ -133,11 +200,144 @@ class LogicSystem:
             self.logic_value_class.from_frac(i, max_index)
             for i in range(self.n_values)
         ]
+        for i, value in enumerate(self.values):
+            value._system = self
+            value._index = i
+
+    def index(
+        self,
+        f: Floatable,
+        rounding: Optional[str] = 'nearest',
+    ) -> int:
+        """ Given a float in the range [0, 1], returns the index of the
+        associated logic value in the current system.
+
+        Args:
+            f (Floatable): The float to convert.
+            rounding (Optional[str]): How to round floats which lie between 2
+                logic values. One of 'nearest' (the default, rounding halves
+                up); 'floor'; 'ceil'; or None, to not round at all.
+
+        Returns:
+            int: The index into self.values of the logic value.
 
-    def mvl(self, f: float) -> LogicValue:
+        Raises:
+            ValueError: If f is not in the range [0, 1], or rounding is not a
+                valid rounding mode, or rounding is None and f is not (within
+                ROUNDING_TOLERANCE) a value of the system.
+        """
+        f = float(f)
+        if not 0 <= f <= 1:
+            raise ValueError('{} is not in the range [0, 1]'.format(f))
+        scaled = f * (self.n_values - 1)
+        if rounding is None:
+            index = floor(scaled + 0.5)
+            if abs(scaled - index) > ROUNDING_TOLERANCE:
+                raise ValueError('{} is not a value of a {} valued logic '
+                    'system'.format(f, self.n_values))
+            return index
+        if rounding == 'nearest':
+            return floor(scaled + 0.5)
+        if rounding == 'floor':
+            return floor(scaled + ROUNDING_TOLERANCE)
+        if rounding == 'ceil':
+            return ceil(scaled - ROUNDING_TOLERANCE)
+        raise ValueError('rounding must be one of {}, not {!r}'.format(
+            ROUNDING_MODES, rounding
+        ))
+
+    def mvl(self, f: Floatable, rounding: str = 'nearest') -> LogicValue:
         """ Given a float, returns the associated logic value in the current
-        system, if one exists. """
-        return self.values[int(f * self.n_values) - 1]
+        system, if one exists. See LogicSystem.index. """
+        return self.values[self.index(f, rounding)]
+
+    def quantize(
+        self,
+        fs: Iterable[Floatable],
+        rounding: str = 'nearest',
+    ) -> 'np.ndarray':
+        """ The array version of LogicSystem.index. Converts every float in fs
+        into the index of its associated logic value in a single pass.
+
+        This method needs numpy.
+
+        Args:
+            fs (Iterable[Floatable]): The floats to convert.
+            rounding (str): See LogicSystem.index.
+
+        Returns:
+            np.ndarray: The indices, using the smallest unsigned integer type
+                which can hold every index of the system.
+        """
+        from mvl.vectorized.systems import quantize
+        return quantize(self, fs, rounding)
+
+    def mvl_array(
+        self,
+        fs: Iterable[Floatable],
+        rounding: str = 'nearest',
+    ) -> 'np.ndarray':
+        """ The array version of LogicSystem.mvl. Converts every float in fs
+        into its associated logic value.
+
+        This method needs numpy.
+
+        Args:
+            fs (Iterable[Floatable]): The floats to convert.
+            rounding (str): See LogicSystem.index.
+
+        Returns:
+            np.ndarray: An object array of the LogicValues.
+        """
+        from mvl.vectorized.systems import value_array
+        return value_array(self)[self.quantize(fs, rounding)]
+
+    def indexed(self, op: Callable) -> Callable:
+        """ Returns the index version of op for this system, which takes (and
+        returns) the indices of values rather than their truth degrees, and
+        computes exactly on integers. See mvl.indexed.
+
+        This method needs numpy.
+
+        Args:
+            op (Callable): An operator of a finite valued logic provided by MVL.
+
+        Returns:
+            Callable: A function taking the indices of op's arguments (as ints,
+                or integer arrays like those returned by
+                LogicSystem.quantize), and returning the indices of its results.
+
+        Raises:
+            ValueError: If op does not have an index version.
+        """
+        from mvl.indexed import operator_for
+        return partial(operator_for(op), max_index=self.n_values - 1)
+
+    def truth_table(self, op: Callable) -> 'TruthTable':
+        """ Returns the truth table of op over the values of this system. The
+        table is only computed the first time it is asked for.
+
+        This method needs numpy.
+
+        Args:
+            op (Callable): Any operator which takes LogicValues of this system
+                and returns a float equal to one of its values.
+
+        Returns:
+            TruthTable: See mvl.vectorized.systems.TruthTable.
+        """
+        table = self._truth_tables.get(op)
+        if table is None:
+            from mvl.vectorized.systems import TruthTable
+            table = self._truth_tables[op] = TruthTable(self, op)
+        return table
+
+
+def _system_value(system: LogicSystem, index: int) -> LogicValue:
+    """ Returns the value at the given index of a LogicSystem. Used to unpickle
+    LogicValues by reference to their system.
+    """
+    return system.values[index]
 
 
 def s_and(a: Floatable, b: Floatable) -> float:
@@ -259,3 +459,62 @@ def equivalent(a: Floatable, b: Floatable) -> float:
     b = float(b)
     return (1 - abs(a - b))
 
+
+def s_all(values: Iterable[Floatable]) -> float:
+    """ Lukasiewicz's «strong and» (&&) of any number of values, stopping as
+    soon as the result is 0. Equal to:
+
+    max {0, Σ a - (k - 1)}
+
+    where k is the number of values. Gives 1 for no values.
+
+    Args:
+        values (Iterable[LogicValue])
+
+    Returns:
+        LogicValue: a && b && ...
+    """
+    return fold(s_and, values, 1, 0)
+
+
+def s_any(values: Iterable[Floatable]) -> float:
+    """ Lukasiewicz's «strong or» (||) of any number of values, stopping as
+    soon as the result is 1. Equal to:
+
+    min {1, Σ a}
+
+    Gives 0 for no values.
+
+    Args:
+        values (Iterable[LogicValue])
+
+    Returns:
+        LogicValue: a || b || ...
+    """
+    return fold(s_or, values, 0, 1)
+
+
+def w_all(values: Iterable[Floatable]) -> float:
+    """ Lukasiewicz's «weak and» (&) of any number of values (their minimum),
+    stopping as soon as the result is 0. Gives 1 for no values.
+
+    Args:
+        values (Iterable[LogicValue])
+
+    Returns:
+        LogicValue: a & b & ...
+    """
+    return fold(w_and, values, 1, 0)
+
+
+def w_any(values: Iterable[Floatable]) -> float:
+    """ Lukasiewicz's «weak or» (|) of any number of values (their maximum),
+    stopping as soon as the result is 1. Gives 0 for no values.
+
+    Args:
+        values (Iterable[LogicValue])
+
+    Returns:
+        LogicValue: a | b | ...
+    """
+    return fold(w_or, values, 0, 1)
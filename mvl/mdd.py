@@ -0,0 +1,423 @@
+"""
+.. module: mdd
+   :synopsis: Multi-valued decision diagrams, a canonical and shared
+   representation of formulas over finite logic systems.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Imports from the local package.
+from mvl.formula import Const, Formula, Var
+from mvl.lukasiewicz import LogicSystem, LogicValue
+from mvl.types import Floatable
+
+
+class Node:
+    """ A node of a multi-valued decision diagram.
+
+    An inner node tests the variable at its level of the diagram's variable
+    order, and has one child per value of the logic system, which is the
+    diagram to follow when the variable takes that value. A terminal node holds
+    the index of a value of the logic system.
+
+    Nodes are created by a Manager, which makes sure that there is only one
+    node for each level and tuple of children (and one terminal per value).
+    Diagrams are therefore canonical: two diagrams of the same manager
+    represent the same function iff they are the same node, so they are
+    compared by identity.
+
+    Attributes:
+        level (Optional[int]): The position of the tested variable in the
+            variable order, or None for terminal nodes.
+        children (Tuple[Node, ...]): The child for each value index. Empty for
+            terminal nodes.
+        index (Optional[int]): The index of the value of a terminal node, or
+            None for inner nodes.
+    """
+    __slots__ = ('level', 'children', 'index')
+
+    def __init__(
+        self,
+        level: Optional[int],
+        children: Tuple['Node', ...],
+        index: Optional[int],
+    ) -> None:
+        self.level: Optional[int] = level
+        self.children: Tuple[Node, ...] = children
+        self.index: Optional[int] = index
+
+    @property
+    def is_terminal(self) -> bool:
+        return self.level is None
+
+    def __repr__(self) -> str:
+        if self.is_terminal:
+            return 'Node(index={})'.format(self.index)
+        return 'Node(level={}, id={:#x})'.format(self.level, id(self))
+
+
+class Manager:
+    """ Builds and operates on the multi-valued decision diagrams over a finite
+    logic system, and a shared order of variables.
+
+    Diagrams are reduced (no node has identical children, and no two nodes have
+    the same level and children) and ordered (variables are tested in the same
+    order on every path). Nodes are kept in a unique table, so diagrams of many
+    related formulas share their common parts. Operators are applied by
+    recursing over the children of their arguments, memoizing the result for
+    each tuple of argument nodes, so applying a binary operator takes time
+    proportional to the product of the sizes of its arguments at worst.
+
+    Operators are looked up in the truth tables of the logic system (see
+    LogicSystem.truth_table), so any operator which is closed over the values
+    of the system can be applied: for example, those in tvl_operators, bochvar,
+    goedel, lukasiewicz and (with a system of Post values) post.
+
+    Attributes:
+        system (LogicSystem): The finite logic system the variables take values
+            from.
+        order (List[str]): The names of the variables, in the order in which
+            they are tested. Variables are added to the end of the order the
+            first time they are used, unless they are given up front.
+        terminals (Tuple[Node, ...]): The terminal node for each value index.
+    """
+
+    def __init__(
+        self,
+        system: LogicSystem,
+        order: Iterable[str] = (),
+    ) -> None:
+        """
+        Args:
+            system (LogicSystem): The finite logic system the variables take
+                values from.
+            order (Iterable[str]): The names of any variables whose position in
+                the variable order should be fixed up front. The size of a
+                diagram can depend greatly on the order of its variables.
+        """
+        self.system: LogicSystem = system
+        self.order: List[str] = []
+        self.terminals: Tuple[Node, ...] = tuple(
+            Node(None, (), index) for index in range(system.n_values)
+        )
+
+        self._levels: Dict[str, int] = {}
+        self._unique: Dict[Tuple[int, Tuple[Node, ...]], Node] = {}
+        self._cache: Dict[Tuple, Node] = {}
+        self._tables: Dict[Callable, Tuple[int, List]] = {}
+        for name in order:
+            self._level(name)
+
+    def __len__(self) -> int:
+        """ Returns the number of inner nodes in the unique table.
+        """
+        return len(self._unique)
+
+    def _level(self, name: str) -> int:
+        """ Returns the level of a variable, adding it to the end of the order
+        if it is new.
+        """
+        level = self._levels.get(name)
+        if level is None:
+            level = self._levels[name] = len(self.order)
+            self.order.append(name)
+        return level
+
+    def _node(self, level: int, children: Tuple[Node, ...]) -> Node:
+        """ Returns the unique node with the given level and children.
+        """
+        first = children[0]
+        if all(child is first for child in children):
+            return first
+        key = (level, children)
+        node = self._unique.get(key)
+        if node is None:
+            node = self._unique[key] = Node(level, children, None)
+        return node
+
+    def var(self, name: str) -> Node:
+        """ Returns the diagram which takes the value of a variable.
+
+        Args:
+            name (str): The name of the variable.
+
+        Returns:
+            Node
+        """
+        return self._node(self._level(name), self.terminals)
+
+    def const(self, value: Floatable) -> Node:
+        """ Returns the diagram which always takes a value.
+
+        Args:
+            value (Floatable): A value of the logic system.
+
+        Returns:
+            Node: The terminal node of value.
+
+        Raises:
+            ValueError: If value is not a value of the logic system.
+        """
+        return self.terminals[self.system.index(value, None)]
+
+    def apply(self, op: Callable, *args: Node) -> Node:
+        """ Returns the diagram of op applied to the diagrams args.
+
+        Args:
+            op (Callable): An operator which is closed over the values of the
+                logic system.
+            args (Node): One diagram of this manager per argument of op.
+
+        Returns:
+            Node
+
+        Raises:
+            ValueError: If op returns a value which is not in the logic system,
+                or if the wrong number of arguments are given.
+        """
+        table = self._tables.get(op)
+        if table is None:
+            truth_table = self.system.truth_table(op)
+            table = self._tables[op] = (
+                truth_table.arity, truth_table.table.tolist()
+            )
+        arity, lookup = table
+        if len(args) != arity:
+            raise ValueError('{} takes {} arguments, but {} were given'.format(
+                getattr(op, '__qualname__', op), arity, len(args)
+            ))
+        return self._apply(op, lookup, args)
+
+    def _apply(self, op: Callable, lookup: List, args: Sequence[Node]) -> Node:
+        """ Applies op to args, using the nested list lookup of its truth
+        table. This works through an explicit stack rather than recursing, so
+        diagrams may have more levels than python's recursion limit.
+        """
+        cache = self._cache
+        root = (op, *args)
+        stack: List[Tuple[Tuple, bool]] = [(root, False)]
+        while stack:
+            key, expanded = stack.pop()
+            if not expanded and key in cache:
+                continue
+            args = key[1:]
+
+            levels = [arg.level for arg in args if arg.level is not None]
+            if not levels:
+                table = lookup
+                for arg in args:
+                    table = table[arg.index]
+                cache[key] = self.terminals[table]
+                continue
+
+            level = min(levels)
+            children = [
+                (op, *[
+                    arg.children[index] if arg.level == level else arg
+                    for arg in args
+                ])
+                for index in range(self.system.n_values)
+            ]
+            if expanded:
+                # The children were all applied before this was popped again.
+                cache[key] = self._node(
+                    level, tuple(cache[child] for child in children)
+                )
+            else:
+                stack.append((key, True))
+                stack.extend(
+                    (child, False) for child in children if child not in cache
+                )
+        return cache[root]
+
+    def from_formula(self, formula: Formula) -> Node:
+        """ Returns the diagram of a formula. Its variables are added to the
+        variable order in the order they appear in formula.nodes(), if they are
+        not already in it.
+
+        Args:
+            formula (Formula)
+
+        Returns:
+            Node
+
+        Raises:
+            ValueError: See apply and const.
+        """
+        diagrams: Dict[Formula, Node] = {}
+        for node in formula.nodes():
+            if isinstance(node, Var):
+                diagrams[node] = self.var(node.name)
+            elif isinstance(node, Const):
+                diagrams[node] = self.const(node.value)
+            else:
+                diagrams[node] = self.apply(
+                    node.op, *[diagrams[arg] for arg in node.args]
+                )
+        return diagrams[formula]
+
+    def evaluate(self, node: Node, env: Dict[str, Floatable]) -> LogicValue:
+        """ Returns the value a diagram takes under an assignment.
+
+        Args:
+            node (Node)
+            env (Dict[str, Floatable]): A value for each variable tested by
+                node.
+
+        Returns:
+            LogicValue: A value of the logic system.
+
+        Raises:
+            KeyError: If a variable tested by node is not in env.
+            ValueError: If the value of a variable is not a value of the logic
+                system.
+        """
+        while node.level is not None:
+            value = env[self.order[node.level]]
+            node = node.children[self.system.index(value, None)]
+        return self.system.values[node.index]
+
+    def count(
+        self,
+        node: Node,
+        variables: Optional[Iterable[str]] = None,
+    ) -> Dict[LogicValue, int]:
+        """ Counts the assignments under which a diagram takes each value. This
+        takes time proportional to the size of the diagram, rather than to the
+        number of assignments.
+
+        Args:
+            node (Node)
+            variables (Optional[Iterable[str]]): The variables to assign
+                values to, which must include every variable tested by node.
+                Defaults to every variable in the order. Variables which are
+                not in the order are counted, but not added to it.
+
+        Returns:
+            Dict[LogicValue, int]: The number of assignments for each value of
+                the logic system.
+
+        Raises:
+            ValueError: If node tests a variable which is not in variables.
+        """
+        n_values = self.system.n_values
+        unknown = 0 # The number of variables which no diagram tests yet.
+        if variables is None:
+            levels = list(range(len(self.order)))
+        else:
+            names = set(variables)
+            levels = sorted(
+                self._levels[name] for name in names if name in self._levels
+            )
+            unknown = len(names) - len(levels)
+        # The position of each level among the assigned levels, so the number
+        # of variables skipped between a node and its child is known.
+        position = {level: i for i, level in enumerate(levels)}
+        depth = len(levels)
+
+        def position_of(node: Node) -> int:
+            if node.level is None:
+                return depth
+            if node.level not in position:
+                raise ValueError('The diagram tests {}, which is not one of '
+                    'the variables counted over'.format(self.order[node.level]))
+            return position[node.level]
+
+        counts: Dict[Node, List[int]] = {}
+        for current in self.nodes(node):
+            if current.level is None:
+                result = [0] * n_values
+                result[current.index] = 1
+            else:
+                result = [0] * n_values
+                here = position_of(current)
+                for child in current.children:
+                    scale = n_values ** (position_of(child) - here - 1)
+                    for index, count in enumerate(counts[child]):
+                        result[index] += count * scale
+            counts[current] = result
+
+        scale = n_values ** (position_of(node) + unknown)
+        return {
+            value: count * scale
+            for value, count in zip(self.system.values, counts[node])
+        }
+
+    def count_designated(
+        self,
+        node: Node,
+        variables: Optional[Iterable[str]] = None,
+    ) -> int:
+        """ Counts the assignments under which a diagram takes a designated
+        value (a value which is «true» by its __bool__ method). See count.
+        """
+        return sum(
+            count for value, count in self.count(node, variables).items()
+            if bool(value)
+        )
+
+    def nodes(self, node: Node) -> List[Node]:
+        """ Returns the nodes of a diagram, each once, with every node after
+        its children (so the root is last).
+
+        Args:
+            node (Node)
+
+        Returns:
+            List[Node]
+        """
+        seen = set()
+        ordered: List[Node] = []
+        stack: List[Tuple[Node, bool]] = [(node, False)]
+        while stack:
+            current, expanded = stack.pop()
+            if expanded:
+                ordered.append(current)
+                continue
+            if current in seen:
+                continue
+            seen.add(current)
+            stack.append((current, True))
+            for child in reversed(current.children):
+                if child not in seen:
+                    stack.append((child, False))
+        return ordered
+
+    def size(self, node: Node) -> int:
+        """ Returns the number of nodes (including terminals) in a diagram.
+        """
+        return len(self.nodes(node))
+
+    def variables(self, node: Node) -> List[str]:
+        """ Returns the names of the variables a diagram depends on, in the
+        variable order.
+        """
+        levels = {
+            current.level for current in self.nodes(node)
+            if current.level is not None
+        }
+        return [self.order[level] for level in sorted(levels)]
+
+    def clear_cache(self) -> None:
+        """ Clears the memoized results of apply. The unique table is kept, so
+        diagrams which already exist stay canonical.
+        """
+        self._cache.clear()
+
+
+def equivalent(a: Node, b: Node) -> bool:
+    """ Returns whether two diagrams of the same manager represent the same
+    function. As diagrams are canonical, this is a constant time identity
+    check.
+
+    Args:
+        a (Node)
+        b (Node)
+
+    Returns:
+        bool
+    """
+    return a is b
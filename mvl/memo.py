@@ -0,0 +1,135 @@
+"""
+.. module: memo
+   :synopsis: Bounded, thread safe memoization of operators and formulas.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from collections import OrderedDict, namedtuple
+from functools import update_wrapper
+from threading import Lock
+from typing import Callable, Hashable, Optional, Tuple
+
+# Imports from the local package.
+from mvl.types import Floatable
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+""" Statistics about a Memoized operator, in the same form as those given by
+functools.lru_cache.
+"""
+
+
+class Memoized:
+    """ An operator (or formula, or any other function of truth values) which
+    remembers the results of its most recent calls.
+
+    Arguments are normalized into floats before they are looked up, so equal
+    floats and equal LogicValues (which have the same float representation)
+    share a cache entry. When the cache is full, the least recently used entry
+    is evicted. Calls can be made from several threads at once.
+
+    Arguments which can not be converted into floats (like arrays) are passed
+    straight to the operator, without using the cache.
+
+    Attributes:
+        op (Callable): The memoized operator.
+        maxsize (Optional[int]): The maximum number of results to remember, or
+            None to remember every result.
+        hits (int): The number of calls answered from the cache.
+        misses (int): The number of calls which called the operator.
+    """
+
+    def __init__(self, op: Callable, maxsize: Optional[int] = 1024) -> None:
+        """
+        Raises:
+            ValueError: If maxsize is negative.
+        """
+        if maxsize is not None and maxsize < 0:
+            raise ValueError('maxsize must not be negative')
+        self.op: Callable = op
+        self.maxsize: Optional[int] = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self._cache: OrderedDict = OrderedDict()
+        self._lock: Lock = Lock()
+        update_wrapper(self, op, updated=())
+
+    def __call__(self, *args: Floatable, **kwargs: Floatable) -> float:
+        try:
+            key = _key(args, kwargs)
+        except (TypeError, ValueError):
+            return self.op(*args, **kwargs)
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key]
+            self.misses += 1
+
+        # Call the operator outside of the lock, so that slow operators don't
+        # block other threads.
+        result = self.op(*args, **kwargs)
+
+        with self._lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+        return result
+
+    def cache_info(self) -> CacheInfo:
+        """ Returns:
+            CacheInfo: The hits, misses, maximum size and current size of the
+                cache.
+        """
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.maxsize, len(self._cache)
+            )
+
+    def cache_clear(self) -> None:
+        """ Empties the cache, and resets its statistics.
+        """
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __repr__(self) -> str:
+        return 'Memoized({!r}, maxsize={})'.format(self.op, self.maxsize)
+
+
+def memoize(
+    op: Optional[Callable] = None,
+    maxsize: Optional[int] = 1024,
+) -> Callable:
+    """ Memoizes an operator. Can be called directly, as in
+    memoize(lukasiewicz.implies), or used as a decorator, with or without
+    arguments.
+
+    Args:
+        op (Optional[Callable]): The operator to memoize.
+        maxsize (Optional[int]): See Memoized.
+
+    Returns:
+        Callable: A Memoized operator, or (if op is not given) a decorator
+            which memoizes an operator.
+    """
+    if op is None:
+        return lambda op: Memoized(op, maxsize)
+    return Memoized(op, maxsize)
+
+
+def _key(args: Tuple[Floatable, ...], kwargs: dict) -> Hashable:
+    """ Returns the normalized cache key of a call.
+    """
+    key = tuple(float(arg) for arg in args)
+    if kwargs:
+        key += tuple(
+            (name, float(value)) for name, value in sorted(kwargs.items())
+        )
+    return key
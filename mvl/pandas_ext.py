@@ -0,0 +1,496 @@
+"""
+.. module: pandas_ext
+   :synopsis: A pandas extension dtype for the values of finite logic systems,
+   stored as compact arrays of value indices.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from importlib import import_module
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Type
+import re
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import (
+    ExtensionArray,
+    ExtensionDtype,
+    register_extension_dtype,
+    register_series_accessor,
+    take,
+)
+from pandas.api.indexers import check_array_indexer
+from pandas.api.types import is_scalar, pandas_dtype
+
+# Imports from the local package.
+from mvl.lukasiewicz import (
+    LogicSystem,
+    LogicValue,
+    LukasiewiczLogicValue,
+    PriestLogicValue,
+)
+from mvl.post import PostLukasiewiczLogicValue, PostPriestLogicValue
+from mvl.vectorized.systems import designated, value_array
+
+
+NA_INDEX: int = -1
+""" The index used for missing values.
+"""
+
+LOGIC_VALUE_CLASSES: Dict[str, Type[LogicValue]] = {
+    cls.class_name: cls for cls in [
+        LukasiewiczLogicValue,
+        PriestLogicValue,
+        PostLukasiewiczLogicValue,
+        PostPriestLogicValue,
+    ]
+}
+""" The classes of logic values which LogicDtypes can hold, by their names.
+"""
+
+OPERATORS: Dict[str, Tuple[str, str, str]] = {
+    'bochvar': ('and_', 'or_', 'not_'),
+    'goedel': ('and_', 'or_', 'not_'),
+    'kleene': ('and_', 'or_', 'not_'),
+    'lukasiewicz': ('w_and', 'w_or', 'not_'),
+    'post': ('and_', 'or_', 'not_'),
+    'priest': ('and_', 'or_', 'not_'),
+}
+""" The logics whose operators LogicArrays use for &, | and ~, and the names of
+those operators in the module of each logic.
+"""
+
+_NAME_PATTERN = re.compile(r'^mvl\[(\w+), *(\w+), *(\d+)\]$')
+
+
+@register_extension_dtype
+class LogicDtype(ExtensionDtype):
+    """ The pandas dtype of a column of logic values from a finite LogicSystem.
+
+    The dtype also names the logic whose operators are used for &, | and ~,
+    as several logics (like kleene and bochvar) share a LogicSystem. Its name
+    is 'mvl[logic, class_name, n_values]', as in
+    'mvl[kleene, LukasiewiczLogicValue, 3]', which can be passed as a dtype to
+    pandas functions like Series.astype.
+
+    Attributes:
+        system (LogicSystem): The finite logic system the values belong to.
+        logic (str): The name of the MVL module whose operators are used. One
+            of the keys of OPERATORS.
+    """
+    _metadata = ('system', 'logic')
+
+    def __init__(
+        self,
+        system: LogicSystem,
+        logic: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            system (LogicSystem): The finite logic system the values belong to.
+            logic (Optional[str]): The name of the MVL module whose operators
+                are used. Defaults to 'post' for systems of Post values, and
+                'lukasiewicz' (whose weak operators are also used by kleene
+                and priest) otherwise.
+
+        Raises:
+            ValueError: If logic is not one of the keys of OPERATORS, or the
+                values of system can not be held by a LogicDtype, or logic is
+                'post' and the values of system are not Post values.
+        """
+        if system.logic_value_class not in LOGIC_VALUE_CLASSES.values():
+            raise ValueError('LogicDtypes can not hold {} values'.format(
+                system.logic_value_class.__name__
+            ))
+        is_post = issubclass(system.logic_value_class,
+            (PostLukasiewiczLogicValue, PostPriestLogicValue))
+        if logic is None:
+            logic = 'post' if is_post else 'lukasiewicz'
+        if logic not in OPERATORS:
+            raise ValueError('{} is not one of the logics {}'.format(
+                logic, sorted(OPERATORS)
+            ))
+        if logic == 'post' and not is_post:
+            # The post operators are only defined on Post values.
+            raise ValueError('The post logic needs Post values, not {}'.format(
+                system.logic_value_class.__name__
+            ))
+        self.system: LogicSystem = system
+        self.logic: str = logic
+
+    @property
+    def name(self) -> str:
+        return 'mvl[{}, {}, {}]'.format(
+            self.logic,
+            self.system.logic_value_class.class_name,
+            self.system.n_values,
+        )
+
+    @property
+    def type(self) -> Type[LogicValue]:
+        return self.system.logic_value_class
+
+    @property
+    def kind(self) -> str:
+        return 'O'
+
+    @property
+    def na_value(self) -> Any:
+        return pd.NA
+
+    @property
+    def index_dtype(self) -> np.dtype:
+        """ The smallest signed integer type which can hold every index of the
+        system, and NA_INDEX.
+        """
+        return np.min_scalar_type(-self.system.n_values)
+
+    @classmethod
+    def construct_array_type(cls) -> Type['LogicArray']:
+        return LogicArray
+
+    @classmethod
+    def construct_from_string(cls, string: str) -> 'LogicDtype':
+        """ Returns the dtype with the given name.
+
+        Raises:
+            TypeError: If string is not the name of a LogicDtype.
+        """
+        if not isinstance(string, str):
+            raise TypeError("'construct_from_string' expects a string, got {}"
+                .format(type(string)))
+        match = _NAME_PATTERN.match(string)
+        if match is None or match.group(2) not in LOGIC_VALUE_CLASSES:
+            raise TypeError("Cannot construct a 'LogicDtype' from '{}'"
+                .format(string))
+        logic, class_name, n_values = match.groups()
+        system = LogicSystem(int(n_values), LOGIC_VALUE_CLASSES[class_name])
+        try:
+            return cls(system, logic)
+        except ValueError as error:
+            raise TypeError(str(error)) from error
+
+    def operators(self) -> Tuple[Callable, Callable, Callable]:
+        """ Returns the «and», «or» and «not» operators of the dtype's logic.
+        """
+        module = import_module('mvl.' + self.logic)
+        return tuple(getattr(module, name) for name in OPERATORS[self.logic])
+
+
+class LogicArray(ExtensionArray):
+    """ A pandas extension array of logic values from a finite LogicSystem.
+
+    Values are stored as their indices in the system, in the smallest signed
+    integer type which can hold them (int8 for up to 127 values), with
+    NA_INDEX for missing values. Taking, concatenating, factorizing (and so
+    grouping by) and sorting all work on these indices, rather than on
+    LogicValue objects.
+
+    &, | and ~ apply the operators of the dtype's logic (see LogicDtype) to
+    every element, by looking up the indices in the operator's truth table (see
+    LogicSystem.truth_table). The result is missing wherever an argument is.
+
+    Attributes:
+        indices (np.ndarray): The index of each value, or NA_INDEX where the
+            value is missing.
+    """
+
+    def __init__(
+        self,
+        indices: np.ndarray,
+        dtype: LogicDtype,
+        copy: bool = False,
+    ) -> None:
+        """
+        Args:
+            indices (np.ndarray): The index of each value, or NA_INDEX where
+                the value is missing.
+            dtype (LogicDtype)
+            copy (bool): Whether to copy indices.
+        """
+        self._dtype: LogicDtype = dtype
+        if copy:
+            indices = np.array(indices, dtype=dtype.index_dtype)
+        self.indices: np.ndarray = np.asarray(indices, dtype=dtype.index_dtype)
+
+    @classmethod
+    def _from_sequence(
+        cls,
+        scalars: Sequence[Any],
+        *,
+        dtype: Optional[LogicDtype] = None,
+        copy: bool = False,
+    ) -> 'LogicArray':
+        """ Converts LogicValues, floats or the names of values (like 'True')
+        into a LogicArray. Floats are rounded to the nearest value of the
+        system (see LogicSystem.index), and NA, None and NaN become missing
+        values.
+        """
+        if isinstance(dtype, str):
+            dtype = LogicDtype.construct_from_string(dtype)
+        if isinstance(scalars, LogicArray):
+            if dtype is None or dtype == scalars.dtype:
+                return scalars.copy() if copy else scalars
+            return cls._from_sequence(scalars.to_degrees(), dtype=dtype)
+        if dtype is None:
+            raise ValueError('A LogicDtype is needed to convert values into a '
+                'LogicArray')
+
+        scalars = np.asarray(scalars)
+        missing = pd.isna(scalars)
+        present = scalars[~missing]
+        if present.dtype.kind in 'OUS':
+            names = {
+                value.name: float(value) for value in dtype.system.values
+                if value.name
+            }
+            present = [
+                names.get(scalar, scalar) if isinstance(scalar, str) else scalar
+                for scalar in present.tolist()
+            ]
+        indices = np.full(len(scalars), NA_INDEX, dtype=dtype.index_dtype)
+        indices[~missing] = dtype.system.quantize(
+            np.asarray(present, dtype=float)
+        )
+        return cls(indices, dtype)
+
+    @classmethod
+    def _from_sequence_of_strings(
+        cls,
+        strings: Sequence[str],
+        *,
+        dtype: LogicDtype,
+        copy: bool = False,
+    ) -> 'LogicArray':
+        """ Converts the names of values or strings of floats into a
+        LogicArray. See _from_sequence.
+        """
+        return cls._from_sequence(strings, dtype=dtype)
+
+    @classmethod
+    def _from_factorized(
+        cls,
+        values: np.ndarray,
+        original: 'LogicArray',
+    ) -> 'LogicArray':
+        return cls(values, original.dtype)
+
+    @classmethod
+    def _concat_same_type(
+        cls,
+        to_concat: Sequence['LogicArray'],
+    ) -> 'LogicArray':
+        dtype = to_concat[0].dtype
+        indices = np.concatenate([array.indices for array in to_concat])
+        return cls(indices, dtype)
+
+    @property
+    def dtype(self) -> LogicDtype:
+        return self._dtype
+
+    @property
+    def nbytes(self) -> int:
+        return self.indices.nbytes
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, item: Any) -> Any:
+        if isinstance(item, (int, np.integer)):
+            index = self.indices[item]
+            if index == NA_INDEX:
+                return pd.NA
+            return self.dtype.system.values[index]
+        item = check_array_indexer(self, item)
+        return type(self)(self.indices[item], self.dtype)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        key = check_array_indexer(self, key)
+        if is_scalar(value) or isinstance(value, LogicValue):
+            indices = self._from_sequence([value], dtype=self.dtype).indices[0]
+        else:
+            indices = self._from_sequence(value, dtype=self.dtype).indices
+        self.indices[key] = indices
+
+    def __iter__(self):
+        values = self.dtype.system.values
+        for index in self.indices:
+            yield pd.NA if index == NA_INDEX else values[index]
+
+    def isna(self) -> np.ndarray:
+        return self.indices == NA_INDEX
+
+    def take(
+        self,
+        indices: Sequence[int],
+        *,
+        allow_fill: bool = False,
+        fill_value: Any = None,
+    ) -> 'LogicArray':
+        if allow_fill and fill_value is not None and not pd.isna(fill_value):
+            fill_value = self.dtype.system.index(fill_value)
+        else:
+            fill_value = NA_INDEX
+        taken = take(
+            self.indices, indices, allow_fill=allow_fill, fill_value=fill_value
+        )
+        return type(self)(taken, self.dtype)
+
+    def copy(self) -> 'LogicArray':
+        return type(self)(self.indices, self.dtype, copy=True)
+
+    def _values_for_factorize(self) -> Tuple[np.ndarray, int]:
+        return self.indices, NA_INDEX
+
+    def _values_for_argsort(self) -> np.ndarray:
+        # The values of a system are in order of their indices.
+        return self.indices
+
+    def _formatter(self, boxed: bool = False) -> Callable[[Any], str]:
+        def format_value(value: Any) -> str:
+            if value is pd.NA:
+                return str(value)
+            return value.name or str(float(value))
+        return format_value
+
+    def to_degrees(self) -> np.ndarray:
+        """ Returns:
+            np.ndarray: The float representation of each value, with NaN where
+                the value is missing.
+        """
+        degrees = np.array(
+            [float(value) for value in self.dtype.system.values] + [np.nan]
+        )
+        # NA_INDEX looks up the NaN at the end.
+        return degrees[self.indices]
+
+    def designated(self) -> np.ndarray:
+        """ Returns which values are designated (considered to be «true» by
+        their __bool__ method, like «True» in kleene logic, and «Unknown» too
+        in priest logic). Missing values are not designated.
+
+        Returns:
+            np.ndarray: A boolean array.
+        """
+        return np.append(designated(self.dtype.system), False)[self.indices]
+
+    def __array__(
+        self,
+        dtype: Optional[np.dtype] = None,
+        copy: Optional[bool] = None,
+    ) -> np.ndarray:
+        if dtype is not None and np.dtype(dtype).kind == 'f':
+            return self.to_degrees().astype(dtype)
+        values = np.append(value_array(self.dtype.system), pd.NA)
+        return values[self.indices]
+
+    def astype(self, dtype: Any, copy: bool = True) -> Any:
+        dtype = pandas_dtype(dtype)
+        if isinstance(dtype, LogicDtype):
+            if dtype == self.dtype:
+                return self.copy() if copy else self
+            return self._from_sequence(self.to_degrees(), dtype=dtype)
+        if isinstance(dtype, np.dtype) and dtype.kind == 'f':
+            return self.to_degrees().astype(dtype)
+        return super().astype(dtype, copy=copy)
+
+    def _operand(self, other: Any) -> np.ndarray:
+        """ Returns the indices of the other operand of a binary operator,
+        which may be a LogicArray of the same dtype, or a single value.
+
+        Raises:
+            TypeError: If other is a LogicArray of a different dtype.
+        """
+        if isinstance(other, (pd.Series, pd.Index)):
+            other = other.array
+        if isinstance(other, LogicArray):
+            if other.dtype != self.dtype:
+                raise TypeError('Can not combine {} and {}'.format(
+                    self.dtype, other.dtype
+                ))
+            return other.indices
+        if is_scalar(other) or isinstance(other, LogicValue):
+            other = [other]
+        return self._from_sequence(other, dtype=self.dtype).indices
+
+    def _apply(self, op: Callable, *indices: np.ndarray) -> 'LogicArray':
+        """ Applies op to arrays of indices, by looking them up in its truth
+        table. The result is missing wherever an argument is.
+        """
+        indices = np.broadcast_arrays(*indices)
+        missing = np.logical_or.reduce([i == NA_INDEX for i in indices])
+        table = self.dtype.system.truth_table(op)
+        result = table(*[np.where(missing, 0, i) for i in indices])
+        result = result.astype(self.dtype.index_dtype)
+        result[missing] = NA_INDEX
+        return type(self)(result, self.dtype)
+
+    def __and__(self, other: Any) -> 'LogicArray':
+        and_, _, _ = self.dtype.operators()
+        return self._apply(and_, self.indices, self._operand(other))
+
+    def __rand__(self, other: Any) -> 'LogicArray':
+        and_, _, _ = self.dtype.operators()
+        return self._apply(and_, self._operand(other), self.indices)
+
+    def __or__(self, other: Any) -> 'LogicArray':
+        _, or_, _ = self.dtype.operators()
+        return self._apply(or_, self.indices, self._operand(other))
+
+    def __ror__(self, other: Any) -> 'LogicArray':
+        _, or_, _ = self.dtype.operators()
+        return self._apply(or_, self._operand(other), self.indices)
+
+    def __invert__(self) -> 'LogicArray':
+        _, _, not_ = self.dtype.operators()
+        return self._apply(not_, self.indices)
+
+    def __eq__(self, other: Any) -> np.ndarray:
+        """ Returns where the values are equal, which is False wherever either
+        value is missing.
+        """
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        other = self._operand(other)
+        return (self.indices == other) & (self.indices != NA_INDEX)
+
+    def __ne__(self, other: Any) -> np.ndarray:
+        if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+            return NotImplemented
+        other = self._operand(other)
+        return (self.indices != other) | (self.indices == NA_INDEX)
+
+
+@register_series_accessor('mvl')
+class LogicAccessor:
+    """ The mvl accessor of pandas Series of a LogicDtype, as in
+    series.mvl.designated().
+    """
+
+    def __init__(self, series: pd.Series) -> None:
+        if not isinstance(series.dtype, LogicDtype):
+            raise AttributeError('The mvl accessor is only defined for Series '
+                'of a LogicDtype')
+        self._series: pd.Series = series
+
+    def designated(self) -> pd.Series:
+        """ Returns which values are designated, as a boolean Series which can
+        be used to select rows (as in df[df['column'].mvl.designated()]). See
+        LogicArray.designated.
+        """
+        return pd.Series(
+            self._series.array.designated(),
+            index=self._series.index,
+            name=self._series.name,
+        )
+
+    def degrees(self) -> pd.Series:
+        """ Returns the float representation of each value, with NaN where the
+        value is missing. See LogicArray.to_degrees.
+        """
+        return pd.Series(
+            self._series.array.to_degrees(),
+            index=self._series.index,
+            name=self._series.name,
+        )
@@ -12,16 +12,17 @@ from mvl.lukasiewicz import (
     LukasiewiczLogicValue,
     PriestLogicValue,
 )
-from mvl.goedel import and_, or_
+from mvl.goedel import and_, or_, all_, any_
 
 
 class PostLukasiewiczLogicValue(LukasiewiczLogicValue):
+    __slots__ = ('index', 'max_index')
     class_name: str = 'PostLukasiewiczLogicValue'
 
     def __init__(self, index: int, max_index: int) -> None:
         self.index = index
         self.max_index = max_index
-        self.val = index / max_index
+        super().__init__(index / max_index)
 
     @classmethod
     def from_frac(cls, index: int, max_index: int) -> None:
@@ -29,12 +30,13 @@ class PostLukasiewiczLogicValue(LukasiewiczLogicValue):
 
 
 class PostPriestLogicValue(PriestLogicValue):
+    __slots__ = ('index', 'max_index')
     class_name: str = 'PostPriestLogicValue'
 
     def __init__(self, index: int, max_index: int) -> None:
         self.index = index
         self.max_index = max_index
-        self.val = index / max_index
+        super().__init__(index / max_index)
 
     @classmethod
     def from_frac(cls, index: int, max_index: int) -> None:
@@ -64,7 +66,9 @@ def not_(a: LogicValue) -> float:
     Returns:
         LogicValue: ! a
     """
-    if a == 0:
+    if a.index == 0:
         return 1
-    return float(a) - (1 / a.max_index)
+    # Computed from the index, so the result is exactly the float of the value
+    # below a (unlike float(a) - 1 / a.max_index).
+    return (a.index - 1) / a.max_index
 
@@ -7,7 +7,9 @@
 
 # Imports from the local package.
 from mvl.lukasiewicz import PriestLogicValue, LogicSystem
-from mvl.tvl_operators import not_, and_, or_, iff, xor, implies
+from mvl.tvl_operators import (
+    not_, and_, or_, iff, xor, implies, all_, any_
+)
 
 priest: LogicSystem = LogicSystem(3, PriestLogicValue)
 """ A 3 valued LogicSystem which uses the values «False»; «Unknown»; and «True».
@@ -5,6 +5,10 @@
 .. moduleauthor: Andrew J. Young
 """
 
+from math import exp, inf, log
+from typing import Iterable
+
+from mvl.reductions import fold
 from mvl.types import Floatable
 from mvl.lukasiewicz import (
     LogicValue,
@@ -20,6 +24,9 @@ def mult(a: Floatable, b: Floatable) -> float:
 
     a * b := ab
 
+    Unlike the other operators, this does not convert its arguments into
+    floats, so it works elementwise on numpy arrays, but not on LogicValues.
+
     Args:
         a (LogicValue)
         b (LogicValue)
@@ -43,6 +50,8 @@ def implies(a: Floatable, b: Floatable) -> float:
     Returns:
         LogicValue: a * b
     """
+    a = float(a)
+    b = float(b)
     if a > b:
         return b / a
     return 1
@@ -62,6 +71,7 @@ def not_(a: Floatable) -> float:
     Returns:
         LogicValue: ! a (≡ a → b)
     """
+    a = float(a)
     return float(a == 0)
 
 def and_(a: Floatable, b: Floatable) -> float:
@@ -77,5 +87,147 @@ def and_(a: Floatable, b: Floatable) -> float:
     Returns:
         LogicValue: a & b (≡ a * (a → b))
     """
-    return mult(a, implies(a, b))
+    return mult(float(a), implies(a, b))
+
+
+def mult_all(values: Iterable[Floatable]) -> float:
+    """ The product logic «conjunction» (*) of any number of values (their
+    product), stopping as soon as the result is 0. Gives 1 for no values.
+
+    Args:
+        values (Iterable[LogicValue])
+
+    Returns:
+        LogicValue: a * b * ...
+    """
+    return fold(mult, values, 1, 0)
+
+
+def all_(values: Iterable[Floatable]) -> float:
+    """ The product logic «conjunction» (&) of any number of values, stopping
+    as soon as the result is 0. Gives 1 for no values.
+
+    Args:
+        values (Iterable[LogicValue])
+
+    Returns:
+        LogicValue: a & b & ...
+    """
+    return fold(and_, values, 1, 0)
+
+
+## Begin log space operators ###################################################
+#
+# Long chains of products of small truth degrees underflow to 0.0. In log space,
+# a truth degree a is represented by log(a) (which is in the range [-inf, 0],
+# with 0 represented by -inf), products become sums, and quotients become
+# differences, so chains of hundreds of operators stay exact to within rounding.
+
+def to_log(a: Floatable) -> float:
+    """ Converts a truth degree into log space.
+
+    Args:
+        a (LogicValue)
+
+    Returns:
+        float: log(a), or -inf if a is 0.
+
+    Raises:
+        ValueError: If a is negative.
+    """
+    a = float(a)
+    if a < 0:
+        raise ValueError('{} is not a truth degree'.format(a))
+    return log(a) if a > 0 else -inf
+
+def from_log(a: float) -> float:
+    """ Converts a truth degree in log space back into a truth degree.
+
+    Args:
+        a (float): A truth degree in log space.
+
+    Returns:
+        float: exp(a)
+    """
+    return exp(a)
+
+def log_mult(a: float, b: float) -> float:
+    """ The product logic «conjunction» operator (*) in log space. See mult.
+
+    Args:
+        a (float): A truth degree in log space.
+        b (float): A truth degree in log space.
+
+    Returns:
+        float: log(exp(a) * exp(b)) (≡ a + b)
+    """
+    return a + b
+
+def log_implies(a: float, b: float) -> float:
+    """ The product logic «implies» operator (→) in log space, as a difference
+    of logs. See implies.
+
+    Args:
+        a (float): A truth degree in log space.
+        b (float): A truth degree in log space.
+
+    Returns:
+        float: log(exp(a) → exp(b)) (≡ b - a if a > b, and 0 otherwise)
+    """
+    if a > b:
+        return b - a
+    return 0.0
+
+def log_not(a: float) -> float:
+    """ The product logic «not» operator (!) in log space. See not_.
+
+    Args:
+        a (float): A truth degree in log space.
+
+    Returns:
+        float: log(! exp(a)) (≡ 0 if a is -inf, and -inf otherwise)
+    """
+    return 0.0 if a == -inf else -inf
+
+def log_and(a: float, b: float) -> float:
+    """ The product logic «conjunction» operator (&) in log space. See and_.
+
+    As a * (a → b) is the smaller of a and b, this is computed as min(a, b),
+    which is exact.
+
+    Args:
+        a (float): A truth degree in log space.
+        b (float): A truth degree in log space.
+
+    Returns:
+        float: log(exp(a) & exp(b)) (≡ min(a, b))
+    """
+    return min(a, b)
+
+def log_mult_all(values: Iterable[float]) -> float:
+    """ The product logic «conjunction» (*) of any number of values in log space
+    (their sum), stopping as soon as the result is -inf. Gives 0 (the log of 1)
+    for no values. See mult_all.
+
+    Args:
+        values (Iterable[float]): Truth degrees in log space.
+
+    Returns:
+        float: a * b * ... in log space.
+    """
+    return fold(log_mult, values, 0.0, -inf)
+
+def log_all(values: Iterable[float]) -> float:
+    """ The product logic «conjunction» (&) of any number of values in log
+    space, stopping as soon as the result is -inf. Gives 0 (the log of 1) for
+    no values. See all_.
+
+    Args:
+        values (Iterable[float]): Truth degrees in log space.
+
+    Returns:
+        float: a & b & ... in log space.
+    """
+    return fold(log_and, values, 0.0, -inf)
 
+################################################### End log space operators ##
@@ -0,0 +1,46 @@
+"""
+.. module: reductions
+   :synopsis: Folds binary operators over any number of values, stopping early
+   once the result can no longer change.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from typing import Callable, Iterable, Optional
+
+# Imports from the local package.
+from mvl.types import Floatable
+
+
+def fold(
+    op: Callable[[Floatable, Floatable], float],
+    values: Iterable[Floatable],
+    identity: Floatable,
+    absorbing: Optional[Floatable] = None,
+) -> float:
+    """ Applies a binary operator to every value in turn, as in
+    op(op(op(identity, a), b), c).
+
+    If the result becomes equal to the operator's absorbing element (like 0 for
+    a conjunction), it can not change any more, so the remaining values are
+    not read.
+
+    Args:
+        op (Callable[[Floatable, Floatable], float]): An associative binary
+            operator.
+        values (Iterable[Floatable]): The values to combine.
+        identity (Floatable): The identity element of op, which is returned if
+            values is empty.
+        absorbing (Optional[Floatable]): The absorbing element of op, if it has
+            one.
+
+    Returns:
+        float: The combination of every value.
+    """
+    result = float(identity)
+    for value in values:
+        result = op(result, value)
+        if absorbing is not None and result == absorbing:
+            break
+    return float(result)
@@ -0,0 +1,257 @@
+"""
+.. module: sat
+   :synopsis: A search based solver, which finds assignments under which a
+   formula over a finite logic system takes a designated value.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from itertools import product as cartesian_product
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Imports from the local package.
+from mvl.formula import Apply, Const, Formula, Var
+from mvl.lukasiewicz import LogicSystem, LogicValue
+from mvl.validity import Assignment
+
+
+Domains = List[int]
+""" A type defining the set of values each node of a formula can still take, as
+a bitmask over the indices of the values of a logic system.
+"""
+
+
+class Solver:
+    """ Finds assignments under which a formula takes one of a set of values.
+
+    The search works like DPLL. Each variable (and each subformula) has a domain
+    of values it can still take. Propagation narrows these domains until
+    nothing changes: each subformula's domain is narrowed to the values its
+    operator can produce from its arguments' domains, and each argument's domain
+    is narrowed to the values which can still produce one of its subformula's
+    values. This is where absorbing and identity elements come in: once an
+    argument of goedel.and_ is known to be 0, the result is known to be 0, and
+    if the result must be 1, both arguments must be 1. When every domain is
+    consistent, the solver picks the unassigned variable with the fewest values
+    left and tries each of them. If a value leads to a conflict (an empty
+    domain), it is removed from that variable's domain, which is then propagated
+    before trying the next value.
+
+    Backtracking is chronological: conflicts are not analysed, and no clauses
+    are learned from them (as they would be by a CDCL solver), so the solver
+    can meet the same conflict again in a different branch of the search.
+
+    Attributes:
+        formula (Formula): The formula to solve.
+        system (LogicSystem): The finite logic system the variables take values
+            from.
+        decisions (int): The number of values tried so far.
+        conflicts (int): The number of conflicts found so far.
+    """
+
+    def __init__(self, formula: Formula, system: LogicSystem) -> None:
+        self.formula: Formula = formula
+        self.system: LogicSystem = system
+        self.decisions: int = 0
+        self.conflicts: int = 0
+
+        self._nodes: List[Formula] = formula.nodes()
+        position = {node: i for i, node in enumerate(self._nodes)}
+        self._args: List[Tuple[int, ...]] = [
+            tuple(position[arg] for arg in node.args)
+            if isinstance(node, Apply) else ()
+            for node in self._nodes
+        ]
+        self._tables: List[Optional[Dict[Tuple[int, ...], int]]] = [
+            self._table(node) if isinstance(node, Apply) else None
+            for node in self._nodes
+        ]
+        self._variables: Dict[str, int] = {
+            node.name: i for i, node in enumerate(self._nodes)
+            if isinstance(node, Var)
+        }
+        self._cache: Dict[Tuple, Tuple[int, Tuple[int, ...]]] = {}
+
+    def _table(self, node: Apply) -> Dict[Tuple[int, ...], int]:
+        """ Returns the truth table of a node's operator, as a dict from the
+        indices of its arguments to the index of its result.
+        """
+        table = self.system.truth_table(node.op)
+        return {
+            indices: int(table.table[indices])
+            for indices in cartesian_product(
+                range(self.system.n_values), repeat=table.arity
+            )
+        }
+
+    def solve(
+        self,
+        targets: Optional[Iterable[LogicValue]] = None,
+    ) -> Optional[Assignment]:
+        """ Finds an assignment under which the formula takes one of the target
+        values.
+
+        Args:
+            targets (Optional[Iterable[LogicValue]]): The values the formula
+                should take. Defaults to the designated values of the system
+                (the values which are «true» by their __bool__ method).
+
+        Returns:
+            Optional[Assignment]: The assignment, or None if there isn't one.
+
+        Raises:
+            ValueError: If a constant of the formula, or a target, is not a
+                value of the system.
+        """
+        values = self.system.values
+        if targets is None:
+            targets = [value for value in values if bool(value)]
+
+        everything = (1 << self.system.n_values) - 1
+        domains = [everything] * len(self._nodes)
+        for i, node in enumerate(self._nodes):
+            if isinstance(node, Const):
+                domains[i] = 1 << self.system.index(node.value, None)
+        domains[-1] &= _mask(
+            self.system.index(value, None) for value in targets
+        )
+        # Propagation only checks the domains of operators, so a formula which
+        # is a constant (or a variable) is checked here.
+        if not domains[-1]:
+            return None
+
+        found = self._search(domains)
+        if found is None:
+            return None
+        return {
+            name: values[found[i].bit_length() - 1]
+            for name, i in self._variables.items()
+        }
+
+    def _search(self, domains: Domains) -> Optional[Domains]:
+        """ Propagates domains, and then searches for an assignment of the
+        remaining variables. Returns the domains of a solution, or None.
+        """
+        if not self._propagate(domains):
+            self.conflicts += 1
+            return None
+
+        unassigned = [
+            i for i in self._variables.values() if domains[i] & domains[i] - 1
+        ]
+        if not unassigned:
+            return domains
+
+        variable = min(unassigned, key=lambda i: bin(domains[i]).count('1'))
+        while domains[variable]:
+            bit = domains[variable] & -domains[variable] # The lowest value.
+            self.decisions += 1
+
+            attempt = list(domains)
+            attempt[variable] = bit
+            found = self._search(attempt)
+            if found is not None:
+                return found
+
+            # The value led to a conflict, so rule it out and propagate that.
+            domains[variable] &= ~bit
+            if not self._propagate(domains):
+                self.conflicts += 1
+                return None
+        return None
+
+    def _propagate(self, domains: Domains) -> bool:
+        """ Narrows domains (in place) until no domain changes. Returns False
+        iff some domain became empty.
+        """
+        changed = True
+        while changed:
+            changed = False
+            for i in range(len(self._nodes)):
+                args = self._args[i]
+                if not args:
+                    continue
+                result, supports = self._narrow(
+                    i, domains[i], tuple(domains[arg] for arg in args)
+                )
+                if result != domains[i]:
+                    domains[i] = result
+                    changed = True
+                for arg, support in zip(args, supports):
+                    if support != domains[arg]:
+                        domains[arg] = support
+                        changed = True
+                if not result:
+                    return False
+        return True
+
+    def _narrow(
+        self,
+        node: int,
+        domain: int,
+        arg_domains: Tuple[int, ...],
+    ) -> Tuple[int, Tuple[int, ...]]:
+        """ Returns the values a node can take given the domains of its
+        arguments, and the values of each argument which can produce one of
+        them.
+        """
+        key = (node, domain, arg_domains)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        table = self._tables[node]
+        result = 0
+        supports = [0] * len(arg_domains)
+        for indices in cartesian_product(*[_bits(d) for d in arg_domains]):
+            bit = 1 << table[indices]
+            if bit & domain:
+                result |= bit
+                for k, index in enumerate(indices):
+                    supports[k] |= 1 << index
+
+        narrowed = (result, tuple(supports))
+        self._cache[key] = narrowed
+        return narrowed
+
+
+def solve(
+    formula: Formula,
+    system: LogicSystem,
+    targets: Optional[Iterable[LogicValue]] = None,
+) -> Optional[Assignment]:
+    """ Finds an assignment under which formula takes a designated value (or one
+    of the target values). See Solver.
+
+    Args:
+        formula (Formula): The formula to solve.
+        system (LogicSystem): The finite logic system the variables take values
+            from.
+        targets (Optional[Iterable[LogicValue]]): See Solver.solve.
+
+    Returns:
+        Optional[Assignment]: The assignment, or None if there isn't one.
+    """
+    return Solver(formula, system).solve(targets)
+
+
+def is_satisfiable(formula: Formula, system: LogicSystem) -> bool:
+    """ Returns whether formula can take a designated value. See solve.
+    """
+    return solve(formula, system) is not None
+
+
+def _mask(indices: Iterable[int]) -> int:
+    """ Returns the bitmask of a set of value indices.
+    """
+    mask = 0
+    for index in indices:
+        mask |= 1 << index
+    return mask
+
+
+def _bits(mask: int) -> List[int]:
+    """ Returns the value indices in a bitmask.
+    """
+    return [index for index in range(mask.bit_length()) if mask >> index & 1]
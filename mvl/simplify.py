@@ -0,0 +1,119 @@
+"""
+.. module: simplify
+   :synopsis: Rewrites formulas into smaller, equivalent formulas, using the
+   algebraic properties of the operators provided by MVL, constant folding,
+   and the values of any variables which are already known.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from typing import Callable, Dict, Mapping, Optional, Sequence
+
+# Imports from the local package.
+from mvl.algebra import (
+    is_idempotent,
+    is_involution,
+    left_absorbing,
+    left_identity,
+    right_absorbing,
+    right_identity,
+)
+from mvl.formula import Apply, Const, Formula, Var
+from mvl.types import Floatable
+
+
+def simplify(
+    formula: Formula,
+    env: Optional[Mapping[str, Floatable]] = None,
+) -> Formula:
+    """ Returns a simpler formula, which takes the same value as formula under
+    every assignment (that agrees with env).
+
+    Subformulas are simplified from the bottom up, using these rules:
+
+    - Variables in env are replaced with their values (partial evaluation).
+    - Operators whose arguments are all constants are evaluated (constant
+      folding).
+    - An absorbing argument decides the result, as in goedel.and_(0, x) → 0 or
+      bochvar.or_(u, x) → u. See mvl.algebra.LEFT_ABSORBING.
+    - An identity argument is dropped, as in lukasiewicz.w_and(x, 1) → x or
+      goedel.or_(x, 0) → x. See mvl.algebra.LEFT_IDENTITY.
+    - Idempotent operators of equal arguments are dropped, as in
+      goedel.and_(x, x) → x. See mvl.algebra.IDEMPOTENT.
+    - Double negations are dropped, as in lukasiewicz.not_(lukasiewicz.not_(x))
+      → x. See mvl.algebra.INVOLUTIONS.
+
+    Each rule is only applied to the operators it holds for, so for example
+    goedel.not_(goedel.not_(x)) is left alone. The simplified formula gives the
+    same values as formula, up to rounding (1 - (1 - 0.1) is not exactly 0.1),
+    though values which are passed straight through (like x in w_and(x, 1))
+    are no longer converted into floats first.
+
+    Args:
+        formula (Formula): The formula to simplify.
+        env (Optional[Mapping[str, Floatable]]): The values of any variables
+            which are already known.
+
+    Returns:
+        Formula: The simplified formula.
+    """
+    env = env or {}
+    simplified: Dict[Formula, Formula] = {}
+    for node in formula.nodes():
+        if isinstance(node, Var):
+            if node.name in env:
+                simplified[node] = Const(env[node.name])
+            else:
+                simplified[node] = node
+        elif isinstance(node, Const):
+            simplified[node] = node
+        else:
+            simplified[node] = _simplify_apply(
+                node.op, [simplified[arg] for arg in node.args]
+            )
+    return simplified[formula]
+
+
+def _simplify_apply(op: Callable, args: Sequence[Formula]) -> Formula:
+    """ Simplifies op applied to args, which are already simplified.
+    """
+    if all(isinstance(arg, Const) for arg in args):
+        folded = _fold(op, args)
+        if folded is not None:
+            return folded
+
+    if len(args) == 1:
+        arg = args[0]
+        if is_involution(op) and isinstance(arg, Apply) and arg.op is op:
+            return arg.args[0]
+
+    if len(args) == 2:
+        a, b = args
+        if isinstance(a, Const):
+            result = left_absorbing(op).get(float(a.value))
+            if result is not None:
+                return Const(result)
+            if left_identity(op) == float(a.value):
+                return b
+        if isinstance(b, Const):
+            result = right_absorbing(op).get(float(b.value))
+            if result is not None:
+                return Const(result)
+            if right_identity(op) == float(b.value):
+                return a
+        if a == b and is_idempotent(op):
+            return a
+
+    return Apply(op, *args)
+
+
+def _fold(op: Callable, args: Sequence[Const]) -> Optional[Const]:
+    """ Evaluates op on constant arguments. Returns None if op can not be
+    evaluated on them (like post.not_ on a float), so the error is raised when
+    the formula is evaluated instead.
+    """
+    try:
+        return Const(float(op(*[arg.value for arg in args])))
+    except (AttributeError, TypeError, ValueError, ZeroDivisionError):
+        return None
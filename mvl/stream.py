@@ -0,0 +1,159 @@
+"""
+.. module: stream
+   :synopsis: Lazily filters streams of rows (such as the lines of CSV or JSON
+   lines files) using formulas in 3 valued logic, treating missing fields as
+   «Unknown», in the way SQL treats NULL.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from csv import DictReader
+from itertools import islice
+from json import loads
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.formula import Formula
+from mvl.lukasiewicz import LogicSystem
+from mvl.vectorized.formula import evaluate_degrees
+from mvl.vectorized.lukasiewicz import bool_for
+import mvl.kleene as kleene
+
+
+Row = Mapping[str, Any]
+""" A type defining a single row of a stream, mapping field names to values.
+"""
+
+DEFAULT_BATCH_SIZE: int = 4096
+""" The number of rows which are evaluated at once.
+"""
+
+_STRINGS: Dict[str, float] = {
+    '': float(kleene.u),
+    'null': float(kleene.u),
+    'none': float(kleene.u),
+    'nan': float(kleene.u),
+    'unknown': float(kleene.u),
+    'u': float(kleene.u),
+    'true': float(kleene.t),
+    't': float(kleene.t),
+    'yes': float(kleene.t),
+    'false': float(kleene.f),
+    'f': float(kleene.f),
+    'no': float(kleene.f),
+}
+
+
+def to_degree(value: Any) -> float:
+    """ Converts the value of a field into a truth degree.
+
+    Missing values (None, and strings like '' or 'NULL') become kleene.u. Bools
+    become kleene.t or kleene.f. Strings like 'true' or 'false' are read as
+    bools, and any other value is converted with float().
+
+    Args:
+        value (Any): The value of a field.
+
+    Returns:
+        float: The truth degree of the value.
+
+    Raises:
+        ValueError: If value can not be converted.
+    """
+    if value is None:
+        return float(kleene.u)
+    if isinstance(value, str):
+        degree = _STRINGS.get(value.strip().lower())
+        if degree is not None:
+            return degree
+    return float(value)
+
+
+def filter_rows(
+    rows: Iterable[Row],
+    predicate: Formula,
+    system: LogicSystem = kleene.kleene,
+    fields: Optional[Mapping[str, str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[Row]:
+    """ Yields the rows for which predicate takes a designated value.
+
+    Rows are read lazily, and evaluated in batches of batch_size rows using the
+    array versions of the predicate's operators, so memory use does not depend
+    on the number of rows.
+
+    Args:
+        rows (Iterable[Row]): The rows to filter.
+        predicate (Formula): A formula whose variables are the fields of the
+            rows. Fields which are missing from a row are treated as
+            kleene.u. See to_degree for how the values of fields are read.
+        system (LogicSystem): The logic system whose values decide which
+            results are designated. Defaults to kleene.kleene, where only
+            «True» is designated. Use priest.priest to also keep rows which
+            evaluate to «Unknown».
+        fields (Optional[Mapping[str, str]]): The field read for each variable
+            of predicate, for fields whose names can not be variable names.
+            Defaults to the name of the variable.
+        batch_size (int): The number of rows to evaluate at once.
+
+    Returns:
+        Iterator[Row]: The rows which pass the filter, in order.
+    """
+    fields = dict(fields or {})
+    variables = {
+        name: fields.get(name, name) for name in predicate.variables
+    }
+    is_designated = bool_for(system.logic_value_class)
+
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        env = {
+            name: np.fromiter(
+                (to_degree(row.get(field)) for row in batch),
+                dtype=float,
+                count=len(batch),
+            )
+            for name, field in variables.items()
+        }
+        results = np.broadcast_to(
+            is_designated(evaluate_degrees(predicate, env)), (len(batch),)
+        )
+        for row, keep in zip(batch, results):
+            if keep:
+                yield row
+
+
+def read_csv(path: str, **kwargs: Any) -> Iterator[Dict[str, str]]:
+    """ Lazily reads the rows of a CSV file with a header line.
+
+    Args:
+        path (str): The path of the file.
+        kwargs (Any): Passed on to csv.DictReader.
+
+    Returns:
+        Iterator[Dict[str, str]]: The rows of the file.
+    """
+    with open(path, newline='') as file:
+        yield from DictReader(file, **kwargs)
+
+
+def read_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """ Lazily reads the rows of a JSON lines file, where each line holds one
+    JSON object. Blank lines are skipped.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        Iterator[Dict[str, Any]]: The rows of the file.
+    """
+    with open(path) as file:
+        for line in file:
+            if line.strip():
+                yield loads(line)
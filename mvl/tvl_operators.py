@@ -11,6 +11,8 @@ from mvl.types import Floatable
 from mvl.lukasiewicz import not_
 from mvl.lukasiewicz import w_and as and_
 from mvl.lukasiewicz import w_or as or_
+from mvl.lukasiewicz import w_all as all_
+from mvl.lukasiewicz import w_any as any_
 
 def iff(a: Floatable, b: Floatable) -> float:
     """
@@ -0,0 +1,255 @@
+"""
+.. module: validity
+   :synopsis: Checks whether formulas over finite logic systems are tautologies
+   or contradictions, and whether formulas are equivalent, by enumerating every
+   assignment of values to their variables.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from os import cpu_count
+from typing import Deque, Dict, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.formula import Formula
+from mvl.lukasiewicz import LogicSystem, LogicValue
+from mvl.vectorized.systems import designated, evaluate_indices
+
+
+DEFAULT_CHUNK_SIZE: int = 1 << 16
+""" The number of assignments checked at once, in a single vectorized pass.
+"""
+
+Assignment = Dict[str, LogicValue]
+""" A type defining a value for each variable of a formula.
+"""
+
+_UNDESIGNATED: str = 'undesignated'
+_DESIGNATED: str = 'designated'
+_DIFFERENT: str = 'different'
+
+
+def find_counterexample(
+    formula: Formula,
+    system: LogicSystem,
+    processes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Optional[Assignment]:
+    """ Finds an assignment under which formula does not take a designated
+    value (a value which is «true» by its __bool__ method).
+
+    Assignments are checked in order (with the last variable changing fastest),
+    and the first counterexample is returned.
+
+    Args:
+        formula (Formula): The formula to check. Its operators must be
+            picklable (so not lambdas) if more than one process is used.
+        system (LogicSystem): The finite logic system the variables take values
+            from.
+        processes (Optional[int]): The number of processes to check chunks of
+            assignments in. Defaults to the number of CPUs. If this is 1, or
+            every assignment fits in one chunk, no processes are started.
+        chunk_size (int): The number of assignments to check at once.
+
+    Returns:
+        Optional[Assignment]: The first counterexample, or None if formula is
+            a tautology.
+    """
+    return _search((formula,), system, _UNDESIGNATED, processes, chunk_size)
+
+
+def is_tautology(
+    formula: Formula,
+    system: LogicSystem,
+    processes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> bool:
+    """ Returns whether formula takes a designated value under every assignment.
+    See find_counterexample.
+    """
+    return find_counterexample(formula, system, processes, chunk_size) is None
+
+
+def find_model(
+    formula: Formula,
+    system: LogicSystem,
+    processes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Optional[Assignment]:
+    """ Finds the first assignment under which formula takes a designated value.
+    See find_counterexample.
+
+    Returns:
+        Optional[Assignment]: The first model, or None if formula is a
+            contradiction.
+    """
+    return _search((formula,), system, _DESIGNATED, processes, chunk_size)
+
+
+def is_contradiction(
+    formula: Formula,
+    system: LogicSystem,
+    processes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> bool:
+    """ Returns whether formula never takes a designated value. See
+    find_counterexample.
+    """
+    return find_model(formula, system, processes, chunk_size) is None
+
+
+def find_difference(
+    a: Formula,
+    b: Formula,
+    system: LogicSystem,
+    processes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Optional[Assignment]:
+    """ Finds the first assignment (of the variables of both formulas) under
+    which a and b take different values. See find_counterexample.
+
+    Returns:
+        Optional[Assignment]: The first counterexample, or None if a and b are
+            equivalent.
+    """
+    return _search((a, b), system, _DIFFERENT, processes, chunk_size)
+
+
+def are_equivalent(
+    a: Formula,
+    b: Formula,
+    system: LogicSystem,
+    processes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> bool:
+    """ Returns whether a and b take the same value under every assignment. See
+    find_counterexample.
+    """
+    return find_difference(a, b, system, processes, chunk_size) is None
+
+
+def _variables(formulas: Sequence[Formula]) -> Tuple[str, ...]:
+    """ Returns the variables of every formula, in the order they first appear.
+    """
+    names: Dict[str, None] = {}
+    for formula in formulas:
+        for name in formula.variables:
+            names.setdefault(name)
+    return tuple(names)
+
+
+def _chunks(total: int, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    """ Splits the range [0, total) into (start, stop) chunks.
+    """
+    for start in range(0, total, chunk_size):
+        yield start, min(start + chunk_size, total)
+
+
+def _search(
+    formulas: Tuple[Formula, ...],
+    system: LogicSystem,
+    kind: str,
+    processes: Optional[int],
+    chunk_size: int,
+) -> Optional[Assignment]:
+    """ Finds the first assignment which satisfies the condition given by kind,
+    checking chunks of assignments in parallel.
+    """
+    variables = _variables(formulas)
+    total = system.n_values ** len(variables)
+    if total > np.iinfo(np.int64).max:
+        raise ValueError('{} variables over {} values is too many to enumerate'
+            .format(len(variables), system.n_values))
+
+    if processes is None:
+        processes = cpu_count() or 1
+    chunks = _chunks(total, chunk_size)
+
+    if processes <= 1 or total <= chunk_size:
+        for start, stop in chunks:
+            found = _search_chunk(formulas, system, kind, variables, start, stop)
+            if found is not None:
+                return _assignment(system, variables, found)
+        return None
+
+    # Keep a bounded number of chunks in flight, and check their results in
+    # order, so that the first counterexample is always the one returned.
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending: Deque[Future] = deque()
+        found = None
+        for start, stop in chunks:
+            pending.append(executor.submit(
+                _search_chunk, formulas, system, kind, variables, start, stop
+            ))
+            if len(pending) >= 2 * processes:
+                found = pending.popleft().result()
+                if found is not None:
+                    break
+        while found is None and pending:
+            found = pending.popleft().result()
+        for future in pending:
+            future.cancel()
+
+    if found is None:
+        return None
+    return _assignment(system, variables, found)
+
+
+def _search_chunk(
+    formulas: Tuple[Formula, ...],
+    system: LogicSystem,
+    kind: str,
+    variables: Tuple[str, ...],
+    start: int,
+    stop: int,
+) -> Optional[int]:
+    """ Checks the assignments numbered [start, stop), and returns the number of
+    the first one which satisfies the condition given by kind, if any.
+    """
+    numbers = np.arange(start, stop, dtype=np.int64)
+    env = {
+        name: digits for name, digits in zip(
+            variables, _digits(numbers, system.n_values, len(variables))
+        )
+    }
+    results = [evaluate_indices(formula, system, env) for formula in formulas]
+
+    if kind == _DIFFERENT:
+        hits = np.broadcast_to(results[0] != results[1], numbers.shape)
+    else:
+        hits = designated(system)[results[0]]
+        if kind == _UNDESIGNATED:
+            hits = ~hits
+        hits = np.broadcast_to(hits, numbers.shape)
+
+    hit_indices = np.flatnonzero(hits)
+    if len(hit_indices) == 0:
+        return None
+    return int(numbers[hit_indices[0]])
+
+
+def _digits(numbers: np.ndarray, base: int, n_digits: int) -> Iterator[np.ndarray]:
+    """ Splits each number into n_digits digits in the given base, most
+    significant first.
+    """
+    for power in reversed(range(n_digits)):
+        yield (numbers // base ** power) % base
+
+
+def _assignment(
+    system: LogicSystem,
+    variables: Tuple[str, ...],
+    number: int,
+) -> Assignment:
+    """ Returns the assignment with the given number.
+    """
+    digits = _digits(np.array([number]), system.n_values, len(variables))
+    return {
+        name: system.values[int(digit[0])]
+        for name, digit in zip(variables, digits)
+    }
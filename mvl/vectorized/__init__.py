@@ -0,0 +1,35 @@
+"""
+.. module: vectorized
+   :synopsis: Array versions of the operators provided by MVL. Each module in
+   this package mirrors the module of the same name in the mvl package, but its
+   operators take arrays (or anything numpy can turn into an array) of truth
+   degrees, broadcast them against each other, and return an array.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from typing import Sequence, Union
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.types import Floatable
+
+
+ArrayLike = Union[np.ndarray, Sequence[Floatable], Floatable]
+""" A type defining all objects which can be converted into an array of truth
+degrees. This includes LogicValues, and sequences of LogicValues.
+"""
+
+
+def as_degrees(a: ArrayLike) -> np.ndarray:
+    """ Converts a into an array of truth degrees (floats).
+
+    Args:
+        a (ArrayLike): The values to convert.
+
+    Returns:
+        np.ndarray: The float representation of every value in a.
+    """
+    return np.asarray(a, dtype=float)
@@ -0,0 +1,277 @@
+"""
+.. module: vectorized.belnap
+   :synopsis: A compact array type for Belnap's 4 valued logic, and Belnap's
+   operators over it.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from typing import Iterable, Tuple
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.belnap import BelnapValue, values
+from mvl.vectorized.packed import PackedTVL, _pack, _popcount, _unpack
+
+
+class PackedBelnap:
+    """ An array of Belnap values, stored as 2 bit-planes.
+
+    Each value is stored as its 2 bits, one in each plane: whether it has been
+    told to be true, and whether it has been told to be false (see
+    mvl.belnap.BelnapValue). The planes are stored as arrays of 64 bit words,
+    like those of PackedTVL, so every operator in this module acts on 64
+    values at once, using one or two bitwise operations per plane.
+
+    Attributes:
+        true (np.ndarray): The plane of bits which are set where the value has
+            been told to be true (t or b), as an array of np.uint64 words.
+        false (np.ndarray): The plane of bits which are set where the value has
+            been told to be false (f or b), as an array of np.uint64 words.
+        length (int): The number of values in the array. Bits beyond length in
+            the last word are never set in either plane.
+    """
+
+    def __init__(self, true: np.ndarray, false: np.ndarray, length: int) -> None:
+        self.true: np.ndarray = true
+        self.false: np.ndarray = false
+        self.length: int = length
+
+    @classmethod
+    def from_bools(
+        cls,
+        told_true: np.ndarray,
+        told_false: np.ndarray,
+    ) -> 'PackedBelnap':
+        """ Packs the 2 bits of each value, given as boolean arrays.
+
+        Args:
+            told_true (np.ndarray): A 1 dimensional boolean array, True where
+                the value has been told to be true.
+            told_false (np.ndarray): A boolean array of the same length, True
+                where the value has been told to be false.
+
+        Returns:
+            PackedBelnap: The packed values.
+
+        Raises:
+            ValueError: If told_true and told_false have different lengths.
+        """
+        told_true = np.asarray(told_true, dtype=bool).ravel()
+        told_false = np.asarray(told_false, dtype=bool).ravel()
+        if len(told_true) != len(told_false):
+            raise ValueError('Can not pack planes of lengths {} and {}'
+                .format(len(told_true), len(told_false)))
+        return cls(_pack(told_true), _pack(told_false), len(told_true))
+
+    @classmethod
+    def from_codes(cls, codes: np.ndarray) -> 'PackedBelnap':
+        """ Packs an array of the codes of Belnap values (see
+        mvl.belnap.BelnapValue.code).
+
+        Args:
+            codes (np.ndarray): A 1 dimensional array of the values 0 (n),
+                1 (t), 2 (f) and 3 (b).
+
+        Returns:
+            PackedBelnap: The packed values.
+
+        Raises:
+            ValueError: If any of the codes is not 0, 1, 2 or 3.
+        """
+        codes = np.asarray(codes).ravel()
+        if codes.size and (codes.min() < 0 or codes.max() > 3):
+            raise ValueError('The codes of Belnap values must be 0, 1, 2 or 3')
+        return cls.from_bools(codes & 1, codes & 2)
+
+    @classmethod
+    def from_values(cls, a: Iterable[BelnapValue]) -> 'PackedBelnap':
+        """ Packs a sequence of Belnap values.
+
+        Args:
+            a (Iterable[BelnapValue])
+
+        Returns:
+            PackedBelnap: The packed values.
+        """
+        return cls.from_codes(
+            np.fromiter((value.code for value in a), dtype=np.uint8)
+        )
+
+    @classmethod
+    def from_tvl(cls, a: PackedTVL) -> 'PackedBelnap':
+        """ Converts packed 3 valued logic values, using the same planes.
+        «Unknown» becomes «Neither». See mvl.belnap.from_tvl.
+
+        Args:
+            a (PackedTVL)
+
+        Returns:
+            PackedBelnap: The packed values.
+        """
+        return cls(a.true, a.false, a.length)
+
+    def to_codes(self) -> np.ndarray:
+        """ Returns:
+            np.ndarray: The code of each value (see
+                mvl.belnap.BelnapValue.code), as an array of np.uint8.
+        """
+        return (_unpack(self.true, self.length).astype(np.uint8)
+            | _unpack(self.false, self.length).astype(np.uint8) << 1)
+
+    def to_values(self) -> np.ndarray:
+        """ Returns:
+            np.ndarray: An object array of the Belnap value of each element.
+        """
+        lookup = np.empty(len(values), dtype=object)
+        lookup[:] = values
+        return lookup[self.to_codes()]
+
+    def designated(self) -> np.ndarray:
+        """ Returns:
+            np.ndarray: A boolean array, True where the value is designated
+                (t or b).
+        """
+        return _unpack(self.true, self.length)
+
+    def count(self, value: BelnapValue) -> int:
+        """ Counts the number of times a Belnap value occurs.
+
+        Args:
+            value (BelnapValue)
+
+        Returns:
+            int: The number of elements equal to value.
+        """
+        if value.told_true and value.told_false:
+            return _popcount(self.true & self.false)
+        if value.told_true:
+            return _popcount(self.true & ~self.false)
+        if value.told_false:
+            return _popcount(self.false & ~self.true)
+        return self.length - _popcount(self.true | self.false)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PackedBelnap):
+            return NotImplemented
+        return (self.length == other.length
+            and np.array_equal(self.true, other.true)
+            and np.array_equal(self.false, other.false))
+
+    def __and__(self, other: 'PackedBelnap') -> 'PackedBelnap':
+        return and_(self, other)
+
+    def __or__(self, other: 'PackedBelnap') -> 'PackedBelnap':
+        return or_(self, other)
+
+    def __invert__(self) -> 'PackedBelnap':
+        return not_(self)
+
+    def __repr__(self) -> str:
+        return 'PackedBelnap({})'.format(
+            [value.name for value in self.to_values()]
+        )
+
+
+def _planes(
+    a: PackedBelnap,
+    b: PackedBelnap,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """ Returns the true and false planes of a and b, checking that they are
+    the same length.
+
+    Raises:
+        ValueError: If a and b have different lengths.
+    """
+    if a.length != b.length:
+        raise ValueError('Can not combine PackedBelnaps of lengths {} and {}'
+            .format(a.length, b.length))
+    return a.true, a.false, b.true, b.false
+
+
+def not_(a: PackedBelnap) -> PackedBelnap:
+    """ The Belnap «not» operator, which swaps the true and false planes. See
+    mvl.belnap.not_.
+
+    Args:
+        a (PackedBelnap)
+
+    Returns:
+        PackedBelnap: ! a
+    """
+    return PackedBelnap(a.false, a.true, a.length)
+
+
+def and_(a: PackedBelnap, b: PackedBelnap) -> PackedBelnap:
+    """ The Belnap «and» operator. See mvl.belnap.and_.
+
+    Args:
+        a (PackedBelnap)
+        b (PackedBelnap)
+
+    Returns:
+        PackedBelnap: a & b
+    """
+    a_true, a_false, b_true, b_false = _planes(a, b)
+    return PackedBelnap(a_true & b_true, a_false | b_false, a.length)
+
+
+def or_(a: PackedBelnap, b: PackedBelnap) -> PackedBelnap:
+    """ The Belnap «or» operator. See mvl.belnap.or_.
+
+    Args:
+        a (PackedBelnap)
+        b (PackedBelnap)
+
+    Returns:
+        PackedBelnap: a | b
+    """
+    a_true, a_false, b_true, b_false = _planes(a, b)
+    return PackedBelnap(a_true | b_true, a_false & b_false, a.length)
+
+
+def implies(a: PackedBelnap, b: PackedBelnap) -> PackedBelnap:
+    """ The Belnap «implies» operator. See mvl.belnap.implies.
+
+    Args:
+        a (PackedBelnap)
+        b (PackedBelnap)
+
+    Returns:
+        PackedBelnap: a → b
+    """
+    a_true, a_false, b_true, b_false = _planes(a, b)
+    return PackedBelnap(a_false | b_true, a_true & b_false, a.length)
+
+
+def consensus(a: PackedBelnap, b: PackedBelnap) -> PackedBelnap:
+    """ The meet of the knowledge ordering. See mvl.belnap.consensus.
+
+    Args:
+        a (PackedBelnap)
+        b (PackedBelnap)
+
+    Returns:
+        PackedBelnap: a ⊗ b
+    """
+    a_true, a_false, b_true, b_false = _planes(a, b)
+    return PackedBelnap(a_true & b_true, a_false & b_false, a.length)
+
+
+def gullibility(a: PackedBelnap, b: PackedBelnap) -> PackedBelnap:
+    """ The join of the knowledge ordering. See mvl.belnap.gullibility.
+
+    Args:
+        a (PackedBelnap)
+        b (PackedBelnap)
+
+    Returns:
+        PackedBelnap: a ⊕ b
+    """
+    a_true, a_false, b_true, b_false = _planes(a, b)
+    return PackedBelnap(a_true | b_true, a_false | b_false, a.length)
@@ -0,0 +1,110 @@
+"""
+.. module: vectorized.bochvar
+   :synopsis: Array versions of the logical operators used in bochvar 3 valued
+   logic.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from typing import Optional
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.bochvar import u
+from mvl.vectorized import ArrayLike, as_degrees
+from mvl.vectorized.tvl_operators import not_, iff
+
+
+_U: float = float(u)
+
+
+def _unknown(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """ Returns a boolean array, True wherever either a or b is «Unknown».
+    """
+    return (a == _U) | (b == _U)
+
+
+def and_(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ The and operator (&) used by Bochvar, applied elementwise. See
+    mvl.bochvar.and_.
+
+    Args:
+        a (ArrayLike)
+        b (ArrayLike)
+
+    Returns:
+        np.ndarray: a & b
+    """
+    a = as_degrees(a)
+    b = as_degrees(b)
+    return np.where(_unknown(a, b), _U, (a != 0) & (b != 0))
+
+
+def or_(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ The or operator (|) used by Bochvar, applied elementwise. See
+    mvl.bochvar.or_.
+
+    Args:
+        a (ArrayLike)
+        b (ArrayLike)
+
+    Returns:
+        np.ndarray: a | b
+    """
+    a = as_degrees(a)
+    b = as_degrees(b)
+    return np.where(_unknown(a, b), _U, (a != 0) | (b != 0))
+
+
+def implies(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ The implication operator (→) used by Bochvar, applied elementwise. See
+    mvl.bochvar.implies.
+
+    Args:
+        a (ArrayLike)
+        b (ArrayLike)
+
+    Returns:
+        np.ndarray: a → b
+    """
+    a = as_degrees(a)
+    b = as_degrees(b)
+    return np.where(_unknown(a, b), _U, (a == 0) | (b != 0))
+
+
+def all_(a: ArrayLike, axis: Optional[int] = None) -> np.ndarray:
+    """ The and operator used by Bochvar (&), applied to every value along an
+    axis. See mvl.bochvar.all_.
+
+    Args:
+        a (ArrayLike)
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a & b & ...
+    """
+    a = as_degrees(a)
+    return np.where(
+        np.any(a == _U, axis=axis), _U, np.all(a != 0, axis=axis)
+    )
+
+
+def any_(a: ArrayLike, axis: Optional[int] = None) -> np.ndarray:
+    """ The or operator used by Bochvar (|), applied to every value along an
+    axis. See mvl.bochvar.any_.
+
+    Args:
+        a (ArrayLike)
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a | b | ...
+    """
+    a = as_degrees(a)
+    return np.where(
+        np.any(a == _U, axis=axis), _U, np.any(a != 0, axis=axis)
+    )
@@ -0,0 +1,154 @@
+"""
+.. module: vectorized.chunked
+   :synopsis: Evaluation of operators and formulas over columns of truth
+   degrees (or value indices) which are too large to fit in memory, such as
+   memory mapped files.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from os import PathLike
+from typing import Callable, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.formula import Apply, Formula, Var
+from mvl.lukasiewicz import LogicSystem
+from mvl.vectorized.formula import evaluate_degrees
+from mvl.vectorized.systems import (
+    count_arguments,
+    evaluate_indices,
+    index_dtype,
+)
+
+
+Column = Union[np.ndarray, str, PathLike]
+""" A type defining a column of values: an array (usually an np.memmap), or the
+path of a raw binary file holding the values one after another.
+"""
+
+DEFAULT_CHUNK_SIZE: int = 1 << 20
+""" The number of values which are read from each column at once.
+"""
+
+
+def open_column(
+    path: Union[str, PathLike],
+    dtype: np.dtype = np.float64,
+    mode: str = 'r',
+    length: Optional[int] = None,
+) -> np.memmap:
+    """ Memory maps a raw binary file of values, without reading it.
+
+    Args:
+        path (Union[str, PathLike]): The path of the file.
+        dtype (np.dtype): The type of the values in the file.
+        mode (str): The mode to open the file in. 'r' opens it read only, and
+            'w+' creates (or overwrites) it. See np.memmap.
+        length (Optional[int]): The number of values in the file. This is
+            needed when the file is created, and otherwise defaults to the
+            size of the file divided by the size of a value.
+
+    Returns:
+        np.memmap: A 1 dimensional array backed by the file.
+    """
+    shape = None if length is None else (length,)
+    return np.memmap(path, dtype=dtype, mode=mode, shape=shape)
+
+
+def evaluate_chunked(
+    target: Union[Formula, Callable],
+    columns: Union[Mapping[str, Column], Sequence[Column]],
+    out: Union[np.ndarray, str, PathLike, None] = None,
+    system: Optional[LogicSystem] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> np.ndarray:
+    """ Evaluates an operator or formula over columns of values, chunk_size
+    values at a time, and writes the results into out.
+
+    Each chunk of each column is a view into the column, so memory mapped
+    columns are read a chunk at a time and never copied as a whole. The memory
+    used (other than by out, if it is held in memory) only depends on
+    chunk_size, and not on the length of the columns.
+
+    Columns hold truth degrees (evaluated with the array version of each
+    operator, see evaluate_degrees), or, if system is given, value indices of
+    system (evaluated with truth tables, see evaluate_indices).
+
+    Args:
+        target (Union[Formula, Callable]): A formula, or an operator of any
+            arity.
+        columns (Union[Mapping[str, Column], Sequence[Column]]): The column of
+            each variable of a formula, or of each argument of an operator, in
+            order. Columns which are paths are opened with open_column, as
+            float64 truth degrees, or as indices of the type given by
+            index_dtype. Every column must have the same length.
+        out (Union[np.ndarray, str, PathLike, None]): The array the results
+            are written into, or the path of a file to create for them. If
+            None, the results are returned in a new array in memory.
+        system (Optional[LogicSystem]): The finite logic system whose value
+            indices the columns hold. If None, the columns hold truth degrees.
+        chunk_size (int): The number of values to evaluate at once.
+
+    Returns:
+        np.ndarray: out, holding the results. These are float64 truth degrees,
+            or indices of system.
+
+    Raises:
+        ValueError: If the columns (and out) do not all have the same length,
+            or if there are no columns and out is not an array.
+    """
+    if isinstance(target, Formula):
+        formula = target
+    else:
+        names = ['a{}'.format(i) for i in range(count_arguments(target))]
+        formula = Apply(target, *[Var(name) for name in names])
+        columns = dict(zip(names, columns))
+
+    if system is None:
+        dtype = np.dtype(np.float64)
+        evaluate = evaluate_degrees
+    else:
+        dtype = index_dtype(system.n_values)
+        evaluate = lambda formula, env: evaluate_indices(formula, system, env)
+
+    arrays = {
+        name: _open(columns[name], dtype) for name in formula.variables
+    }
+    lengths = {len(array) for array in arrays.values()}
+    if len(lengths) > 1:
+        raise ValueError('Every column must have the same length, not '
+            '{}'.format(sorted(lengths)))
+    if lengths:
+        length = lengths.pop()
+    elif isinstance(out, np.ndarray):
+        length = len(out)
+    else:
+        raise ValueError('out must be an array when there are no columns')
+
+    if out is None:
+        out = np.empty(length, dtype=dtype)
+    elif not isinstance(out, np.ndarray):
+        out = open_column(out, dtype, mode='w+', length=length)
+    if len(out) != length:
+        raise ValueError('out has length {}, but the columns have length '
+            '{}'.format(len(out), length))
+
+    for start in range(0, length, chunk_size):
+        stop = min(start + chunk_size, length)
+        env = {name: array[start:stop] for name, array in arrays.items()}
+        out[start:stop] = evaluate(formula, env)
+
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
+
+
+def _open(column: Column, dtype: np.dtype) -> np.ndarray:
+    """ Returns a column as a 1 dimensional array, opening it if it is a path.
+    """
+    if isinstance(column, np.ndarray):
+        return column.reshape(-1)
+    return open_column(column, dtype)
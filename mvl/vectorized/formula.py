@@ -0,0 +1,88 @@
+"""
+.. module: vectorized.formula
+   :synopsis: Evaluation of formulas (see mvl.formula) over arrays of truth
+   degrees.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from importlib import import_module
+from typing import Callable, Dict, Mapping
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.formula import Const, Formula, Var
+from mvl.vectorized import ArrayLike, as_degrees
+from mvl.vectorized.systems import count_arguments
+
+
+_operators: Dict[Callable, Callable] = {}
+
+
+def operator_for(op: Callable) -> Callable:
+    """ Returns the array version of an operator.
+
+    Operators provided by MVL are mapped onto the operator of the same name in
+    the mirroring module of mvl.vectorized (so mvl.goedel.and_ is mapped onto
+    mvl.vectorized.goedel.and_). Any other operator is applied to each element
+    in turn, which is correct but slow.
+
+    Args:
+        op (Callable): A scalar operator.
+
+    Returns:
+        Callable: A function with the same arguments as op, which takes arrays
+            and returns an array of floats.
+    """
+    array_op = _operators.get(op)
+    if array_op is None:
+        array_op = _operators[op] = _lookup(op)
+    return array_op
+
+
+def _lookup(op: Callable) -> Callable:
+    """ Finds (or builds) the array version of an operator.
+    """
+    module_name = getattr(op, '__module__', None) or ''
+    if module_name.startswith('mvl.') and module_name != 'mvl.post':
+        try:
+            module = import_module(
+                'mvl.vectorized.' + module_name[len('mvl.'):]
+            )
+            return getattr(module, op.__name__)
+        except (ImportError, AttributeError):
+            pass
+
+    ufunc = np.frompyfunc(op, count_arguments(op), 1)
+    def array_op(*args: ArrayLike) -> np.ndarray:
+        return as_degrees(ufunc(*args))
+    return array_op
+
+
+def evaluate_degrees(
+    formula: Formula,
+    env: Mapping[str, ArrayLike],
+) -> np.ndarray:
+    """ Evaluates a formula over arrays of truth degrees, using the array
+    version of each of its operators (see operator_for).
+
+    Args:
+        formula (Formula): The formula to evaluate.
+        env (Mapping[str, ArrayLike]): The values of each variable. Arrays are
+            broadcast against each other.
+
+    Returns:
+        np.ndarray: The value of the formula for each element.
+    """
+    results = {}
+    for node in formula.nodes():
+        if isinstance(node, Var):
+            results[node] = as_degrees(env[node.name])
+        elif isinstance(node, Const):
+            results[node] = as_degrees(node.value)
+        else:
+            op = operator_for(node.op)
+            results[node] = op(*[results[arg] for arg in node.args])
+    return as_degrees(results[formula])
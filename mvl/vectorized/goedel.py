@@ -0,0 +1,98 @@
+"""
+.. module: vectorized.goedel
+   :synopsis: Array versions of the operators used in goedel logics.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from typing import Optional
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.vectorized import ArrayLike, as_degrees
+
+
+def and_(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ Goedel's «and» operator (&), applied elementwise. See mvl.goedel.and_.
+
+    Args:
+        a (ArrayLike)
+        b (ArrayLike)
+
+    Returns:
+        np.ndarray: a & b
+    """
+    return np.minimum(as_degrees(a), as_degrees(b))
+
+
+def or_(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ Goedel's «or» operator (|), applied elementwise. See mvl.goedel.or_.
+
+    Args:
+        a (ArrayLike)
+        b (ArrayLike)
+
+    Returns:
+        np.ndarray: a | b
+    """
+    return np.maximum(as_degrees(a), as_degrees(b))
+
+
+def not_(a: ArrayLike) -> np.ndarray:
+    """ Goedel's «not» operator (!), applied elementwise. See mvl.goedel.not_.
+
+    Args:
+        a (ArrayLike)
+
+    Returns:
+        np.ndarray: ! a
+    """
+    return (as_degrees(a) == 0).astype(float)
+
+
+def implies(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ Goedel's «implies» operator (→), applied elementwise. See
+    mvl.goedel.implies.
+
+    Args:
+        a (ArrayLike)
+        b (ArrayLike)
+
+    Returns:
+        np.ndarray: a → b
+    """
+    a = as_degrees(a)
+    b = as_degrees(b)
+    return np.where(a > b, b, 1.0)
+
+
+def all_(a: ArrayLike, axis: Optional[int] = None) -> np.ndarray:
+    """ Goedel's «and» (&) of every value along an axis (their minimum). See
+    mvl.goedel.all_.
+
+    Args:
+        a (ArrayLike)
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a & b & ...
+    """
+    return np.min(as_degrees(a), axis=axis, initial=1.0)
+
+
+def any_(a: ArrayLike, axis: Optional[int] = None) -> np.ndarray:
+    """ Goedel's «or» (|) of every value along an axis (their maximum). See
+    mvl.goedel.any_.
+
+    Args:
+        a (ArrayLike)
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a | b | ...
+    """
+    return np.max(as_degrees(a), axis=axis, initial=0.0)
@@ -0,0 +1,246 @@
+"""
+.. module: vectorized.lukasiewicz
+   :synopsis: Array versions of the lukasiewicz operators, and of the truth
+   tests used by LukasiewiczLogicValues and PriestLogicValues.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from typing import Callable, Optional
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.lukasiewicz import LukasiewiczLogicValue, PriestLogicValue
+from mvl.vectorized import ArrayLike, as_degrees
+
+
+def s_and(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ Lukasiewicz's «strong and» operator (&&), applied elementwise. See
+    mvl.lukasiewicz.s_and.
+
+    Args:
+        a (ArrayLike)
+        b (ArrayLike)
+
+    Returns:
+        np.ndarray: a && b
+    """
+    a = as_degrees(a)
+    b = as_degrees(b)
+    return np.maximum(0, a + b - 1)
+
+
+def w_and(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ Lukasiewicz's «weak and» operator (&), applied elementwise. See
+    mvl.lukasiewicz.w_and.
+
+    Args:
+        a (ArrayLike)
+        b (ArrayLike)
+
+    Returns:
+        np.ndarray: a & b
+    """
+    return np.minimum(as_degrees(a), as_degrees(b))
+
+
+def s_or(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ Lukasiewicz's «strong or» operator (||), applied elementwise. See
+    mvl.lukasiewicz.s_or.
+
+    Args:
+        a (ArrayLike)
+        b (ArrayLike)
+
+    Returns:
+        np.ndarray: a || b
+    """
+    a = as_degrees(a)
+    b = as_degrees(b)
+    return np.minimum(1, a + b)
+
+
+def w_or(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ Lukasiewicz's «weak or» operator (|), applied elementwise. See
+    mvl.lukasiewicz.w_or.
+
+    Args:
+        a (ArrayLike)
+        b (ArrayLike)
+
+    Returns:
+        np.ndarray: a | b
+    """
+    return np.maximum(as_degrees(a), as_degrees(b))
+
+
+def not_(a: ArrayLike) -> np.ndarray:
+    """ Lukasiewicz's «not» operator (!), applied elementwise. See
+    mvl.lukasiewicz.not_.
+
+    Args:
+        a (ArrayLike)
+
+    Returns:
+        np.ndarray: ! a
+    """
+    return 1 - as_degrees(a)
+
+
+def implies(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ Lukasiewicz's «implies» operator (→), applied elementwise. See
+    mvl.lukasiewicz.implies.
+
+    Args:
+        a (ArrayLike)
+        b (ArrayLike)
+
+    Returns:
+        np.ndarray: a → b
+    """
+    a = as_degrees(a)
+    b = as_degrees(b)
+    return np.minimum(1, 1 - a + b)
+
+
+def equivalent(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ Lukasiewicz's «equivalence» operator (↔), applied elementwise. See
+    mvl.lukasiewicz.equivalent.
+
+    Args:
+        a (ArrayLike)
+        b (ArrayLike)
+
+    Returns:
+        np.ndarray: a ↔ b
+    """
+    a = as_degrees(a)
+    b = as_degrees(b)
+    return 1 - np.abs(a - b)
+
+
+def _count(a: np.ndarray, axis: Optional[int]) -> int:
+    """ Returns the number of values reduced along axis (or in total, if axis
+    is None).
+    """
+    return a.size if axis is None else a.shape[axis]
+
+
+def s_all(a: ArrayLike, axis: Optional[int] = None) -> np.ndarray:
+    """ Lukasiewicz's «strong and» (&&) of every value along an axis, using the
+    closed form:
+
+    max {0, Σ a - (k - 1)}
+
+    where k is the number of values. See mvl.lukasiewicz.s_all.
+
+    Args:
+        a (ArrayLike)
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a && b && ...
+    """
+    a = as_degrees(a)
+    return np.maximum(0, a.sum(axis=axis) - (_count(a, axis) - 1))
+
+
+def s_any(a: ArrayLike, axis: Optional[int] = None) -> np.ndarray:
+    """ Lukasiewicz's «strong or» (||) of every value along an axis, using the
+    closed form:
+
+    min {1, Σ a}
+
+    See mvl.lukasiewicz.s_any.
+
+    Args:
+        a (ArrayLike)
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a || b || ...
+    """
+    return np.minimum(1, as_degrees(a).sum(axis=axis))
+
+
+def w_all(a: ArrayLike, axis: Optional[int] = None) -> np.ndarray:
+    """ Lukasiewicz's «weak and» (&) of every value along an axis (their
+    minimum). See mvl.lukasiewicz.w_all.
+
+    Args:
+        a (ArrayLike)
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a & b & ...
+    """
+    return np.min(as_degrees(a), axis=axis, initial=1.0)
+
+
+def w_any(a: ArrayLike, axis: Optional[int] = None) -> np.ndarray:
+    """ Lukasiewicz's «weak or» (|) of every value along an axis (their
+    maximum). See mvl.lukasiewicz.w_any.
+
+    Args:
+        a (ArrayLike)
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a | b | ...
+    """
+    return np.max(as_degrees(a), axis=axis, initial=0.0)
+
+
+def lukasiewicz_bool(a: ArrayLike) -> np.ndarray:
+    """ The truth test used by LukasiewiczLogicValue.__bool__, applied
+    elementwise: a value is «true» iff it is equal to 1.
+
+    Args:
+        a (ArrayLike)
+
+    Returns:
+        np.ndarray: A boolean array, True where a is a truth value.
+    """
+    return as_degrees(a) == 1
+
+
+def priest_bool(a: ArrayLike) -> np.ndarray:
+    """ The truth test used by PriestLogicValue.__bool__, applied elementwise: a
+    value is «true» iff it is not equal to 0.
+
+    Args:
+        a (ArrayLike)
+
+    Returns:
+        np.ndarray: A boolean array, True where a is a truth value.
+    """
+    return as_degrees(a) != 0
+
+
+def bool_for(logic_value_class: Callable) -> Callable:
+    """ Returns the array truth test matching the __bool__ method of the given
+    LogicValue class.
+
+    Args:
+        logic_value_class (Callable): A subclass of LukasiewiczLogicValue or
+            PriestLogicValue.
+
+    Returns:
+        Callable: lukasiewicz_bool or priest_bool.
+
+    Raises:
+        TypeError: If logic_value_class does not define either truth test.
+    """
+    if issubclass(logic_value_class, LukasiewiczLogicValue):
+        return lukasiewicz_bool
+    if issubclass(logic_value_class, PriestLogicValue):
+        return priest_bool
+    raise TypeError('No array truth test is defined for {}'.format(
+        logic_value_class.__name__
+    ))
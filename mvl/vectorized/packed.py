@@ -0,0 +1,347 @@
+"""
+.. module: vectorized.packed
+   :synopsis: A compact array type for 3 valued (kleene, priest and bochvar)
+   logic, and the 3 valued logical operators over it.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from typing import Tuple
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.types import Floatable
+from mvl.vectorized import ArrayLike, as_degrees
+
+
+_WORD_BITS: int = 64
+
+
+class PackedTVL:
+    """ An array of 3 valued logic values, stored as 2 bit-planes.
+
+    Each value is stored as 2 bits, one in each plane: whether it is «True»,
+    and whether it is «False». «Unknown» values have neither bit set. The planes
+    are stored as arrays of 64 bit words, so that the logical operators in this
+    module act on 64 values at once, using a handful of bitwise operations.
+
+    Attributes:
+        true (np.ndarray): The plane of bits which are set where the value is
+            «True», as an array of np.uint64 words.
+        false (np.ndarray): The plane of bits which are set where the value is
+            «False», as an array of np.uint64 words.
+        length (int): The number of values in the array. Bits beyond length in
+            the last word are never set in either plane.
+    """
+
+    def __init__(self, true: np.ndarray, false: np.ndarray, length: int) -> None:
+        self.true: np.ndarray = true
+        self.false: np.ndarray = false
+        self.length: int = length
+
+    @classmethod
+    def from_degrees(cls, a: ArrayLike) -> 'PackedTVL':
+        """ Packs an array of truth degrees (or 3 valued LogicValues).
+
+        Args:
+            a (ArrayLike): A 1 dimensional array of the values 0, 0.5 and 1.
+
+        Returns:
+            PackedTVL: The packed values.
+
+        Raises:
+            ValueError: If any of the values is not 0, 0.5 or 1.
+        """
+        a = as_degrees(a).ravel()
+        true = a == 1
+        false = a == 0
+        if not np.all(true | false | (a == 0.5)):
+            raise ValueError('3 valued logic values must be 0, 0.5 or 1')
+        return cls(_pack(true), _pack(false), len(a))
+
+    @classmethod
+    def from_indices(cls, indices: ArrayLike) -> 'PackedTVL':
+        """ Packs an array of the indices of 3 valued logic values, as given by
+        LogicSystem.quantize.
+
+        Args:
+            indices (ArrayLike): A 1 dimensional array of the values 0, 1 and 2.
+
+        Returns:
+            PackedTVL: The packed values.
+        """
+        indices = np.asarray(indices).ravel()
+        return cls(_pack(indices == 2), _pack(indices == 0), len(indices))
+
+    def to_indices(self) -> np.ndarray:
+        """ Returns:
+            np.ndarray: The index (0 for «False», 1 for «Unknown» and 2 for
+                «True») of each value, as an array of np.uint8.
+        """
+        indices = np.ones(self.length, dtype=np.uint8)
+        indices[_unpack(self.true, self.length)] = 2
+        indices[_unpack(self.false, self.length)] = 0
+        return indices
+
+    def to_degrees(self) -> np.ndarray:
+        """ Returns:
+            np.ndarray: The float representation of each value.
+        """
+        return self.to_indices() / 2
+
+    def lukasiewicz_bool(self) -> np.ndarray:
+        """ Returns:
+            np.ndarray: A boolean array, True where the value is a truth value
+                under LukasiewiczLogicValue.__bool__ (as in kleene and bochvar
+                logic).
+        """
+        return _unpack(self.true, self.length)
+
+    def priest_bool(self) -> np.ndarray:
+        """ Returns:
+            np.ndarray: A boolean array, True where the value is a truth value
+                under PriestLogicValue.__bool__.
+        """
+        return ~_unpack(self.false, self.length)
+
+    def count(self, value: Floatable) -> int:
+        """ Counts the number of times a 3 valued logic value occurs.
+
+        Args:
+            value (Floatable): One of 0, 0.5 and 1, or a 3 valued LogicValue.
+
+        Returns:
+            int: The number of elements equal to value.
+
+        Raises:
+            ValueError: If value is not 0, 0.5 or 1.
+        """
+        value = float(value)
+        if value == 1:
+            return _popcount(self.true)
+        if value == 0:
+            return _popcount(self.false)
+        if value == 0.5:
+            return self.length - _popcount(self.true) - _popcount(self.false)
+        raise ValueError('3 valued logic values must be 0, 0.5 or 1')
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PackedTVL):
+            return NotImplemented
+        return (self.length == other.length
+            and np.array_equal(self.true, other.true)
+            and np.array_equal(self.false, other.false))
+
+    def __and__(self, other: 'PackedTVL') -> 'PackedTVL':
+        return and_(self, other)
+
+    def __or__(self, other: 'PackedTVL') -> 'PackedTVL':
+        return or_(self, other)
+
+    def __invert__(self) -> 'PackedTVL':
+        return not_(self)
+
+    def __repr__(self) -> str:
+        return 'PackedTVL({})'.format(self.to_degrees().tolist())
+
+
+def _pack(bits: np.ndarray) -> np.ndarray:
+    """ Packs an array of booleans into an array of 64 bit words, padding the
+    last word with unset bits.
+    """
+    packed = np.packbits(bits, bitorder='little')
+    words = np.zeros(-(-len(bits) // _WORD_BITS) * 8, dtype=np.uint8)
+    words[:len(packed)] = packed
+    return words.view(np.uint64)
+
+
+def _unpack(words: np.ndarray, length: int) -> np.ndarray:
+    """ Unpacks the first length bits of an array of 64 bit words into an array
+    of booleans.
+    """
+    return np.unpackbits(
+        words.view(np.uint8), count=length, bitorder='little'
+    ).astype(bool)
+
+
+if hasattr(np, 'bitwise_count'): # numpy >= 2.0
+    def _popcount(words: np.ndarray) -> int:
+        """ Returns the number of set bits in an array of words.
+        """
+        return int(np.bitwise_count(words).sum())
+else:
+    _BYTE_COUNTS: np.ndarray = np.array(
+        [bin(i).count('1') for i in range(256)], dtype=np.uint8
+    )
+
+    def _popcount(words: np.ndarray) -> int:
+        """ Returns the number of set bits in an array of words.
+        """
+        return int(_BYTE_COUNTS[words.view(np.uint8)].sum(dtype=np.int64))
+
+
+def _planes(
+    a: PackedTVL,
+    b: PackedTVL,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """ Returns the true and false planes of a and b, checking that they are
+    the same length.
+
+    Raises:
+        ValueError: If a and b have different lengths.
+    """
+    if a.length != b.length:
+        raise ValueError('Can not combine PackedTVLs of lengths {} and {}'
+            .format(a.length, b.length))
+    return a.true, a.false, b.true, b.false
+
+
+def not_(a: PackedTVL) -> PackedTVL:
+    """ The «not» operator used by kleene, priest and bochvar (see
+    mvl.tvl_operators.not_), which swaps the true and false planes.
+
+    Args:
+        a (PackedTVL)
+
+    Returns:
+        PackedTVL: ! a
+    """
+    return PackedTVL(a.false, a.true, a.length)
+
+
+def and_(a: PackedTVL, b: PackedTVL) -> PackedTVL:
+    """ The «and» operator used by kleene and priest. See
+    mvl.tvl_operators.and_.
+
+    Args:
+        a (PackedTVL)
+        b (PackedTVL)
+
+    Returns:
+        PackedTVL: a & b
+    """
+    a_true, a_false, b_true, b_false = _planes(a, b)
+    return PackedTVL(a_true & b_true, a_false | b_false, a.length)
+
+
+def or_(a: PackedTVL, b: PackedTVL) -> PackedTVL:
+    """ The «or» operator used by kleene and priest. See mvl.tvl_operators.or_.
+
+    Args:
+        a (PackedTVL)
+        b (PackedTVL)
+
+    Returns:
+        PackedTVL: a | b
+    """
+    a_true, a_false, b_true, b_false = _planes(a, b)
+    return PackedTVL(a_true | b_true, a_false & b_false, a.length)
+
+
+def implies(a: PackedTVL, b: PackedTVL) -> PackedTVL:
+    """ The «implies» operator used by kleene and priest. See
+    mvl.tvl_operators.implies.
+
+    Args:
+        a (PackedTVL)
+        b (PackedTVL)
+
+    Returns:
+        PackedTVL: a → b
+    """
+    a_true, a_false, b_true, b_false = _planes(a, b)
+    return PackedTVL(a_false | b_true, a_true & b_false, a.length)
+
+
+def iff(a: PackedTVL, b: PackedTVL) -> PackedTVL:
+    """ The bicondition operator used by kleene, priest and bochvar. See
+    mvl.tvl_operators.iff.
+
+    Args:
+        a (PackedTVL)
+        b (PackedTVL)
+
+    Returns:
+        PackedTVL: a ↔ b
+    """
+    a_true, a_false, b_true, b_false = _planes(a, b)
+    return PackedTVL(
+        (a_true & b_true) | (a_false & b_false),
+        (a_true & b_false) | (a_false & b_true),
+        a.length,
+    )
+
+
+def xor(a: PackedTVL, b: PackedTVL) -> PackedTVL:
+    """ The xor operator used by kleene and priest. See mvl.tvl_operators.xor.
+
+    Args:
+        a (PackedTVL)
+        b (PackedTVL)
+
+    Returns:
+        PackedTVL: a xor b
+    """
+    return not_(iff(a, b))
+
+
+def _known(
+    a_true: np.ndarray,
+    a_false: np.ndarray,
+    b_true: np.ndarray,
+    b_false: np.ndarray,
+) -> np.ndarray:
+    """ Returns the plane of bits which are set where neither a nor b is
+    «Unknown».
+    """
+    return (a_true | a_false) & (b_true | b_false)
+
+
+def bochvar_and(a: PackedTVL, b: PackedTVL) -> PackedTVL:
+    """ The «and» operator used by bochvar. See mvl.bochvar.and_.
+
+    Args:
+        a (PackedTVL)
+        b (PackedTVL)
+
+    Returns:
+        PackedTVL: a & b
+    """
+    a_true, a_false, b_true, b_false = _planes(a, b)
+    known = _known(a_true, a_false, b_true, b_false)
+    return PackedTVL(a_true & b_true, (a_false | b_false) & known, a.length)
+
+
+def bochvar_or(a: PackedTVL, b: PackedTVL) -> PackedTVL:
+    """ The «or» operator used by bochvar. See mvl.bochvar.or_.
+
+    Args:
+        a (PackedTVL)
+        b (PackedTVL)
+
+    Returns:
+        PackedTVL: a | b
+    """
+    a_true, a_false, b_true, b_false = _planes(a, b)
+    known = _known(a_true, a_false, b_true, b_false)
+    return PackedTVL((a_true | b_true) & known, a_false & b_false, a.length)
+
+
+def bochvar_implies(a: PackedTVL, b: PackedTVL) -> PackedTVL:
+    """ The «implies» operator used by bochvar. See mvl.bochvar.implies.
+
+    Args:
+        a (PackedTVL)
+        b (PackedTVL)
+
+    Returns:
+        PackedTVL: a → b
+    """
+    a_true, a_false, b_true, b_false = _planes(a, b)
+    known = _known(a_true, a_false, b_true, b_false)
+    return PackedTVL((a_false | b_true) & known, a_true & b_false, a.length)
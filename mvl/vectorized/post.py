@@ -0,0 +1,31 @@
+"""
+.. module: vectorized.post
+   :synopsis: Array versions of the operators used in post logics.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+import numpy as np
+
+# Imports from the local package.
+from mvl.vectorized import ArrayLike, as_degrees
+from mvl.vectorized.goedel import and_, or_, all_, any_
+
+
+def not_(a: ArrayLike, max_index: int) -> np.ndarray:
+    """ Post's «not» operator (!), applied elementwise. See mvl.post.not_.
+
+    Array elements are plain floats, and so do not know which logic system they
+    belong to. Because of this, the max_index of the logic system (its number of
+    values, minus 1) has to be given explicitly.
+
+    Args:
+        a (ArrayLike)
+        max_index (int): The number of values in the logic system, minus 1.
+
+    Returns:
+        np.ndarray: ! a
+    """
+    a = as_degrees(a)
+    return np.where(a == 0, 1.0, a - (1 / max_index))
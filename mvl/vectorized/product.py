@@ -0,0 +1,222 @@
+"""
+.. module: vectorized.product
+   :synopsis: Array versions of the operators used in product logics.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from typing import Optional
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.vectorized import ArrayLike, as_degrees
+
+
+def mult(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ The product logic «conjunction» operator (*), applied elementwise. See
+    mvl.product.mult.
+
+    Args:
+        a (ArrayLike)
+        b (ArrayLike)
+
+    Returns:
+        np.ndarray: a * b
+    """
+    return as_degrees(a) * as_degrees(b)
+
+
+def implies(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ The product logic «implies» operator (→), applied elementwise. See
+    mvl.product.implies.
+
+    Args:
+        a (ArrayLike)
+        b (ArrayLike)
+
+    Returns:
+        np.ndarray: a → b
+    """
+    a, b = np.broadcast_arrays(as_degrees(a), as_degrees(b))
+    # Only divide where a > b, which also guarantees that a is never 0.
+    return np.divide(b, a, out=np.ones(a.shape), where=a > b)
+
+
+def not_(a: ArrayLike) -> np.ndarray:
+    """ The product logic «not» operator (!), applied elementwise. See
+    mvl.product.not_.
+
+    Args:
+        a (ArrayLike)
+
+    Returns:
+        np.ndarray: ! a
+    """
+    return (as_degrees(a) == 0).astype(float)
+
+
+def and_(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ The product logic «conjunction» operator (&), applied elementwise. See
+    mvl.product.and_.
+
+    Args:
+        a (ArrayLike)
+        b (ArrayLike)
+
+    Returns:
+        np.ndarray: a & b (≡ a * (a → b))
+    """
+    return mult(a, implies(a, b))
+
+
+def mult_all(a: ArrayLike, axis: Optional[int] = None) -> np.ndarray:
+    """ The product logic «conjunction» (*) of every value along an axis (their
+    product). See mvl.product.mult_all.
+
+    Args:
+        a (ArrayLike)
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a * b * ...
+    """
+    return np.prod(as_degrees(a), axis=axis)
+
+
+def all_(a: ArrayLike, axis: Optional[int] = None) -> np.ndarray:
+    """ The product logic «conjunction» (&) of every value along an axis. As
+    a * (a → b) is the smaller of a and b, this is their minimum. See
+    mvl.product.all_.
+
+    Args:
+        a (ArrayLike)
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a & b & ...
+    """
+    return np.min(as_degrees(a), axis=axis, initial=1.0)
+
+
+def to_log(a: ArrayLike) -> np.ndarray:
+    """ Converts truth degrees into log space, elementwise. See
+    mvl.product.to_log.
+
+    Args:
+        a (ArrayLike)
+
+    Returns:
+        np.ndarray: log(a), with -inf wherever a is 0.
+
+    Raises:
+        ValueError: If any element of a is negative.
+    """
+    a = as_degrees(a)
+    if np.any(a < 0):
+        raise ValueError('Truth degrees can not be negative')
+    with np.errstate(divide='ignore'):
+        return np.log(a)
+
+
+def from_log(a: ArrayLike) -> np.ndarray:
+    """ Converts truth degrees in log space back into truth degrees,
+    elementwise. See mvl.product.from_log.
+
+    Args:
+        a (ArrayLike): Truth degrees in log space.
+
+    Returns:
+        np.ndarray: exp(a)
+    """
+    return np.exp(as_degrees(a))
+
+
+def log_mult(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ The product logic «conjunction» operator (*) in log space, applied
+    elementwise. See mvl.product.log_mult.
+
+    Args:
+        a (ArrayLike): Truth degrees in log space.
+        b (ArrayLike): Truth degrees in log space.
+
+    Returns:
+        np.ndarray: a + b
+    """
+    return as_degrees(a) + as_degrees(b)
+
+
+def log_implies(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ The product logic «implies» operator (→) in log space, applied
+    elementwise. See mvl.product.log_implies.
+
+    Args:
+        a (ArrayLike): Truth degrees in log space.
+        b (ArrayLike): Truth degrees in log space.
+
+    Returns:
+        np.ndarray: b - a where a > b, and 0 elsewhere.
+    """
+    a, b = np.broadcast_arrays(as_degrees(a), as_degrees(b))
+    # Only subtract where a > b, which also guarantees that a is never -inf.
+    return np.subtract(b, a, out=np.zeros(a.shape), where=a > b)
+
+
+def log_not(a: ArrayLike) -> np.ndarray:
+    """ The product logic «not» operator (!) in log space, applied elementwise.
+    See mvl.product.log_not.
+
+    Args:
+        a (ArrayLike): Truth degrees in log space.
+
+    Returns:
+        np.ndarray: 0 where a is -inf, and -inf elsewhere.
+    """
+    return np.where(as_degrees(a) == -np.inf, 0.0, -np.inf)
+
+
+def log_and(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ The product logic «conjunction» operator (&) in log space, applied
+    elementwise. See mvl.product.log_and.
+
+    Args:
+        a (ArrayLike): Truth degrees in log space.
+        b (ArrayLike): Truth degrees in log space.
+
+    Returns:
+        np.ndarray: min(a, b)
+    """
+    return np.minimum(as_degrees(a), as_degrees(b))
+
+
+def log_mult_all(a: ArrayLike, axis: Optional[int] = None) -> np.ndarray:
+    """ The product logic «conjunction» (*) of every value along an axis in log
+    space (their sum). See mvl.product.log_mult_all.
+
+    Args:
+        a (ArrayLike): Truth degrees in log space.
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a * b * ... in log space.
+    """
+    return np.sum(as_degrees(a), axis=axis)
+
+
+def log_all(a: ArrayLike, axis: Optional[int] = None) -> np.ndarray:
+    """ The product logic «conjunction» (&) of every value along an axis in log
+    space (their minimum). See mvl.product.log_all.
+
+    Args:
+        a (ArrayLike): Truth degrees in log space.
+        axis (Optional[int]): The axis to reduce, or None to reduce every
+            value.
+
+    Returns:
+        np.ndarray: a & b & ... in log space.
+    """
+    return np.min(as_degrees(a), axis=axis, initial=0.0)
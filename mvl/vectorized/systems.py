@@ -0,0 +1,276 @@
+"""
+.. module: vectorized.systems
+   :synopsis: Array methods for converting between floats, LogicValues, and the
+   indices of LogicValues in a LogicSystem.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+from inspect import Parameter, signature
+from typing import Callable, Iterable, Mapping, Optional, Union
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.formula import Const, Formula, Var
+from mvl.lukasiewicz import (
+    LogicSystem,
+    LogicValue,
+    ROUNDING_MODES,
+    ROUNDING_TOLERANCE,
+)
+from mvl.types import Floatable
+
+
+def index_dtype(n_values: int) -> np.dtype:
+    """ Returns the smallest unsigned integer type which can hold every index
+    of a logic system with n_values values.
+
+    Args:
+        n_values (int): The number of values in the logic system.
+
+    Returns:
+        np.dtype: uint8, uint16, uint32 or uint64.
+    """
+    return np.min_scalar_type(max(n_values - 1, 0))
+
+
+def value_array(system: LogicSystem) -> np.ndarray:
+    """ Returns the values of a logic system as an object array, so that they
+    can be looked up using arrays of indices.
+
+    Args:
+        system (LogicSystem)
+
+    Returns:
+        np.ndarray: An object array, equal to system.values.
+    """
+    values = np.empty(system.n_values, dtype=object)
+    values[:] = system.values
+    return values
+
+
+def designated(system: LogicSystem) -> np.ndarray:
+    """ Returns which values of a logic system are designated (considered to be
+    «true» by their __bool__ method).
+
+    Args:
+        system (LogicSystem)
+
+    Returns:
+        np.ndarray: A boolean array, True at the index of each designated value.
+    """
+    return np.array([bool(value) for value in system.values])
+
+
+def quantize(
+    system: LogicSystem,
+    fs: Iterable[Floatable],
+    rounding: str = 'nearest',
+) -> np.ndarray:
+    """ Converts every float in fs into the index of its associated logic value
+    in system. See LogicSystem.index.
+
+    Args:
+        system (LogicSystem): The logic system to convert the floats into.
+        fs (Iterable[Floatable]): The floats to convert.
+        rounding (str): One of 'nearest' (the default, rounding halves up);
+            'floor'; or 'ceil'.
+
+    Returns:
+        np.ndarray: The indices, with the same shape as fs, and with the type
+            given by index_dtype.
+
+    Raises:
+        ValueError: If any float is not in the range [0, 1], or rounding is not
+            a valid rounding mode.
+    """
+    if not isinstance(fs, np.ndarray):
+        fs = np.fromiter(fs, dtype=float) if _is_iterator(fs) else fs
+    fs = np.asarray(fs, dtype=float)
+
+    # Written to also reject NaNs, which fail every comparison.
+    if not np.all((fs >= 0) & (fs <= 1)):
+        raise ValueError('Every value must be in the range [0, 1]')
+
+    scaled = fs * (system.n_values - 1)
+    if rounding == 'nearest':
+        indices = np.floor(scaled + 0.5)
+    elif rounding == 'floor':
+        indices = np.floor(scaled + ROUNDING_TOLERANCE)
+    elif rounding == 'ceil':
+        indices = np.ceil(scaled - ROUNDING_TOLERANCE)
+    else:
+        raise ValueError('rounding must be one of {}, not {!r}'.format(
+            ROUNDING_MODES, rounding
+        ))
+
+    return indices.astype(index_dtype(system.n_values))
+
+
+def _is_iterator(fs: Iterable[Floatable]) -> bool:
+    """ Returns True iff fs is a one-shot iterator (like a generator), rather
+    than a container that numpy can convert directly.
+    """
+    return iter(fs) is fs
+
+
+class TruthTable:
+    """ The truth table of an operator over the values of a finite LogicSystem.
+
+    The table holds the index of op(*values) for every combination of values,
+    indexed by the indices of those values, so evaluating the operator is a
+    single lookup rather than a function call. Looking up arrays of indices
+    evaluates the operator over every element at once.
+
+    Most of the time, tables should be created with LogicSystem.truth_table,
+    which caches them.
+
+    Attributes:
+        system (LogicSystem): The logic system the table is defined over.
+        op (Callable): The operator the table was computed from.
+        arity (int): The number of arguments op takes.
+        table (np.ndarray): An array with arity dimensions, each of length
+            system.n_values, using the type given by index_dtype.
+    """
+
+    def __init__(
+        self,
+        system: LogicSystem,
+        op: Callable,
+        arity: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            system (LogicSystem): The logic system to tabulate op over.
+            op (Callable): The operator to tabulate.
+            arity (Optional[int]): The number of arguments op takes. Defaults
+                to the number of required arguments in its signature.
+
+        Raises:
+            ValueError: If op returns a value which is not in system.
+        """
+        self.system: LogicSystem = system
+        self.op: Callable = op
+        self.arity: int = count_arguments(op) if arity is None else arity
+        self.table: np.ndarray = np.empty(
+            (system.n_values,) * self.arity,
+            dtype=index_dtype(system.n_values),
+        )
+
+        for indices in np.ndindex(*self.table.shape):
+            values = [system.values[i] for i in indices]
+            try:
+                result = op(*values)
+            except TypeError:
+                # Some operators (like product.mult, which also works on
+                # arrays) only take numbers, not LogicValues.
+                result = op(*[float(value) for value in values])
+            self.table[indices] = _exact_index(system, result, op)
+
+    def __call__(
+        self,
+        *indices: Union[int, np.ndarray],
+    ) -> Union[int, np.ndarray]:
+        """ Evaluates the operator by looking up the given value indices.
+
+        Args:
+            indices (Union[int, np.ndarray]): One index, or one array of
+                indices, per argument of the operator. Arrays are broadcast
+                against each other.
+
+        Returns:
+            Union[int, np.ndarray]: The index (or array of indices) of the
+                result.
+        """
+        result = self.table[indices]
+        if isinstance(result, np.ndarray):
+            return result
+        return int(result)
+
+    def value(self, *values: LogicValue) -> LogicValue:
+        """ Evaluates the operator over LogicValues of the system.
+
+        Args:
+            values (LogicValue): One value of the system per argument of the
+                operator.
+
+        Returns:
+            LogicValue: The value of the system equal to op(*values).
+        """
+        indices = tuple(self.system.index(value) for value in values)
+        return self.system.values[self(*indices)]
+
+    def __repr__(self) -> str:
+        return 'TruthTable({}, n_values={})'.format(
+            getattr(self.op, '__qualname__', self.op), self.system.n_values
+        )
+
+
+def count_arguments(op: Callable) -> int:
+    """ Returns the number of positional arguments op requires.
+
+    Args:
+        op (Callable)
+
+    Returns:
+        int: The number of arguments.
+    """
+    return len([
+        parameter for parameter in signature(op).parameters.values()
+        if parameter.default is Parameter.empty
+        and parameter.kind in (
+            Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD
+        )
+    ])
+
+
+def _exact_index(system: LogicSystem, result: float, op: Callable) -> int:
+    """ Returns the index of the value of system which is equal to result.
+
+    Raises:
+        ValueError: If result is not (within rounding error) a value of system.
+    """
+    try:
+        return system.index(result, rounding=None)
+    except ValueError:
+        raise ValueError('{} returned {}, which is not a value of a {} '
+            'valued logic system'.format(
+                getattr(op, '__qualname__', op), result, system.n_values
+            )) from None
+
+
+def evaluate_indices(
+    formula: Formula,
+    system: LogicSystem,
+    env: Mapping[str, Union[int, np.ndarray]],
+) -> Union[int, np.ndarray]:
+    """ Evaluates a formula over value indices of a finite logic system, using
+    the truth table of each of its operators.
+
+    Args:
+        formula (Formula): The formula to evaluate.
+        system (LogicSystem): The logic system the indices refer to.
+        env (Mapping[str, Union[int, np.ndarray]]): The index (or array of
+            indices) of the value of each variable. Arrays are broadcast
+            against each other.
+
+    Returns:
+        Union[int, np.ndarray]: The index (or array of indices) of the value of
+            the formula.
+
+    Raises:
+        ValueError: If a constant of formula is not a value of system, or an
+            operator returns a value which is not.
+    """
+    results = {}
+    for node in formula.nodes():
+        if isinstance(node, Var):
+            results[node] = env[node.name]
+        elif isinstance(node, Const):
+            results[node] = system.index(node.value, rounding=None)
+        else:
+            table = system.truth_table(node.op)
+            results[node] = table(*[results[arg] for arg in node.args])
+    return results[formula]
@@ -0,0 +1,60 @@
+"""
+.. module: vectorized.tvl_operators
+   :synopsis: Array versions of the logical operators used in kleene and
+   priest 3 valued logic systems.
+
+.. moduleauthor: Andrew J. Young
+"""
+
+# Imports from third party packages.
+import numpy as np
+
+# Imports from the local package.
+from mvl.vectorized import ArrayLike
+from mvl.vectorized.lukasiewicz import not_
+from mvl.vectorized.lukasiewicz import w_and as and_
+from mvl.vectorized.lukasiewicz import w_or as or_
+from mvl.vectorized.lukasiewicz import w_all as all_
+from mvl.vectorized.lukasiewicz import w_any as any_
+
+
+def iff(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ The bicondition operator (↔) used by Kleene and Priest, applied
+    elementwise. See mvl.tvl_operators.iff.
+
+    Args:
+        a (ArrayLike)
+        b (ArrayLike)
+
+    Returns:
+        np.ndarray: a ↔ b
+    """
+    return and_(implies(a, b), implies(b, a))
+
+
+def xor(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ The xor operator used by Kleene and Priest, applied elementwise. See
+    mvl.tvl_operators.xor.
+
+    Args:
+        a (ArrayLike)
+        b (ArrayLike)
+
+    Returns:
+        np.ndarray: a xor b
+    """
+    return not_(iff(a, b))
+
+
+def implies(a: ArrayLike, b: ArrayLike) -> np.ndarray:
+    """ The implication operator (→) used by Kleene and Priest, applied
+    elementwise. See mvl.tvl_operators.implies.
+
+    Args:
+        a (ArrayLike)
+        b (ArrayLike)
+
+    Returns:
+        np.ndarray: a → b
+    """
+    return or_(not_(a), b)
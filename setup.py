@@ -14,10 +14,14 @@ setuptools.setup(
     long_description_content_type = 'text/markdown',
     url = 'https://github.com/andrewjunyoung/mvl',
     packages = setuptools.find_packages(),
+    extras_require = {
+        'numpy': ['numpy>=1.17'],
+        'pandas': ['numpy>=1.17', 'pandas>=1.3'],
+    },
     classifiers = [
         'Programming Language :: Python :: 3',
         'Operating System :: OS Independent',
         'License :: Public Domain',
     ],
-    python_requires = '>=3.6',
+    python_requires = '>=3.7',
 )
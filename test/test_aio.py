@@ -0,0 +1,151 @@
+# Imports from third party packages.
+from asyncio import CancelledError, run, sleep
+from itertools import product as cartesian_product
+from time import perf_counter
+from unittest import TestCase
+from unittest import main as unittest_main
+
+# Imports from the local package.
+from mvl.aio import binary, fold
+import mvl.aio.bochvar as aio_bochvar
+import mvl.aio.tvl_operators as aio_tvl_operators
+import mvl.bochvar as bochvar
+import mvl.kleene as kleene
+import mvl.tvl_operators as tvl_operators
+
+
+VALUES = [kleene.f, kleene.u, kleene.t]
+
+
+class Source:
+    """ A fake lookup, which gives a value after some latency.
+    """
+
+    def __init__(self, value, delay):
+        self.value = value
+        self.delay = delay
+        self.finished = False
+        self.cancelled = False
+
+    async def __call__(self):
+        try:
+            await sleep(self.delay)
+        except CancelledError:
+            self.cancelled = True
+            raise
+        self.finished = True
+        return self.value
+
+
+async def value(a):
+    return a
+
+
+class TestTvlOperators(TestCase):
+    def test_results(self):
+        ops = [
+            (aio_tvl_operators.and_, tvl_operators.and_),
+            (aio_tvl_operators.or_, tvl_operators.or_),
+            (aio_tvl_operators.implies, tvl_operators.implies),
+            (aio_tvl_operators.iff, tvl_operators.iff),
+            (aio_tvl_operators.xor, tvl_operators.xor),
+            (aio_bochvar.and_, bochvar.and_),
+            (aio_bochvar.or_, bochvar.or_),
+            (aio_bochvar.implies, bochvar.implies),
+        ]
+        for aio_op, op in ops:
+            for a, b in cartesian_product(VALUES, repeat=2):
+                expected = float(op(a, b))
+                self.assertEqual(run(aio_op(value(a), value(b))), expected)
+                self.assertEqual(run(aio_op(a, value(b))), expected)
+                self.assertEqual(run(aio_op(value(a), b)), expected)
+        for a in VALUES:
+            self.assertEqual(
+                run(aio_tvl_operators.not_(value(a))), tvl_operators.not_(a)
+            )
+
+    def test_cancels_pending_operands(self):
+        slow = Source(kleene.t, 10)
+        fast = Source(kleene.f, 0.01)
+        start = perf_counter()
+        result = run(aio_tvl_operators.and_(slow(), fast()))
+        self.assertLess(perf_counter() - start, 5)
+        self.assertEqual(result, kleene.f)
+        self.assertTrue(fast.finished)
+        self.assertTrue(slow.cancelled)
+
+    def test_waits_when_not_absorbing(self):
+        slow = Source(kleene.f, 0.05)
+        fast = Source(kleene.f, 0.01)
+        result = run(aio_tvl_operators.or_(slow(), fast()))
+        self.assertEqual(result, kleene.f)
+        self.assertTrue(slow.finished)
+
+        slow = Source(kleene.t, 0.05)
+        fast = Source(kleene.t, 0.01)
+        result = run(aio_tvl_operators.and_(slow(), fast()))
+        self.assertEqual(result, kleene.t)
+        self.assertTrue(slow.finished)
+
+    def test_nested(self):
+        slow = Source(kleene.t, 10)
+        fast = Source(kleene.t, 0.01)
+        formula = aio_tvl_operators.or_(
+            aio_tvl_operators.and_(slow(), kleene.t), fast()
+        )
+        self.assertEqual(run(formula), kleene.t)
+        self.assertTrue(slow.cancelled)
+
+    def test_all_any(self):
+        sources = [Source(kleene.t, 10), Source(kleene.u, 0.01),
+            Source(kleene.f, 0.02), Source(kleene.t, 10)]
+        result = run(aio_tvl_operators.all_(source() for source in sources))
+        self.assertEqual(result, kleene.f)
+        self.assertEqual(
+            [source.cancelled for source in sources], [True, False, False, True]
+        )
+        self.assertEqual(run(aio_tvl_operators.any_([])), kleene.f)
+        self.assertEqual(
+            run(aio_tvl_operators.any_([kleene.u, value(kleene.f)])), kleene.u
+        )
+        slow = Source(kleene.t, 10)
+        start = perf_counter()
+        result = run(aio_tvl_operators.all_([kleene.f, slow()]))
+        self.assertLess(perf_counter() - start, 5)
+        self.assertEqual(result, kleene.f)
+        self.assertFalse(slow.finished)
+
+    def test_bochvar(self):
+        slow = Source(bochvar.t, 10)
+        fast = Source(bochvar.u, 0.01)
+        self.assertEqual(run(aio_bochvar.or_(slow(), fast())), bochvar.u)
+        self.assertTrue(slow.cancelled)
+
+        sources = [Source(bochvar.t, 0.01), Source(bochvar.u, 0.02),
+            Source(bochvar.f, 10)]
+        result = run(aio_bochvar.any_(source() for source in sources))
+        self.assertEqual(result, bochvar.u)
+        self.assertTrue(sources[2].cancelled)
+        self.assertEqual(run(aio_bochvar.all_([])), bochvar.t)
+
+    def test_errors_cancel_pending_operands(self):
+        async def broken():
+            await sleep(0.01)
+            raise KeyError('lookup failed')
+
+        slow = Source(kleene.t, 10)
+        with self.assertRaises(KeyError):
+            run(aio_tvl_operators.and_(slow(), broken()))
+        self.assertTrue(slow.cancelled)
+
+        slow = Source(kleene.t, 10)
+        with self.assertRaises(KeyError):
+            run(fold(tvl_operators.and_, [slow(), broken()], 1, 0))
+        self.assertTrue(slow.cancelled)
+
+    def test_binary_without_absorbing_elements(self):
+        self.assertEqual(run(binary(max, value(0.25), value(0.5))), 0.5)
+
+
+if __name__ == '__main__':
+    unittest_main()
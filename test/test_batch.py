@@ -0,0 +1,69 @@
+# Imports from third party packages.
+from itertools import product as cartesian_product
+from unittest import TestCase
+from unittest import main as unittest_main
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.batch import evaluate_batch
+from mvl.formula import Apply, Var
+import mvl.bochvar as bochvar
+import mvl.goedel as goedel
+import mvl.kleene as kleene
+import mvl.lukasiewicz as lukasiewicz
+import mvl.post as post
+import mvl.product as product
+
+
+class TestEvaluateBatch(TestCase):
+    def setUp(self):
+        a, b, c = Var('a'), Var('b'), Var('c')
+        self.formulas = [
+            Apply(kleene.iff, a, Apply(kleene.or_, b, c)),
+            Apply(lukasiewicz.s_and, Apply(goedel.implies, a, b), c),
+            Apply(product.and_, a, Apply(product.not_, c)),
+            Apply(bochvar.implies, b, a),
+            a,
+        ]
+        degrees = [0, 0.25, 0.5, 0.75, 1]
+        self.records = [
+            {'a': a, 'b': b, 'c': c, 'ignored': 'x'}
+            for a, b, c in cartesian_product(degrees, repeat=3)
+        ]
+        self.expected = np.array([
+            [
+                formula(**{name: record[name] for name in formula.variables})
+                for formula in self.formulas
+            ]
+            for record in self.records
+        ])
+
+    def test_sequential(self):
+        results = evaluate_batch(self.formulas, self.records, processes=1)
+        np.testing.assert_array_equal(results, self.expected)
+
+    def test_processes(self):
+        results = evaluate_batch(
+            self.formulas, iter(self.records), processes=2, chunk_size=7
+        )
+        self.assertEqual(results.shape, (len(self.records), len(self.formulas)))
+        np.testing.assert_array_equal(results, self.expected)
+
+    def test_logic_values(self):
+        system = lukasiewicz.LogicSystem(4, post.PostLukasiewiczLogicValue)
+        formula = Apply(post.not_, Var('a'))
+        records = [{'a': value} for value in system.values]
+        results = evaluate_batch([formula], records, processes=2, chunk_size=1)
+        np.testing.assert_array_equal(results[:, 0], [1, 0, 1 / 3, 2 / 3])
+
+    def test_empty(self):
+        self.assertEqual(evaluate_batch(self.formulas, []).shape, (0, 5))
+        self.assertEqual(
+            evaluate_batch([], self.records, processes=1).shape,
+            (len(self.records), 0),
+        )
+
+
+if __name__ == '__main__':
+    unittest_main()
@@ -0,0 +1,127 @@
+# Imports from third party packages.
+from itertools import product as cartesian_product
+from pickle import dumps, loads
+from unittest import TestCase
+from unittest import main as unittest_main
+
+# Imports from the local package.
+from mvl.belnap import BelnapValue
+import mvl.belnap as belnap
+import mvl.kleene as kleene
+
+
+f, n, b, t = belnap.f, belnap.n, belnap.b, belnap.t
+PAIRS = list(cartesian_product(belnap.values, repeat=2))
+
+
+def truth_table(op):
+    return {(a, c): op(a, c) for a, c in PAIRS}
+
+
+class TestBelnapValue(TestCase):
+    def test_values_are_singletons(self):
+        self.assertIs(BelnapValue(True, True), b)
+        self.assertIs(BelnapValue(1, 0), t)
+        self.assertIs(loads(dumps(f)), f)
+        self.assertEqual(len(set(belnap.values)), 4)
+
+    def test_codes(self):
+        for code, value in enumerate(belnap.values):
+            self.assertEqual(value.code, code)
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            t.told_false = True
+
+    def test_designated(self):
+        self.assertEqual([bool(value) for value in belnap.values],
+            [value in belnap.designated for value in belnap.values])
+        self.assertEqual(set(belnap.designated), {t, b})
+
+    def test_repr(self):
+        self.assertEqual(repr(b), 'BelnapValue.Both')
+
+    def test_from_tvl(self):
+        self.assertEqual(
+            [belnap.from_tvl(value) for value in kleene.kleene.values],
+            [f, n, t],
+        )
+        with self.assertRaises(ValueError):
+            belnap.from_tvl(0.25)
+
+
+class TestOperators(TestCase):
+    def test_not_(self):
+        self.assertEqual([belnap.not_(value) for value in [f, n, b, t]],
+            [t, n, b, f])
+
+    def test_and_(self):
+        # The tables of Belnap (1977), in the order f, n, b, t.
+        rows = [
+            [f, f, f, f],
+            [f, n, f, n],
+            [f, f, b, b],
+            [f, n, b, t],
+        ]
+        order = [f, n, b, t]
+        for a, row in zip(order, rows):
+            for c, expected in zip(order, row):
+                self.assertIs(belnap.and_(a, c), expected)
+
+    def test_truth_lattice(self):
+        for a, c in PAIRS:
+            meet, join = belnap.and_(a, c), belnap.or_(a, c)
+            self.assertTrue(belnap.truth_le(meet, a))
+            self.assertTrue(belnap.truth_le(meet, c))
+            self.assertTrue(belnap.truth_le(a, join))
+            self.assertTrue(belnap.truth_le(c, join))
+            self.assertEqual(belnap.truth_le(a, c), meet is a)
+        self.assertFalse(belnap.truth_le(n, b))
+        self.assertFalse(belnap.truth_le(b, n))
+
+    def test_knowledge_lattice(self):
+        for a, c in PAIRS:
+            meet, join = belnap.consensus(a, c), belnap.gullibility(a, c)
+            self.assertTrue(belnap.knowledge_le(meet, a))
+            self.assertTrue(belnap.knowledge_le(a, join))
+            self.assertEqual(belnap.knowledge_le(a, c), join is c)
+        self.assertIs(belnap.gullibility(t, f), b)
+        self.assertIs(belnap.consensus(t, f), n)
+        self.assertFalse(belnap.knowledge_le(t, f))
+
+    def test_de_morgan(self):
+        for a, c in PAIRS:
+            self.assertIs(belnap.not_(belnap.and_(a, c)),
+                belnap.or_(belnap.not_(a), belnap.not_(c)))
+
+    def test_implies(self):
+        self.assertEqual(truth_table(belnap.implies), {
+            (a, c): belnap.or_(belnap.not_(a), c) for a, c in PAIRS
+        })
+
+    def test_agrees_with_kleene(self):
+        for a, c in cartesian_product(kleene.kleene.values, repeat=2):
+            for name in ['and_', 'or_', 'implies']:
+                op = getattr(belnap, name)
+                self.assertIs(
+                    op(belnap.from_tvl(a), belnap.from_tvl(c)),
+                    belnap.from_tvl(getattr(kleene, name)(a, c)),
+                )
+
+    def test_reductions(self):
+        self.assertIs(belnap.all_([]), t)
+        self.assertIs(belnap.any_([]), f)
+        self.assertIs(belnap.fuse([]), n)
+        self.assertIs(belnap.all_([t, b, n]), f)
+        self.assertIs(belnap.any_([f, b]), b)
+        self.assertIs(belnap.fuse([n, t, n]), t)
+
+        def values():
+            yield t
+            yield f
+            raise AssertionError('fuse read past b')
+        self.assertIs(belnap.fuse(values()), b)
+
+
+if __name__ == '__main__':
+    unittest_main()
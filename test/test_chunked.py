@@ -0,0 +1,121 @@
+# Imports from third party packages.
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest import main as unittest_main
+import tracemalloc
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.formula import Apply, Var
+from mvl.vectorized.chunked import evaluate_chunked, open_column
+from mvl.vectorized.formula import evaluate_degrees
+from mvl.vectorized.systems import evaluate_indices
+import mvl.goedel as goedel
+import mvl.kleene as kleene
+import mvl.lukasiewicz as lukasiewicz
+
+
+class TestEvaluateChunked(TestCase):
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        rng = np.random.default_rng(0)
+        self.a = rng.random(1000)
+        self.b = rng.random(1000)
+        self.formula = Apply(
+            lukasiewicz.implies, Var('a'), Apply(goedel.and_, Var('a'), Var('b'))
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return path.join(self.directory.name, name)
+
+    def write(self, name, values):
+        values.tofile(self.path(name))
+        return self.path(name)
+
+    def test_formula_on_files(self):
+        columns = {'a': self.write('a', self.a), 'b': self.write('b', self.b)}
+        out = evaluate_chunked(
+            self.formula, columns, self.path('out'), chunk_size=64
+        )
+        expected = evaluate_degrees(self.formula, {'a': self.a, 'b': self.b})
+        self.assertIsInstance(out, np.memmap)
+        np.testing.assert_array_equal(out, expected)
+        np.testing.assert_array_equal(
+            np.fromfile(self.path('out'), dtype=float), expected
+        )
+
+    def test_operator_on_memmaps(self):
+        a = open_column(self.write('a', self.a))
+        b = open_column(self.write('b', self.b))
+        out = evaluate_chunked(lukasiewicz.s_or, [a, b], chunk_size=100)
+        np.testing.assert_array_equal(out, np.minimum(1, self.a + self.b))
+
+    def test_indices(self):
+        system = kleene.kleene
+        a = np.arange(999, dtype=np.uint8) % 3
+        b = a[::-1].copy()
+        formula = Apply(kleene.iff, Var('a'), Var('b'))
+        out = evaluate_chunked(
+            formula,
+            {'a': self.write('a', a), 'b': self.write('b', b)},
+            system=system,
+            chunk_size=10,
+        )
+        self.assertEqual(out.dtype, np.uint8)
+        np.testing.assert_array_equal(
+            out, evaluate_indices(formula, system, {'a': a, 'b': b})
+        )
+
+    def test_indices_exact_constants(self):
+        system = kleene.kleene
+        a = np.arange(3, dtype=np.uint8)
+        np.testing.assert_array_equal(
+            evaluate_indices(Apply(kleene.and_, Var('a'), 0.5), system,
+                {'a': a}),
+            [0, 1, 1],
+        )
+        with self.assertRaises(ValueError):
+            evaluate_indices(Apply(kleene.and_, Var('a'), 0.3), system,
+                {'a': a})
+
+    def test_out_array(self):
+        out = np.zeros(1000)
+        result = evaluate_chunked(lukasiewicz.not_, [self.a], out)
+        self.assertIs(result, out)
+        np.testing.assert_array_equal(out, 1 - self.a)
+
+    def test_bounded_memory(self):
+        n = 1 << 20 # 8MB of float64s per column.
+        a = np.linspace(0, 1, n)
+        columns = [self.write('a', a), self.write('b', a[::-1].copy())]
+        del a
+
+        tracemalloc.start()
+        try:
+            evaluate_chunked(
+                lukasiewicz.s_and, columns, self.path('out'), chunk_size=4096
+            )
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, 1 << 20)
+
+        out = open_column(self.path('out'))
+        self.assertEqual(len(out), n)
+        # a + b == 1 everywhere, so a && b == 0 (up to rounding).
+        self.assertLess(float(np.max(out)), 1e-9)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            evaluate_chunked(lukasiewicz.s_and, [self.a, self.b[:10]])
+        with self.assertRaises(ValueError):
+            evaluate_chunked(lukasiewicz.not_, [self.a], np.zeros(10))
+
+
+if __name__ == '__main__':
+    unittest_main()
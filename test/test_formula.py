@@ -0,0 +1,136 @@
+# Imports from third party packages.
+from itertools import product as cartesian_product
+from pickle import dumps, loads
+from unittest import TestCase
+from unittest import main as unittest_main
+
+# Imports from the local package.
+from mvl.formula import Apply, Const, Var, expand
+from mvl.lukasiewicz import LogicSystem
+import mvl.bochvar as bochvar
+import mvl.goedel as goedel
+import mvl.kleene as kleene
+import mvl.lukasiewicz as lukasiewicz
+import mvl.post as post
+import mvl.product as product
+
+
+a = Var('a')
+b = Var('b')
+c = Var('c')
+
+
+class TestFormula(TestCase):
+    def _test_matches_operators(self, formula, inputs):
+        compiled = formula.compile()
+        for values in cartesian_product(inputs, repeat=len(formula.variables)):
+            env = dict(zip(formula.variables, values))
+            expected = formula.evaluate(env)
+
+            self.assertEqual(expected, compiled(*values))
+            self.assertEqual(expected, formula(**env))
+
+    def test_variables(self):
+        formula = Apply(kleene.and_, b, Apply(kleene.or_, a, b))
+        self.assertEqual(('b', 'a'), formula.variables)
+
+    def test_structural_equality(self):
+        self.assertEqual(Apply(kleene.and_, a, b), Apply(kleene.and_, a, b))
+        self.assertNotEqual(Apply(kleene.and_, a, b), Apply(kleene.and_, b, a))
+        self.assertEqual(
+            hash(Apply(kleene.not_, a)), hash(Apply(kleene.not_, Var('a')))
+        )
+        self.assertEqual(Const(0.5), Const(1 / 2))
+        self.assertEqual(Const(kleene.u), Const(kleene.u))
+        # Operators like post.not_ depend on the class of their arguments, so
+        # constants of different classes are kept apart.
+        self.assertNotEqual(Const(kleene.u), Const(0.5))
+        value = LogicSystem(3, post.PostLukasiewiczLogicValue).values[1]
+        formula = Apply(goedel.and_, Apply(post.not_, value), Apply(
+            post.not_, 0.5))
+        self.assertEqual(5, len(formula.nodes()))
+
+    def test_invalid_variable_names(self):
+        for name in ['1a', 'a b', 'for', '_mvl_t0']:
+            with self.assertRaises(ValueError):
+                Var(name)
+
+    def test_builtin_variable_names(self):
+        names = ['max', 'min', 'abs', 'float', 'bool']
+        for op in [lukasiewicz.s_and, lukasiewicz.equivalent, goedel.not_,
+                bochvar.and_]:
+            for name in names:
+                formula = Apply(op, *[Var(name)] * (1 if op is goedel.not_
+                    else 2))
+                self._test_matches_operators(formula, [0, 0.5, 1])
+        formula = Apply(lukasiewicz.s_and, Var('max'), Var('float'))
+        self.assertEqual(formula(0.5, 0.75), 0.25)
+
+    def test_evaluate(self):
+        formula = Apply(kleene.implies, a, Apply(kleene.and_, b, kleene.u))
+        self.assertEqual(0.5, formula.evaluate({'a': kleene.t, 'b': kleene.t}))
+        self.assertEqual(1, formula.evaluate({'a': kleene.f, 'b': kleene.f}))
+
+    def test_kleene_operators(self):
+        formula = Apply(
+            kleene.xor,
+            Apply(kleene.iff, a, Apply(kleene.implies, b, c)),
+            Apply(kleene.or_, Apply(kleene.not_, c), kleene.u),
+        )
+        self._test_matches_operators(formula, [kleene.f, kleene.u, kleene.t])
+
+    def test_bochvar_operators(self):
+        formula = Apply(
+            bochvar.implies,
+            Apply(bochvar.and_, a, b),
+            Apply(bochvar.or_, Apply(bochvar.iff, b, c), a),
+        )
+        self._test_matches_operators(formula, [bochvar.f, bochvar.u, bochvar.t])
+
+    def test_n_valued_operators(self):
+        inputs = [0, 0.25, 0.5, 0.6, 1]
+        formulas = [
+            Apply(lukasiewicz.s_and, Apply(lukasiewicz.s_or, a, b),
+                Apply(lukasiewicz.equivalent, a, Apply(lukasiewicz.not_, b))),
+            Apply(lukasiewicz.implies, Apply(lukasiewicz.w_and, a, b),
+                Apply(lukasiewicz.w_or, b, 0.25)),
+            Apply(goedel.implies, Apply(goedel.and_, a, b),
+                Apply(goedel.or_, Apply(goedel.not_, a), b)),
+            Apply(product.and_, Apply(product.implies, a, b),
+                Apply(product.mult, Apply(product.not_, b), a)),
+        ]
+        for formula in formulas:
+            self._test_matches_operators(formula, inputs)
+
+    def test_opaque_operators(self):
+        logic_system = LogicSystem(5, post.PostLukasiewiczLogicValue)
+        formula = Apply(goedel.and_, Apply(post.not_, a), b)
+        self._test_matches_operators(formula, logic_system.values)
+
+    def test_shared_subformulas_computed_once(self):
+        formula = Apply(kleene.iff, a, b)
+        source = formula.source()
+
+        # iff(a, b) is and_(or_(not_(a), b), or_(not_(b), a)), so a and b
+        # should each be negated once, and converted into a float once.
+        self.assertEqual(2, source.count('1 - '))
+        self.assertEqual(2, source.count('= _mvl_float('))
+        self.assertNotIn('_mvl_op', source)
+
+    def test_expand(self):
+        self.assertEqual(
+            Apply(kleene.or_, Apply(kleene.not_, a), b),
+            expand(Apply(kleene.implies, a, b)),
+        )
+
+    def test_variable_and_constant_formulas(self):
+        self.assertEqual(0.5, a(kleene.u))
+        self.assertEqual(1.0, Const(kleene.t)())
+
+    def test_pickle(self):
+        formula = Apply(kleene.and_, a, Apply(kleene.not_, kleene.u))
+        self.assertEqual(formula, loads(dumps(formula)))
+
+
+if __name__ == '__main__':
+    unittest_main()
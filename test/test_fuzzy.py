@@ -0,0 +1,202 @@
+# Imports from third party packages.
+from functools import reduce
+from unittest import TestCase
+from unittest import main as unittest_main
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.fuzzy import (
+    Gaussian,
+    Linear,
+    Mamdani,
+    Rule,
+    Sugeno,
+    Trapezoidal,
+    Triangular,
+    Variable,
+    centroid,
+)
+import mvl.goedel as goedel
+import mvl.lukasiewicz as lukasiewicz
+import mvl.product as product
+
+
+class TestMembershipFunctions(TestCase):
+    def test_triangular(self):
+        f = Triangular(0, 5, 10)
+        np.testing.assert_allclose(
+            f([-1, 0, 2.5, 5, 7.5, 10, 11]), [0, 0, 0.5, 1, 0.5, 0, 0]
+        )
+
+    def test_trapezoidal(self):
+        f = Trapezoidal(0, 2, 4, 8)
+        np.testing.assert_allclose(f([1, 3, 6, 9]), [0.5, 1, 0.5, 0])
+
+    def test_shoulders(self):
+        np.testing.assert_allclose(
+            Trapezoidal(-np.inf, -np.inf, 0, 10)([-100, 0, 5, 20]),
+            [1, 1, 0.5, 0],
+        )
+        np.testing.assert_allclose(
+            Trapezoidal(0, 10, 10, 10)([-1, 5, 10, 11]), [0, 0.5, 1, 0]
+        )
+        np.testing.assert_allclose(
+            Trapezoidal(-np.inf, 0, 1, 2)([-np.inf, -100, 0, 1.5, 3]),
+            [1, 1, 1, 0.5, 0],
+        )
+        np.testing.assert_allclose(
+            Trapezoidal(0, 1, 2, np.inf)([-1, 0.5, 2, 100, np.inf]),
+            [0, 0.5, 1, 1, 1],
+        )
+
+    def test_gaussian(self):
+        f = Gaussian(5, 2)
+        self.assertEqual(1, f(5))
+        self.assertAlmostEqual(np.exp(-0.5), float(f(7)))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            Trapezoidal(0, 2, 1, 3)
+        with self.assertRaises(ValueError):
+            Gaussian(0, 0)
+
+
+class TippingTestCase(TestCase):
+    def setUp(self):
+        self.service = Variable('service', {
+            'poor': Gaussian(0, 1.5),
+            'good': Gaussian(5, 1.5),
+            'excellent': Gaussian(10, 1.5),
+        })
+        self.food = Variable('food', {
+            'rancid': Trapezoidal(0, 0, 1, 3),
+            'delicious': Trapezoidal(7, 9, 10, 10),
+        })
+        self.tip = Variable('tip', {
+            'cheap': Triangular(0, 5, 10),
+            'average': Triangular(10, 15, 20),
+            'generous': Triangular(20, 25, 30),
+        }, universe=np.linspace(0, 30, 301))
+        random = np.random.default_rng(0)
+        self.samples = {
+            'service': random.uniform(0, 10, 200),
+            'food': random.uniform(0, 10, 200),
+        }
+
+
+class TestMamdani(TippingTestCase):
+    def rules(self):
+        return [
+            Rule({'service': 'poor', 'food': 'rancid'}, {'tip': 'cheap'}),
+            Rule({'service': 'good'}, {'tip': 'average'}),
+            Rule({'service': 'excellent', 'food': 'delicious'},
+                {'tip': 'generous'}, weight=0.8),
+        ]
+
+    def scalar_tip(self, service, food, and_, implication, aggregation):
+        """ Evaluates the rules one sample and one point at a time, with the
+        scalar operators.
+        """
+        universe = self.tip.universe
+        aggregated = [0.0] * len(universe)
+        for rule in self.rules():
+            memberships = []
+            for name, term in rule.antecedent.items():
+                variable = self.service if name == 'service' else self.food
+                x = service if name == 'service' else food
+                memberships.append(float(variable.terms[term](x)))
+            strength = reduce(and_, memberships, 1.0) * rule.weight
+            consequent = self.tip.terms[rule.consequent['tip']]
+            for k, point in enumerate(universe):
+                implied = implication(strength, float(consequent(point)))
+                aggregated[k] = aggregation(aggregated[k], implied)
+        return float(centroid(universe, np.array(aggregated)))
+
+    def test_matches_scalar_operators(self):
+        for and_, implication, aggregation in [
+                (goedel.and_, goedel.and_, goedel.or_),
+                (product.mult, product.mult, lukasiewicz.s_or),
+                (lukasiewicz.s_and, lukasiewicz.w_and, lukasiewicz.w_or)]:
+            system = Mamdani(
+                [self.service, self.food], [self.tip], self.rules(),
+                and_=and_, implication=implication, aggregation=aggregation,
+            )
+            tips = system(self.samples)['tip']
+            self.assertEqual(tips.shape, (200,))
+            for i in range(0, 200, 40):
+                expected = self.scalar_tip(
+                    self.samples['service'][i], self.samples['food'][i],
+                    and_, implication, aggregation,
+                )
+                self.assertAlmostEqual(expected, tips[i])
+
+    def test_aggregate(self):
+        system = Mamdani([self.service, self.food], [self.tip], self.rules())
+        aggregated = system.aggregate(self.samples)['tip']
+        self.assertEqual(aggregated.shape, (200, 301))
+        self.assertTrue(np.all((aggregated >= 0) & (aggregated <= 1)))
+
+    def test_no_rule_fires(self):
+        system = Mamdani(
+            [self.food], [self.tip],
+            [Rule({'food': 'rancid'}, {'tip': 'cheap'})],
+        )
+        tips = system({'food': [0, 10]})['tip']
+        self.assertAlmostEqual(5, tips[0])
+        self.assertTrue(np.isnan(tips[1]))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            Mamdani([self.food], [self.tip],
+                [Rule({'food': 'salty'}, {'tip': 'cheap'})])
+        with self.assertRaises(ValueError):
+            Mamdani([self.food], [self.tip],
+                [Rule({'drink': 'cold'}, {'tip': 'cheap'})])
+        with self.assertRaises(ValueError):
+            Mamdani([self.food], [self.tip],
+                [Rule({'food': 'rancid'}, {'tip': 'huge'})])
+        with self.assertRaises(ValueError):
+            Mamdani([self.food], [Variable('tip', self.tip.terms)], [])
+
+
+class TestSugeno(TippingTestCase):
+    def test_weighted_average(self):
+        rules = [
+            Rule({'service': 'poor', 'food': 'rancid'}, {'tip': 5}),
+            Rule({'service': 'good'}, {'tip': Linear(10, {'food': 0.5})}),
+            Rule({'service': 'excellent'}, {'tip': 25}),
+        ]
+        system = Sugeno([self.service, self.food], rules)
+        tips = system(self.samples)['tip']
+
+        for i in range(0, 200, 40):
+            service = self.samples['service'][i]
+            food = self.samples['food'][i]
+            strengths = [
+                float(self.service.terms['poor'](service))
+                * float(self.food.terms['rancid'](food)),
+                float(self.service.terms['good'](service)),
+                float(self.service.terms['excellent'](service)),
+            ]
+            values = [5, 10 + 0.5 * food, 25]
+            expected = (
+                sum(w * v for w, v in zip(strengths, values)) / sum(strengths)
+            )
+            self.assertAlmostEqual(expected, tips[i])
+
+    def test_many_samples(self):
+        rules = [
+            Rule({'service': 'poor'}, {'tip': 5}),
+            Rule({'service': 'excellent'}, {'tip': 25}),
+        ]
+        system = Sugeno([self.service], rules, and_=goedel.and_)
+        tips = system({'service': np.linspace(0, 10, 100001)})['tip']
+        self.assertEqual(tips.shape, (100001,))
+        self.assertAlmostEqual(5, tips[0])
+        self.assertAlmostEqual(25, tips[-1])
+        self.assertAlmostEqual(15, tips[50000], places=3)
+
+
+if __name__ == '__main__':
+    unittest_main()
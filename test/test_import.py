@@ -0,0 +1,87 @@
+# Imports from third party packages.
+from subprocess import STDOUT, check_output
+from sys import executable
+from typing import Any
+from unittest import TestCase
+from unittest import main as unittest_main
+import json
+
+# Imports from the local package.
+import mvl
+
+
+IMPORT_TIME_BUDGET: int = 50000
+""" The most time (in microseconds, as measured by python -X importtime) that
+import mvl may take. This is far more than it needs, so that the test only
+fails if something slow (like numpy) starts being imported eagerly.
+"""
+
+IMPORT_MODULE_BUDGET: int = 5
+""" The most modules that import mvl may load (including mvl itself).
+"""
+
+
+def run_isolated(code: str) -> Any:
+    """ Runs code in a new interpreter, and returns the JSON it prints.
+    """
+    return json.loads(check_output([executable, '-c', code]))
+
+
+class TestImport(TestCase):
+    def test_import_budget(self):
+        loaded = run_isolated('\n'.join([
+            'import json, sys',
+            'before = set(sys.modules)',
+            'import mvl',
+            'print(json.dumps(sorted(set(sys.modules) - before)))',
+        ]))
+
+        self.assertLessEqual(len(loaded), IMPORT_MODULE_BUDGET, loaded)
+        self.assertEqual(
+            ['mvl'], [name for name in loaded if name.startswith('mvl')]
+        )
+
+    def test_import_time_budget(self):
+        # -X importtime times each import on its own, so unlike timing the
+        # whole interpreter this does not count its start up.
+        output = check_output(
+            [executable, '-X', 'importtime', '-c', 'import mvl'],
+            stderr=STDOUT,
+            text=True,
+        )
+        cumulative = [
+            int(line.split('|')[1])
+            for line in output.splitlines()
+            if line.startswith('import time:')
+            and line.split('|')[-1].strip() == 'mvl'
+        ]
+        self.assertEqual(len(cumulative), 1, output)
+        self.assertLess(cumulative[0], IMPORT_TIME_BUDGET)
+
+    def test_core_modules_do_not_import_numpy(self):
+        loaded = run_isolated('\n'.join([
+            'import json, sys',
+            'import mvl.bochvar, mvl.kleene, mvl.priest, mvl.post, mvl.product',
+            'import mvl.formula, mvl.memo',
+            'print(json.dumps(sorted(sys.modules)))',
+        ]))
+        self.assertNotIn('numpy', loaded)
+
+    def test_lazy_modules(self):
+        import mvl.kleene
+        self.assertIs(mvl.kleene, mvl.__getattr__('kleene'))
+        self.assertEqual(0.5, mvl.kleene.and_(mvl.kleene.t, mvl.kleene.u))
+
+    def test_lazy_attributes(self):
+        from mvl.lukasiewicz import LogicSystem
+        self.assertIs(LogicSystem, mvl.LogicSystem)
+        self.assertIn('LogicSystem', dir(mvl))
+        self.assertIn('priest', dir(mvl))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            mvl.not_a_module
+
+
+if __name__ == '__main__':
+    unittest_main()
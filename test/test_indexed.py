@@ -0,0 +1,153 @@
+# Imports from third party packages.
+from itertools import product as cartesian_product
+from unittest import TestCase
+from unittest import main as unittest_main
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.indexed import as_indices, operator_for
+from mvl.lukasiewicz import LogicSystem, LukasiewiczLogicValue
+import mvl.bochvar as bochvar
+import mvl.goedel as goedel
+import mvl.indexed.bochvar as indexed_bochvar
+import mvl.indexed.lukasiewicz as indexed_lukasiewicz
+import mvl.indexed.tvl_operators as indexed_tvl_operators
+import mvl.kleene as kleene
+import mvl.lukasiewicz as lukasiewicz
+import mvl.post as post
+import mvl.product as product
+import mvl.tvl_operators as tvl_operators
+
+
+UNARY = [lukasiewicz.not_, goedel.not_, product.not_]
+BINARY = [
+    lukasiewicz.s_and,
+    lukasiewicz.w_and,
+    lukasiewicz.s_or,
+    lukasiewicz.w_or,
+    lukasiewicz.implies,
+    lukasiewicz.equivalent,
+    goedel.and_,
+    goedel.or_,
+    goedel.implies,
+]
+TVL_BINARY = [
+    tvl_operators.and_,
+    tvl_operators.or_,
+    tvl_operators.implies,
+    tvl_operators.iff,
+    tvl_operators.xor,
+    bochvar.and_,
+    bochvar.or_,
+    bochvar.implies,
+]
+
+
+class TestIndexedOperators(TestCase):
+    def assert_matches(self, system, op, arity):
+        indexed_op = system.indexed(op)
+        indices = np.arange(system.n_values, dtype=np.uint8)
+        for args in cartesian_product(indices, repeat=arity):
+            expected = system.index(op(*[system.values[i] for i in args]))
+            self.assertEqual(int(indexed_op(*args)), expected, (op, args))
+
+    def test_operators(self):
+        for n_values in [2, 3, 5, 11]:
+            system = LogicSystem(n_values, LukasiewiczLogicValue)
+            for op in UNARY:
+                self.assert_matches(system, op, 1)
+            for op in BINARY:
+                self.assert_matches(system, op, 2)
+
+    def test_tvl_operators(self):
+        for op in TVL_BINARY + [tvl_operators.not_]:
+            arity = 1 if op is tvl_operators.not_ else 2
+            self.assert_matches(kleene.kleene, op, arity)
+        self.assertEqual(int(indexed_tvl_operators.iff(2, 1)), 1)
+        self.assertEqual(int(indexed_bochvar.or_(2, 1)), 1)
+
+    def test_post_not(self):
+        for n_values in [2, 3, 7]:
+            system = LogicSystem(n_values, post.PostLukasiewiczLogicValue)
+            not_ = system.indexed(post.not_)
+            for i in range(n_values):
+                self.assertEqual(int(not_(i)), (i - 1) % n_values)
+            indices = np.arange(n_values, dtype=np.uint8)
+            self.assertEqual(not_(indices).dtype, np.uint8)
+
+    def test_no_overflow(self):
+        # Every operator stays in [0, 255] on uint8 arrays of 256 values.
+        a, b = np.meshgrid(np.arange(256), np.arange(256))
+        a = a.astype(np.uint8).ravel()
+        b = b.astype(np.uint8).ravel()
+        wide_a = a.astype(np.int64)
+        wide_b = b.astype(np.int64)
+        m = 255
+        expected = {
+            indexed_lukasiewicz.s_and: np.maximum(0, wide_a + wide_b - m),
+            indexed_lukasiewicz.s_or: np.minimum(m, wide_a + wide_b),
+            indexed_lukasiewicz.implies: np.minimum(m, m - wide_a + wide_b),
+            indexed_lukasiewicz.equivalent: m - np.abs(wide_a - wide_b),
+        }
+        for op, result in expected.items():
+            actual = op(a, b, m)
+            self.assertEqual(actual.dtype, np.uint8)
+            np.testing.assert_array_equal(actual, result)
+
+    def test_reductions(self):
+        a = np.array([[4, 3, 2], [4, 4, 4]], dtype=np.uint8)
+        np.testing.assert_array_equal(
+            indexed_lukasiewicz.s_all(a, 4, axis=1), [1, 4]
+        )
+        np.testing.assert_array_equal(
+            indexed_lukasiewicz.s_any(a, 4, axis=0), [4, 4, 4]
+        )
+        np.testing.assert_array_equal(
+            indexed_lukasiewicz.w_all(a, 4, axis=1), [2, 4]
+        )
+        self.assertEqual(int(indexed_lukasiewicz.w_any([], 4)), 0)
+        self.assertEqual(indexed_lukasiewicz.s_all(a, 4).dtype, np.uint8)
+
+        b = np.array([[0, 2], [1, 2], [2, 2]], dtype=np.uint8)
+        np.testing.assert_array_equal(indexed_bochvar.all_(b, axis=1), [0, 1, 2])
+        np.testing.assert_array_equal(indexed_bochvar.any_(b, axis=1), [2, 1, 2])
+
+    def test_matches_quantize(self):
+        system = LogicSystem(11, LukasiewiczLogicValue)
+        degrees = np.linspace(0, 1, 11)
+        indices = system.quantize(degrees)
+        s_or = system.indexed(lukasiewicz.s_or)
+        np.testing.assert_array_equal(
+            s_or(indices, indices[::-1]), system.quantize(
+                np.minimum(1, degrees + degrees[::-1])
+            )
+        )
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            as_indices([0.5])
+        with self.assertRaises(ValueError):
+            operator_for(product.mult)
+        with self.assertRaises(ValueError):
+            operator_for(max)
+
+    def test_product_operators_are_not_closed(self):
+        system = LogicSystem(5, LukasiewiczLogicValue)
+        self.assertEqual(int(system.indexed(product.not_)(0)), 4)
+        for op in [product.mult, product.implies, product.and_]:
+            with self.assertRaises(ValueError):
+                system.indexed(op)
+
+    def test_bochvar_needs_3_values(self):
+        system = LogicSystem(5, LukasiewiczLogicValue)
+        for op in [bochvar.and_, bochvar.or_, bochvar.implies]:
+            with self.assertRaises(ValueError):
+                system.indexed(op)([1, 4], [3, 4])
+        for op in [indexed_bochvar.all_, indexed_bochvar.any_]:
+            with self.assertRaises(ValueError):
+                op([1, 4], max_index=4)
+
+
+if __name__ == '__main__':
+    unittest_main()
@@ -0,0 +1,161 @@
+# Imports from third party packages.
+from io import StringIO
+from json import loads
+import pickle
+from unittest import TestCase
+from unittest import main as unittest_main
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.formula import Apply, Var
+from mvl.lazy import lazy
+from mvl.vectorized.systems import count_arguments
+import mvl.bochvar as bochvar
+import mvl.goedel as goedel
+import mvl.instrument as instrument
+import mvl.kleene as kleene
+import mvl.lukasiewicz as lukasiewicz
+import mvl.tvl_operators as tvl_operators
+
+
+class TestInstrument(TestCase):
+    def setUp(self):
+        instrument.reset()
+        self.originals = (goedel.and_, kleene.and_, tvl_operators.and_)
+        self.originals_or = goedel.or_
+
+    def tearDown(self):
+        instrument.disable()
+        instrument.reset()
+
+    def test_zero_cost_when_off(self):
+        self.assertFalse(instrument.is_enabled())
+        goedel.and_(0.5, 1)
+        self.assertEqual(instrument.operator_stats(), {})
+
+        code = goedel.and_.__code__
+        instrument.enable()
+        self.assertTrue(instrument.is_enabled())
+        self.assertIsNot(goedel.and_.__code__, code)
+        instrument.disable()
+        self.assertIs(goedel.and_.__code__, code)
+        self.assertEqual(
+            (goedel.and_, kleene.and_, tvl_operators.and_), self.originals
+        )
+
+    def test_counts_and_types(self):
+        with instrument.instrumented():
+            goedel.and_(0.5, 1)
+            goedel.and_(kleene.t, 0.5)
+            lukasiewicz.not_(np.array(0.25))
+
+        stats = instrument.operator_stats()
+        and_ = stats['mvl.goedel.and_']
+        self.assertEqual(and_.calls, 2)
+        self.assertGreaterEqual(and_.time, 0)
+        self.assertEqual(and_.types, {'float': 2, 'int': 1, 'LogicValue': 1})
+        self.assertEqual(stats['mvl.lukasiewicz.not_'].types, {'ndarray': 1})
+
+    def test_aliases_share_statistics(self):
+        with instrument.instrumented():
+            self.assertIs(kleene.and_, tvl_operators.and_)
+            self.assertIs(kleene.and_, lukasiewicz.w_and)
+            kleene.and_(kleene.t, kleene.u)
+            lukasiewicz.w_and(1, 0)
+        self.assertEqual(
+            instrument.operator_stats()['mvl.lukasiewicz.w_and'].calls, 2
+        )
+
+    def test_nested_operators(self):
+        with instrument.instrumented():
+            kleene.iff(kleene.t, kleene.u)
+            bochvar.all_([bochvar.t, bochvar.t])
+        stats = instrument.operator_stats()
+        self.assertEqual(stats['mvl.tvl_operators.iff'].calls, 1)
+        self.assertEqual(stats['mvl.tvl_operators.implies'].calls, 2)
+        self.assertEqual(stats['mvl.bochvar.and_'].calls, 2)
+
+    def test_formulas(self):
+        compiled = Apply(goedel.or_, Var('a'), Var('b'))
+        with instrument.instrumented():
+            built = Apply(goedel.or_, Var('a'), Var('b'))
+            compiled(0.5, 1)
+            built(a=kleene.t, b=0)
+        formulas = instrument.formula_stats()
+        self.assertEqual(formulas['or_(a, b)'].calls, 2)
+        # Instrumentation keeps the operators themselves, so formulas built
+        # while it is on still inline them.
+        self.assertIs(built.op, self.originals_or)
+        self.assertEqual(built, compiled)
+        self.assertNotIn('mvl.goedel.or_', instrument.operator_stats())
+
+    def test_operators_keep_their_identity(self):
+        with instrument.instrumented():
+            self.assertEqual(self.originals,
+                (goedel.and_, kleene.and_, tvl_operators.and_))
+            self.assertEqual(count_arguments(goedel.and_), 2)
+            formula = Apply(goedel.and_, Var('a'), Apply(bochvar.not_, 0.5))
+            self.assertEqual(pickle.loads(pickle.dumps(formula)), formula)
+            self.assertIs(pickle.loads(pickle.dumps(goedel.and_)), goedel.and_)
+            self.assertEqual(pickle.loads(pickle.dumps(formula))(1), 0.5)
+
+    def test_formulas_are_not_kept_per_call(self):
+        with instrument.instrumented():
+            for _ in range(3):
+                Apply(goedel.or_, Var('a'), Var('b'))(0, 1)
+        self.assertEqual(len(instrument._formulas), 1)
+        self.assertEqual(instrument.formula_stats()['or_(a, b)'].calls, 3)
+
+    def test_nothing_recorded_when_off(self):
+        with instrument.instrumented():
+            formula = Apply(goedel.or_, Var('a'), Var('b'))
+            wrapped = goedel.and_
+        instrument.reset()
+        formula(0.5, 1)
+        self.assertEqual(wrapped(0.5, 1), 0.5)
+        self.assertEqual(instrument.operator_stats(), {})
+        self.assertEqual(instrument.formula_stats(), {})
+
+    def test_lazy_operators_keep_absorbing_elements(self):
+        with instrument.instrumented():
+            lazy_and = lazy(kleene.and_)
+            lazy_and(kleene.f, lambda: kleene.t)
+        self.assertEqual(lazy_and.skipped, 1)
+
+    def test_report(self):
+        with instrument.instrumented():
+            for _ in range(3):
+                goedel.or_(0, 1)
+            goedel.and_(0, 1)
+        report = instrument.report(sort='calls')
+        lines = report.splitlines()
+        self.assertIn('calls', lines[0])
+        self.assertIn('mvl.goedel.or_', lines[1])
+        self.assertIn('int: 6', lines[1])
+        self.assertEqual(len(instrument.report(limit=1).splitlines()), 2)
+        with self.assertRaises(ValueError):
+            instrument.report(sort='speed')
+
+    def test_json(self):
+        with instrument.instrumented():
+            goedel.or_(0, 1)
+        data = loads(instrument.to_json())
+        self.assertEqual(data['operators'][0]['name'], 'mvl.goedel.or_')
+        self.assertEqual(data['operators'][0]['calls'], 1)
+        self.assertEqual(data['formulas'], [])
+
+        file = StringIO()
+        instrument.to_json(file)
+        self.assertEqual(loads(file.getvalue()), data)
+
+    def test_reset(self):
+        with instrument.instrumented():
+            goedel.or_(0, 1)
+        instrument.reset()
+        self.assertEqual(instrument.operator_stats(), {})
+        self.assertEqual(instrument.report(), '')
+
+
+if __name__ == '__main__':
+    unittest_main()
@@ -0,0 +1,103 @@
+# Imports from third party packages.
+from unittest import TestCase
+from unittest import main as unittest_main
+
+# Imports from the local package.
+from mvl.algebra import LEFT_ABSORBING, RIGHT_ABSORBING
+from mvl.lazy import LazyOperator, force, lazy
+import mvl.bochvar as bochvar
+import mvl.goedel as goedel
+import mvl.kleene as kleene
+import mvl.lukasiewicz as lukasiewicz
+
+
+DEGREES = [0, 0.25, 0.5, 0.75, 1]
+
+
+class Predicate:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+class TestAlgebra(TestCase):
+    def test_left_absorbing(self):
+        for op, absorbing in LEFT_ABSORBING.items():
+            for a, result in absorbing.items():
+                for b in DEGREES:
+                    self.assertEqual(float(op(a, b)), result, op)
+
+    def test_right_absorbing(self):
+        for op, absorbing in RIGHT_ABSORBING.items():
+            for b, result in absorbing.items():
+                for a in DEGREES:
+                    self.assertEqual(float(op(a, b)), result, op)
+
+
+class TestLazyOperator(TestCase):
+    def test_results(self):
+        for op in LEFT_ABSORBING:
+            lazy_op = lazy(op)
+            for a in DEGREES:
+                for b in DEGREES:
+                    self.assertEqual(
+                        float(lazy_op(lambda: a, lambda: b)),
+                        float(op(a, b)),
+                    )
+
+    def test_skips_second_argument(self):
+        lazy_and = lazy(kleene.and_)
+        predicate = Predicate(kleene.t)
+        self.assertEqual(lazy_and(kleene.f, predicate), kleene.f)
+        self.assertEqual(predicate.calls, 0)
+        self.assertEqual(lazy_and(kleene.t, predicate), kleene.t)
+        self.assertEqual(predicate.calls, 1)
+        self.assertEqual((lazy_and.evaluated, lazy_and.skipped), (1, 1))
+
+        lazy_and.reset()
+        self.assertEqual((lazy_and.evaluated, lazy_and.skipped), (0, 0))
+
+    def test_absorbing_elements(self):
+        predicate = Predicate(0.25)
+        lazy(goedel.or_)(1, predicate)
+        lazy(lukasiewicz.implies)(0, predicate)
+        lazy(bochvar.and_)(bochvar.u, predicate)
+        self.assertEqual(predicate.calls, 0)
+
+    def test_first_argument_is_always_evaluated(self):
+        predicate = Predicate(kleene.f)
+        lazy(kleene.and_)(predicate, kleene.t)
+        self.assertEqual(predicate.calls, 1)
+
+    def test_plain_values(self):
+        lazy_or = lazy(goedel.or_)
+        self.assertEqual(lazy_or(0.25, 0.5), 0.5)
+        self.assertEqual((lazy_or.evaluated, lazy_or.skipped), (0, 0))
+
+    def test_nesting(self):
+        predicate = Predicate(kleene.t)
+        lazy_and = lazy(kleene.and_)
+        lazy_or = lazy(kleene.or_)
+        result = lazy_or(kleene.t, lambda: lazy_and(kleene.t, predicate))
+        self.assertEqual(result, kleene.t)
+        self.assertEqual(predicate.calls, 0)
+
+    def test_custom_absorbing(self):
+        lazy_max = LazyOperator(max, {1.0: 1.0})
+        predicate = Predicate(0)
+        self.assertEqual(lazy_max(1, predicate), 1.0)
+        self.assertEqual(predicate.calls, 0)
+        self.assertEqual(lazy(max)(1, predicate), 1)
+        self.assertEqual(predicate.calls, 1)
+
+    def test_force(self):
+        self.assertEqual(force(0.5), 0.5)
+        self.assertEqual(force(lambda: kleene.u), kleene.u)
+
+
+if __name__ == '__main__':
+    unittest_main()
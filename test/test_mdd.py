@@ -0,0 +1,200 @@
+# Imports from third party packages.
+from itertools import product as cartesian_product
+from random import Random
+from unittest import TestCase
+from unittest import main as unittest_main
+
+# Imports from the local package.
+from mvl.formula import Apply, Var
+from mvl.lukasiewicz import LogicSystem, LukasiewiczLogicValue
+from mvl.mdd import Manager, equivalent
+from mvl.validity import are_equivalent
+import mvl.bochvar as bochvar
+import mvl.goedel as goedel
+import mvl.kleene as kleene
+import mvl.lukasiewicz as lukasiewicz
+import mvl.post as post
+
+
+def random_formula(random, ops, unary_ops, variables, depth):
+    if depth == 0 or random.random() < 0.2:
+        return Var(random.choice(variables))
+    if random.random() < 0.2:
+        return Apply(random.choice(unary_ops),
+            random_formula(random, ops, unary_ops, variables, depth - 1))
+    return Apply(random.choice(ops),
+        random_formula(random, ops, unary_ops, variables, depth - 1),
+        random_formula(random, ops, unary_ops, variables, depth - 1))
+
+
+def evaluate(formula, env, system):
+    # Converts every subformula into a value of system, as post.not_ only works
+    # on values of a system of Post values.
+    if isinstance(formula, Var):
+        return env[formula.name]
+    args = [evaluate(arg, env, system) for arg in formula.args]
+    return system.values[system.index(formula.op(*args))]
+
+
+class TestManager(TestCase):
+    def _test_agrees_with_formulas(self, system, ops, unary_ops):
+        random = Random(0)
+        manager = Manager(system, 'abc')
+        for _ in range(30):
+            formula = random_formula(random, ops, unary_ops, 'abc', 4)
+            node = manager.from_formula(formula)
+
+            counts = dict.fromkeys(system.values, 0)
+            for values in cartesian_product(system.values, repeat=3):
+                env = dict(zip('abc', values))
+                expected = evaluate(formula, env, system)
+                self.assertIs(manager.evaluate(node, env), expected)
+                counts[expected] += 1
+            self.assertEqual(manager.count(node), counts)
+
+    def test_kleene(self):
+        self._test_agrees_with_formulas(
+            kleene.kleene, [kleene.and_, kleene.or_, kleene.iff],
+            [kleene.not_],
+        )
+
+    def test_bochvar(self):
+        self._test_agrees_with_formulas(
+            bochvar.bochvar, [bochvar.and_, bochvar.or_, bochvar.implies],
+            [kleene.not_],
+        )
+
+    def test_lukasiewicz(self):
+        self._test_agrees_with_formulas(
+            LogicSystem(5, LukasiewiczLogicValue),
+            [lukasiewicz.s_and, lukasiewicz.w_or, lukasiewicz.implies],
+            [lukasiewicz.not_],
+        )
+
+    def test_goedel_and_post(self):
+        self._test_agrees_with_formulas(
+            LogicSystem(4, post.PostLukasiewiczLogicValue),
+            [goedel.and_, goedel.or_, goedel.implies, post.and_],
+            [goedel.not_, post.not_],
+        )
+
+    def test_canonical(self):
+        manager = Manager(kleene.kleene)
+        x, y = Var('x'), Var('y')
+        # De Morgan's laws hold in kleene logic.
+        a = manager.from_formula(Apply(kleene.and_, x, y))
+        b = manager.from_formula(Apply(kleene.not_, Apply(
+            kleene.or_, Apply(kleene.not_, x), Apply(kleene.not_, y))))
+        self.assertIs(a, b)
+        self.assertTrue(equivalent(a, b))
+
+        # The law of excluded middle does not.
+        c = manager.from_formula(Apply(kleene.or_, x, Apply(kleene.not_, x)))
+        self.assertFalse(equivalent(c, manager.const(kleene.t)))
+
+    def test_equivalence_agrees_with_validity(self):
+        random = Random(1)
+        system = kleene.kleene
+        manager = Manager(system, 'ab')
+        ops, unary_ops = [kleene.and_, kleene.or_, kleene.implies], [kleene.not_]
+        for _ in range(30):
+            f = random_formula(random, ops, unary_ops, 'ab', 3)
+            g = random_formula(random, ops, unary_ops, 'ab', 3)
+            self.assertEqual(
+                equivalent(manager.from_formula(f), manager.from_formula(g)),
+                are_equivalent(f, g, system, processes=1),
+            )
+
+    def test_reduced(self):
+        manager = Manager(kleene.kleene)
+        x = manager.var('x')
+        # x & !x & x is only unknown or false, but still depends on x.
+        node = manager.apply(kleene.and_, x, manager.apply(kleene.not_, x))
+        self.assertEqual(manager.variables(node), ['x'])
+        # x | t is always true, so does not test x at all.
+        node = manager.apply(kleene.or_, x, manager.const(kleene.t))
+        self.assertIs(node, manager.const(kleene.t))
+        self.assertEqual(manager.size(node), 1)
+
+    def test_sharing(self):
+        manager = Manager(kleene.kleene)
+        names = ['x{}'.format(i) for i in range(20)]
+        rules = [
+            Apply(kleene.and_, Var(names[i]), Var(names[i + 1]))
+            for i in range(len(names) - 1)
+        ]
+        chain = manager.const(kleene.t)
+        for rule in rules:
+            chain = manager.apply(kleene.and_, chain, manager.from_formula(rule))
+        size = len(manager)
+        # Building the same rules again creates no new nodes.
+        for rule in rules:
+            manager.from_formula(rule)
+        self.assertEqual(len(manager), size)
+        # A conjunction of 20 variables only needs 2 nodes per variable.
+        self.assertLessEqual(manager.size(chain), 2 * len(names) + 3)
+
+    def test_counts(self):
+        manager = Manager(kleene.kleene)
+        x, y = manager.var('x'), manager.var('y')
+        node = manager.apply(kleene.and_, x, y)
+        self.assertEqual(manager.count(node), {
+            kleene.f: 5, kleene.u: 3, kleene.t: 1,
+        })
+        self.assertEqual(manager.count_designated(node), 1)
+        self.assertEqual(manager.count_designated(
+            manager.apply(kleene.or_, x, y), ['x', 'y', 'z']
+        ), 15)
+        self.assertEqual(manager.count(x, ['x', 'y'])[kleene.u], 3)
+        with self.assertRaises(ValueError):
+            manager.count(node, ['x'])
+
+    def test_wrong_number_of_arguments(self):
+        manager = Manager(kleene.kleene)
+        with self.assertRaises(ValueError):
+            manager.apply(kleene.and_, manager.var('x'))
+
+    def test_operator_not_closed(self):
+        manager = Manager(kleene.kleene)
+        x = manager.var('x')
+        with self.assertRaises(ValueError):
+            manager.apply(lambda a, b: float(a) * float(b), x, x)
+
+    def test_evaluate_exact_values(self):
+        manager = Manager(kleene.kleene)
+        x = manager.var('x')
+        self.assertIs(manager.evaluate(x, {'x': 0.5}), kleene.u)
+        with self.assertRaises(ValueError):
+            manager.evaluate(x, {'x': 0.4})
+
+    def test_count_does_not_change_the_order(self):
+        manager = Manager(kleene.kleene)
+        x = manager.var('x')
+        counts = manager.count(x, ['x', 'y', 'z'])
+        self.assertEqual(counts, dict.fromkeys(kleene.kleene.values, 9))
+        self.assertEqual(manager.order, ['x'])
+
+    def test_deep_diagrams(self):
+        # A diagram with more levels than the recursion limit, built directly
+        # as building it through apply would take quadratic time.
+        names = ['x{}'.format(i) for i in range(5000)]
+        manager = Manager(kleene.kleene, names)
+        f, u, t = manager.terminals
+        node = t
+        for level in reversed(range(len(names))):
+            node = manager._node(level, (f, u, node))
+        negated = manager.apply(kleene.not_, node)
+        self.assertEqual(manager.size(negated), manager.size(node))
+        self.assertIs(manager.apply(kleene.not_, negated), node)
+
+    def test_constant_not_in_system(self):
+        manager = Manager(kleene.kleene)
+        self.assertIs(manager.const(0.5), manager.const(kleene.u))
+        with self.assertRaises(ValueError):
+            manager.const(0.3)
+        with self.assertRaises(ValueError):
+            manager.from_formula(Apply(kleene.and_, Var('x'), 0.3))
+
+
+if __name__ == '__main__':
+    unittest_main()
@@ -0,0 +1,118 @@
+# Imports from third party packages.
+from threading import Thread
+from unittest import TestCase
+from unittest import main as unittest_main
+
+# Imports from the local package.
+from mvl.formula import Apply, Var
+from mvl.memo import Memoized, memoize
+import mvl.kleene as kleene
+import mvl.lukasiewicz as lukasiewicz
+import mvl.product as product
+
+
+class CountingOperator:
+    def __init__(self, op):
+        self.op = op
+        self.calls = 0
+
+    def __call__(self, *args):
+        self.calls += 1
+        return self.op(*args)
+
+
+class TestMemoized(TestCase):
+    def setUp(self):
+        self.op = CountingOperator(lukasiewicz.implies)
+        self.memoized = Memoized(self.op, maxsize=2)
+
+    def test_results(self):
+        for a, b in [(0, 1), (1, 0.5), (0.25, 0.5)]:
+            self.assertEqual(lukasiewicz.implies(a, b), self.memoized(a, b))
+
+    def test_hits_and_misses(self):
+        self.memoized(1, 0.5)
+        self.memoized(1, 0.5)
+        self.memoized(0.5, 1)
+
+        self.assertEqual((1, 2, 2, 2), tuple(self.memoized.cache_info()))
+        self.assertEqual(2, self.op.calls)
+
+    def test_normalized_keys(self):
+        self.memoized(kleene.u, kleene.t)
+        self.memoized(0.5, 1)
+        self.memoized(kleene.kleene.values[1], 1.0)
+
+        self.assertEqual(1, self.op.calls)
+
+    def test_lru_eviction(self):
+        self.memoized(0, 0)
+        self.memoized(1, 1)
+        self.memoized(0, 0) # (0, 0) is now the most recently used.
+        self.memoized(0.5, 0.5) # Evicts (1, 1).
+        self.memoized(0, 0)
+        self.memoized(1, 1)
+
+        self.assertEqual(4, self.op.calls)
+        self.assertEqual(2, self.memoized.cache_info().currsize)
+
+    def test_cache_clear(self):
+        self.memoized(0, 0)
+        self.memoized.cache_clear()
+        self.assertEqual((0, 0, 2, 0), tuple(self.memoized.cache_info()))
+
+    def test_unbounded(self):
+        memoized = Memoized(self.op, maxsize=None)
+        for i in range(100):
+            memoized(i / 100, 0)
+        self.assertEqual(100, memoized.cache_info().currsize)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            Memoized(self.op, maxsize=-1)
+
+    def test_unhashable_arguments(self):
+        self.assertEqual(0, Memoized(len)([]))
+
+    def test_decorator(self):
+        @memoize(maxsize=8)
+        def and_(a, b):
+            return product.and_(a, b)
+
+        self.assertEqual(0.25, and_(0.25, 0.5))
+        self.assertEqual('and_', and_.__name__)
+        self.assertEqual(8, and_.maxsize)
+        self.assertIsInstance(memoize(product.mult), Memoized)
+
+    def test_formula(self):
+        formula = Apply(kleene.iff, Var('a'), Var('b'))
+        memoized = memoize(formula)
+
+        self.assertEqual(0.5, memoized(kleene.u, b=kleene.t))
+        self.assertEqual(0.5, memoized(0.5, b=1))
+        self.assertEqual(1, memoized.cache_info().hits)
+
+    def test_threads(self):
+        memoized = Memoized(lukasiewicz.s_and, maxsize=16)
+        inputs = [(i / 10, j / 10) for i in range(11) for j in range(11)]
+        errors = []
+
+        def work():
+            for a, b in inputs:
+                if memoized(a, b) != lukasiewicz.s_and(a, b):
+                    errors.append((a, b))
+
+        threads = [Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        info = memoized.cache_info()
+        self.assertEqual([], errors)
+        self.assertEqual(8 * len(inputs), info.hits + info.misses)
+        self.assertLessEqual(info.currsize, 16)
+
+
+if __name__ == '__main__':
+    unittest_main()
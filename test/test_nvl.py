@@ -1,4 +1,6 @@
 # Imports from third party packages.
+from functools import reduce
+from pickle import dumps, loads
 from unittest import TestCase
 from unittest import main as unittest_main
 
@@ -12,6 +14,10 @@ from mvl.lukasiewicz import (
     w_and,
     s_or,
     w_or,
+    s_all,
+    w_all,
+    s_any,
+    w_any,
     not_,
     implies,
     equivalent,
@@ -76,6 +82,24 @@ class TestLogicValue(TestCase):
     def test_repr_with_name(self):
         self._test_repr_with_name(self.class_name)
 
+    def test_hash(self):
+        self.assertEqual(hash(self.float_), hash(self.instance))
+        self.assertEqual({self.float_: 'value'}[self.instance], 'value')
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.instance.val = 0
+
+    def test_slots(self):
+        self.assertFalse(hasattr(self.instance, '__dict__'))
+
+    def test_pickle_without_system(self):
+        self.instance.name = 'test_name'
+        unpickled = loads(dumps(self.instance))
+
+        self.assertEqual(self.instance, unpickled)
+        self.assertEqual(repr(self.instance), repr(unpickled))
+
     def test_repr_without_name(self):
         self._test_repr_without_name(self.class_name)
 
@@ -132,6 +156,62 @@ class TestLogicSystem(TestCase):
         # Assert <n_values> logic values have been added.
         self.assertEqual(n_values, len(logic_system.values))
 
+    def test_cached(self):
+        self.assertIs(self._logic_system(), self._logic_system())
+        self.assertIsNot(
+            self._logic_system(), LogicSystem(self.n_values, PriestLogicValue)
+        )
+
+    def test_values_are_interned(self):
+        values = self._logic_system().values
+        self.assertIs(values[2], self._logic_system().values[2])
+        self.assertEqual(len(values), len(set(values)))
+
+    def test_mvl(self):
+        logic_system = self._logic_system()
+        inputs_to_output_map = {
+               0: 0,
+             0.1: 0,
+            0.13: 1,
+            0.25: 1,
+             0.5: 2,
+             0.7: 3,
+               1: 4,
+        }
+
+        for input_, expected_index in inputs_to_output_map.items():
+            self.assertIs(
+                logic_system.values[expected_index], logic_system.mvl(input_)
+            )
+
+    def test_index_rounding(self):
+        logic_system = LogicSystem(11, self.logic_value_class)
+
+        self.assertEqual(7, logic_system.index(0.7, 'floor'))
+        self.assertEqual(7, logic_system.index(0.7, 'ceil'))
+        self.assertEqual(7, logic_system.index(0.74, 'floor'))
+        self.assertEqual(8, logic_system.index(0.71, 'ceil'))
+        self.assertEqual(8, logic_system.index(0.75))
+        self.assertEqual(7, logic_system.index(0.7, None))
+        with self.assertRaises(ValueError):
+            logic_system.index(0.74, None)
+
+    def test_index_errors(self):
+        logic_system = self._logic_system()
+
+        for input_ in [-0.1, 1.1, float('nan')]:
+            with self.assertRaises(ValueError):
+                logic_system.index(input_)
+        with self.assertRaises(ValueError):
+            logic_system.index(0.5, 'up')
+
+    def test_pickle_by_reference(self):
+        logic_system = self._logic_system()
+        value = logic_system.values[3]
+
+        self.assertIs(logic_system, loads(dumps(logic_system)))
+        self.assertIs(value, loads(dumps(value)))
+
 
 class OperatorsTestCase(TestCase):
     __test__ = False
@@ -397,6 +477,65 @@ class TestProductOperators(OperatorsTestCase):
         self._test_unary_operator(product.not_, inputs_to_output_map)
 
 
+class TestProductLogSpace(TestCase):
+    inputs = [0, 0.1, 0.25, 0.5, 0.75, 1]
+
+    def test_conversions(self):
+        for a in self.inputs:
+            self.assertAlmostEqual(a, product.from_log(product.to_log(a)))
+        self.assertEqual(float('-inf'), product.to_log(0))
+        t = LogicSystem(2, LukasiewiczLogicValue).values[1]
+        self.assertEqual(0, product.to_log(t))
+
+    def test_operators(self):
+        for log_op, op in [
+                (product.log_mult, product.mult),
+                (product.log_and, product.and_),
+                (product.log_implies, product.implies)]:
+            for a in self.inputs:
+                for b in self.inputs:
+                    self.assertAlmostEqual(
+                        op(a, b),
+                        product.from_log(log_op(
+                            product.to_log(a), product.to_log(b)
+                        )),
+                    )
+        for a in self.inputs:
+            self.assertEqual(
+                product.not_(a),
+                product.from_log(product.log_not(product.to_log(a))),
+            )
+
+    def test_long_chains_do_not_underflow(self):
+        small = [0.1] * 400
+        self.assertEqual(0, product.mult_all(small))
+        logs = [product.to_log(a) for a in small]
+        chain = product.log_mult_all(logs)
+        self.assertAlmostEqual(400 * product.to_log(0.1), chain)
+
+        # (0.1 ** 400) → (0.1 ** 401) is 0.1, although both underflow to 0.
+        longer = product.log_mult_all(logs + [product.to_log(0.1)])
+        self.assertAlmostEqual(0.1, product.from_log(
+            product.log_implies(chain, longer)
+        ))
+        self.assertEqual(longer, product.log_and(chain, longer))
+
+    def test_reductions(self):
+        logs = [product.to_log(a) for a in [0.9, 0.8, 1, 0.75]]
+        self.assertAlmostEqual(
+            product.mult_all([0.9, 0.8, 1, 0.75]),
+            product.from_log(product.log_mult_all(logs)),
+        )
+        self.assertEqual(min(logs), product.log_all(logs))
+        self.assertEqual(0, product.log_mult_all([]))
+
+        def values():
+            yield float('-inf')
+            raise AssertionError('Read a value after the absorbing element')
+        self.assertEqual(float('-inf'), product.log_all(values()))
+        self.assertEqual(float('-inf'), product.log_mult_all(values()))
+
+
 class TestPostOperators(OperatorsTestCase):
     __test__ = True
 
@@ -426,5 +565,42 @@ class TestPostOperators(OperatorsTestCase):
         self._test_not_(post.PostLukasiewiczLogicValue)
 
 
+class TestReductions(TestCase):
+    inputs = [0.9, 0.8, 1, 0.75, 0.95]
+
+    def _test_reduction(self, reduction, op, identity, absorbing):
+        self.assertAlmostEqual(reduce(op, self.inputs), reduction(self.inputs))
+        self.assertEqual(identity, reduction([]))
+
+        # Values after the absorbing element are never read.
+        def values():
+            yield 0.5
+            yield absorbing
+            raise AssertionError('Read a value after the absorbing element')
+        self.assertEqual(absorbing, reduction(values()))
+
+    def test_lukasiewicz(self):
+        self._test_reduction(s_all, s_and, 1, 0)
+        self._test_reduction(s_any, s_or, 0, 1)
+        self._test_reduction(w_all, w_and, 1, 0)
+        self._test_reduction(w_any, w_or, 0, 1)
+
+    def test_s_all_closed_form(self):
+        expected = max(0, sum(self.inputs) - (len(self.inputs) - 1))
+        self.assertAlmostEqual(expected, s_all(self.inputs))
+
+    def test_goedel(self):
+        self._test_reduction(goedel.all_, goedel.and_, 1, 0)
+        self._test_reduction(goedel.any_, goedel.or_, 0, 1)
+
+    def test_product(self):
+        self._test_reduction(product.all_, product.and_, 1, 0)
+        self._test_reduction(product.mult_all, product.mult, 1, 0)
+
+    def test_post(self):
+        self.assertIs(goedel.all_, post.all_)
+        self.assertIs(goedel.any_, post.any_)
+
+
 if __name__ == '__main__':
     unittest_main()
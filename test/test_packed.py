@@ -0,0 +1,171 @@
+# Imports from third party packages.
+from itertools import product as cartesian_product
+from unittest import TestCase
+from unittest import main as unittest_main
+
+import numpy as np
+
+# Imports from the local package.
+import mvl.belnap as belnap
+import mvl.bochvar as bochvar
+import mvl.kleene as kleene
+import mvl.priest as priest
+import mvl.vectorized.belnap as packed_belnap
+import mvl.vectorized.packed as packed
+from mvl.vectorized.belnap import PackedBelnap
+from mvl.vectorized.packed import PackedTVL
+
+
+class TestPackedTVL(TestCase):
+    def setUp(self):
+        # Every pair of values, repeated so that the planes span several words
+        # and the last word is only partly used.
+        pairs = list(cartesian_product([0, 0.5, 1], repeat=2)) * 15
+        self.a = np.array([pair[0] for pair in pairs])
+        self.b = np.array([pair[1] for pair in pairs])
+        self.packed_a = PackedTVL.from_degrees(self.a)
+        self.packed_b = PackedTVL.from_degrees(self.b)
+
+    def _test_binary_operator(self, scalar_op, packed_op):
+        expected = [scalar_op(a, b) for a, b in zip(self.a, self.b)]
+        actual = packed_op(self.packed_a, self.packed_b).to_degrees()
+        self.assertEqual(expected, actual.tolist())
+
+    def test_round_trip(self):
+        self.assertEqual(self.a.tolist(), self.packed_a.to_degrees().tolist())
+        self.assertEqual(
+            self.packed_a,
+            PackedTVL.from_indices(kleene.kleene.quantize(self.a)),
+        )
+
+    def test_from_degrees_error(self):
+        with self.assertRaises(ValueError):
+            PackedTVL.from_degrees([0, 0.25])
+
+    def test_not_(self):
+        expected = [kleene.not_(a) for a in self.a]
+        self.assertEqual(expected, packed.not_(self.packed_a).to_degrees().tolist())
+        self.assertEqual(expected, (~self.packed_a).to_degrees().tolist())
+
+    def test_kleene_operators(self):
+        for name in ['and_', 'or_', 'implies', 'iff', 'xor']:
+            self._test_binary_operator(
+                getattr(kleene, name), getattr(packed, name)
+            )
+
+    def test_bochvar_operators(self):
+        self._test_binary_operator(bochvar.and_, packed.bochvar_and)
+        self._test_binary_operator(bochvar.or_, packed.bochvar_or)
+        self._test_binary_operator(bochvar.implies, packed.bochvar_implies)
+        self._test_binary_operator(bochvar.iff, packed.iff)
+
+    def test_operator_overloads(self):
+        self.assertEqual(
+            packed.and_(self.packed_a, self.packed_b),
+            self.packed_a & self.packed_b,
+        )
+        self.assertEqual(
+            packed.or_(self.packed_a, self.packed_b),
+            self.packed_a | self.packed_b,
+        )
+
+    def test_count(self):
+        for value in [kleene.f, kleene.u, kleene.t]:
+            self.assertEqual(
+                list(self.a).count(float(value)), self.packed_a.count(value)
+            )
+        with self.assertRaises(ValueError):
+            self.packed_a.count(0.25)
+
+    def test_bool(self):
+        self.assertEqual(
+            [bool(kleene.kleene.mvl(a)) for a in self.a],
+            self.packed_a.lukasiewicz_bool().tolist(),
+        )
+        self.assertEqual(
+            [bool(priest.priest.mvl(a)) for a in self.a],
+            self.packed_a.priest_bool().tolist(),
+        )
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            packed.and_(self.packed_a, PackedTVL.from_degrees([1]))
+
+
+class TestPackedBelnap(TestCase):
+    def setUp(self):
+        # Every pair of values, repeated so that the planes span several words
+        # and the last word is only partly used.
+        pairs = list(cartesian_product(belnap.values, repeat=2)) * 9
+        self.a = [pair[0] for pair in pairs]
+        self.b = [pair[1] for pair in pairs]
+        self.packed_a = PackedBelnap.from_values(self.a)
+        self.packed_b = PackedBelnap.from_values(self.b)
+
+    def _test_binary_operator(self, scalar_op, packed_op):
+        expected = [scalar_op(a, b) for a, b in zip(self.a, self.b)]
+        actual = packed_op(self.packed_a, self.packed_b).to_values()
+        self.assertEqual(expected, actual.tolist())
+
+    def test_round_trip(self):
+        self.assertEqual(self.a, self.packed_a.to_values().tolist())
+        self.assertEqual(
+            self.packed_a,
+            PackedBelnap.from_codes([value.code for value in self.a]),
+        )
+
+    def test_from_codes_error(self):
+        with self.assertRaises(ValueError):
+            PackedBelnap.from_codes([0, 4])
+
+    def test_from_tvl(self):
+        degrees = [0, 0.5, 1] * 30
+        self.assertEqual(
+            PackedBelnap.from_tvl(PackedTVL.from_degrees(degrees))
+                .to_values().tolist(),
+            [belnap.from_tvl(a) for a in degrees],
+        )
+
+    def test_not_(self):
+        expected = [belnap.not_(a) for a in self.a]
+        self.assertEqual(
+            expected, packed_belnap.not_(self.packed_a).to_values().tolist()
+        )
+        self.assertEqual(expected, (~self.packed_a).to_values().tolist())
+
+    def test_operators(self):
+        for name in ['and_', 'or_', 'implies', 'consensus', 'gullibility']:
+            self._test_binary_operator(
+                getattr(belnap, name), getattr(packed_belnap, name)
+            )
+
+    def test_operator_overloads(self):
+        self.assertEqual(
+            packed_belnap.and_(self.packed_a, self.packed_b),
+            self.packed_a & self.packed_b,
+        )
+        self.assertEqual(
+            packed_belnap.or_(self.packed_a, self.packed_b),
+            self.packed_a | self.packed_b,
+        )
+
+    def test_count(self):
+        for value in belnap.values:
+            self.assertEqual(self.a.count(value), self.packed_a.count(value))
+
+    def test_designated(self):
+        self.assertEqual(
+            [bool(a) for a in self.a], self.packed_a.designated().tolist()
+        )
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            packed_belnap.and_(
+                self.packed_a, PackedBelnap.from_values([belnap.t])
+            )
+        with self.assertRaises(ValueError):
+            PackedBelnap.from_bools([True], [True, False])
+
+
+if __name__ == '__main__':
+    unittest_main()
@@ -0,0 +1,203 @@
+# Imports from third party packages.
+from itertools import product as cartesian_product
+from pickle import dumps, loads
+from unittest import TestCase
+from unittest import main as unittest_main
+import io
+
+import numpy as np
+import pandas as pd
+
+# Imports from the local package.
+from mvl.lukasiewicz import LogicSystem, LukasiewiczLogicValue
+from mvl.pandas_ext import LogicArray, LogicDtype
+import mvl.bochvar as bochvar
+import mvl.kleene as kleene
+import mvl.lukasiewicz as lukasiewicz
+import mvl.post as post
+import mvl.priest as priest
+
+
+class TestLogicDtype(TestCase):
+    def test_name_round_trip(self):
+        dtype = LogicDtype(kleene.kleene, 'kleene')
+        self.assertEqual(dtype.name, 'mvl[kleene, LukasiewiczLogicValue, 3]')
+        self.assertEqual(LogicDtype.construct_from_string(dtype.name), dtype)
+        self.assertEqual(pd.api.types.pandas_dtype(dtype.name), dtype)
+        self.assertEqual(loads(dumps(dtype)), dtype)
+
+    def test_logic_is_part_of_the_dtype(self):
+        self.assertNotEqual(
+            LogicDtype(kleene.kleene, 'kleene'),
+            LogicDtype(bochvar.bochvar, 'bochvar'),
+        )
+
+    def test_defaults(self):
+        self.assertEqual(LogicDtype(kleene.kleene).logic, 'lukasiewicz')
+        system = LogicSystem(4, post.PostLukasiewiczLogicValue)
+        self.assertEqual(LogicDtype(system).logic, 'post')
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            LogicDtype(kleene.kleene, 'product')
+        with self.assertRaises(TypeError):
+            LogicDtype.construct_from_string('mvl[kleene, float, 3]')
+        with self.assertRaises(TypeError):
+            LogicDtype.construct_from_string('int8')
+
+    def test_post_logic_needs_post_values(self):
+        with self.assertRaises(ValueError):
+            LogicDtype(kleene.kleene, 'post')
+        with self.assertRaises(TypeError):
+            LogicDtype.construct_from_string(
+                'mvl[post, PriestLogicValue, 3]'
+            )
+
+    def test_compact_indices(self):
+        array = LogicArray._from_sequence(
+            [kleene.t] * 100, dtype=LogicDtype(kleene.kleene)
+        )
+        self.assertEqual(array.indices.dtype, np.int8)
+        self.assertEqual(array.nbytes, 100)
+        system = LogicSystem(1000, LukasiewiczLogicValue)
+        self.assertEqual(LogicDtype(system).index_dtype, np.int16)
+
+
+class TestLogicArray(TestCase):
+    def setUp(self):
+        self.dtype = LogicDtype(kleene.kleene, 'kleene')
+        # Every pair of values, and pairs with a missing value.
+        values = list(kleene.kleene.values)
+        pairs = list(cartesian_product(values, repeat=2))
+        self.a = pd.Series([a for a, _ in pairs] + [None, kleene.t],
+            dtype=self.dtype)
+        self.b = pd.Series([b for _, b in pairs] + [kleene.t, None],
+            dtype=self.dtype)
+        self.pairs = pairs
+
+    def _test_binary_operator(self, series_op, scalar_op, a, b):
+        result = series_op(a, b)
+        self.assertEqual(result.dtype, a.dtype)
+        expected = [scalar_op(x, y) for x, y in self.pairs]
+        self.assertEqual(result.tolist()[:len(self.pairs)], expected)
+        self.assertTrue(result.isna().tolist()[-2:] == [True, True])
+
+    def test_construction(self):
+        series = pd.Series([1, 0.5, None, kleene.f, np.nan, 'True'],
+            dtype=self.dtype)
+        self.assertEqual(series.tolist(), [
+            kleene.t, kleene.u, pd.NA, kleene.f, pd.NA, kleene.t,
+        ])
+        self.assertIs(series[0], kleene.t)
+
+    def test_kleene_operators(self):
+        self._test_binary_operator(
+            lambda a, b: a & b, kleene.and_, self.a, self.b)
+        self._test_binary_operator(
+            lambda a, b: a | b, kleene.or_, self.a, self.b)
+
+    def test_bochvar_operators(self):
+        dtype = LogicDtype(bochvar.bochvar, 'bochvar')
+        a, b = self.a.astype(dtype), self.b.astype(dtype)
+        self._test_binary_operator(
+            lambda a, b: a & b, bochvar.and_, a, b)
+        self._test_binary_operator(
+            lambda a, b: a | b, bochvar.or_, a, b)
+
+    def test_not_(self):
+        self.assertEqual(
+            (~self.a).tolist()[:-2], [kleene.not_(a) for a, _ in self.pairs]
+        )
+        system = LogicSystem(4, post.PostLukasiewiczLogicValue)
+        series = pd.Series(system.values, dtype=LogicDtype(system))
+        self.assertEqual(
+            (~series).tolist(), [post.not_(value) for value in system.values]
+        )
+
+    def test_scalar_operands(self):
+        self.assertEqual((self.a & kleene.f).tolist()[:-2], [kleene.f] * 9)
+        self.assertEqual((kleene.t | self.a).tolist()[:-2], [kleene.t] * 9)
+
+    def test_different_dtypes(self):
+        with self.assertRaises(TypeError):
+            self.a.array & self.b.astype(LogicDtype(bochvar.bochvar)).array
+
+    def test_designated(self):
+        self.assertEqual(
+            self.a.mvl.designated().tolist(),
+            [bool(a) for a, _ in self.pairs] + [False, True],
+        )
+        as_priest = self.a.astype(LogicDtype(priest.priest, 'priest'))
+        self.assertEqual(
+            as_priest.mvl.designated().tolist(),
+            [bool(priest.priest.mvl(a)) for a, _ in self.pairs] + [False, True],
+        )
+        frame = pd.DataFrame({'a': self.a, 'n': range(len(self.a))})
+        self.assertEqual(
+            frame[frame['a'].mvl.designated()]['n'].tolist(), [6, 7, 8, 10]
+        )
+
+    def test_degrees(self):
+        degrees = self.a.astype(float).tolist()
+        self.assertEqual(degrees[:-2], [float(a) for a, _ in self.pairs])
+        self.assertTrue(np.isnan(degrees[-2]))
+        self.assertEqual(self.a.mvl.degrees().tolist()[:-2], degrees[:-2])
+
+    def test_take_and_concat(self):
+        taken = self.a.take([0, 9, 10])
+        self.assertEqual(taken.tolist(), [kleene.f, pd.NA, kleene.t])
+        self.assertEqual(self.a.reindex([0, 100]).tolist(), [kleene.f, pd.NA])
+        joined = pd.concat([self.a, self.b], ignore_index=True)
+        self.assertEqual(joined.dtype, self.dtype)
+        self.assertEqual(joined.tolist(), self.a.tolist() + self.b.tolist())
+
+    def test_groupby(self):
+        frame = pd.DataFrame({'a': self.a, 'n': np.ones(len(self.a))})
+        counts = frame.groupby('a', dropna=False)['n'].sum()
+        self.assertEqual(counts.tolist(), [3, 3, 4, 1])
+        self.assertEqual(self.a.value_counts()[kleene.t], 4)
+
+    def test_sort(self):
+        self.assertEqual(
+            self.a.sort_values().tolist(),
+            [kleene.f] * 3 + [kleene.u] * 3 + [kleene.t] * 4 + [pd.NA],
+        )
+
+    def test_setitem_and_fillna(self):
+        series = self.a.copy()
+        series[0] = kleene.t
+        series[[1, 2]] = [0.5, None]
+        self.assertEqual(series.tolist()[:3], [kleene.t, kleene.u, pd.NA])
+        self.assertFalse(series.fillna(kleene.u).isna().any())
+        self.assertEqual(self.a[0], kleene.f)
+
+    def test_read_csv(self):
+        frame = pd.read_csv(
+            io.StringIO('a,b\nTrue,0\nUnknown,1\nFalse,0.5\n'),
+            dtype={'a': self.dtype, 'b': self.dtype},
+        )
+        self.assertEqual(frame['a'].tolist(), [kleene.t, kleene.u, kleene.f])
+        self.assertEqual((frame['a'] & frame['b']).tolist(),
+            [kleene.f, kleene.u, kleene.f])
+
+    def test_pickle(self):
+        self.assertTrue(loads(dumps(self.a)).equals(self.a))
+
+    def test_n_valued(self):
+        system = LogicSystem(5, LukasiewiczLogicValue)
+        dtype = LogicDtype(system)
+        a = pd.Series([0, 0.25, 0.5, 0.75, 1], dtype=dtype)
+        b = pd.Series([1, 0.75, 0.5, 0.25, 0], dtype=dtype)
+        self.assertEqual(
+            (a & b).astype(float).tolist(), [0, 0.25, 0.5, 0.25, 0]
+        )
+        self.assertEqual(
+            (a | b).astype(float).tolist(), [1, 0.75, 0.5, 0.75, 1]
+        )
+        self.assertEqual(
+            (~a).tolist(), [lukasiewicz.not_(value) for value in a]
+        )
+
+
+if __name__ == '__main__':
+    unittest_main()
@@ -0,0 +1,114 @@
+# Imports from third party packages.
+from functools import reduce
+from random import Random
+from unittest import TestCase
+from unittest import main as unittest_main
+
+# Imports from the local package.
+from mvl.formula import Apply, Const, Var
+from mvl.lukasiewicz import LogicSystem, LukasiewiczLogicValue
+from mvl.sat import Solver, is_satisfiable, solve
+from mvl.validity import find_model
+import mvl.bochvar as bochvar
+import mvl.goedel as goedel
+import mvl.kleene as kleene
+import mvl.lukasiewicz as lukasiewicz
+import mvl.priest as priest
+
+
+def random_formula(random, ops, unary_ops, variables, depth):
+    if depth == 0 or random.random() < 0.2:
+        return Var(random.choice(variables))
+    if random.random() < 0.2:
+        return Apply(random.choice(unary_ops),
+            random_formula(random, ops, unary_ops, variables, depth - 1))
+    return Apply(random.choice(ops),
+        random_formula(random, ops, unary_ops, variables, depth - 1),
+        random_formula(random, ops, unary_ops, variables, depth - 1))
+
+
+class TestSolver(TestCase):
+    def _test_agrees_with_enumeration(self, system, ops, unary_ops):
+        random = Random(0)
+        for _ in range(40):
+            formula = random_formula(random, ops, unary_ops, 'abcd', 4)
+            model = solve(formula, system)
+
+            if model is None:
+                self.assertIsNone(find_model(formula, system, processes=1))
+            else:
+                self.assertTrue(bool(system.values[system.index(
+                    formula.evaluate(model)
+                )]))
+
+    def test_kleene(self):
+        self._test_agrees_with_enumeration(kleene.kleene,
+            [kleene.and_, kleene.or_, kleene.implies, kleene.iff], [kleene.not_])
+
+    def test_priest(self):
+        self._test_agrees_with_enumeration(priest.priest,
+            [priest.and_, priest.or_, priest.xor], [priest.not_])
+
+    def test_bochvar(self):
+        self._test_agrees_with_enumeration(bochvar.bochvar,
+            [bochvar.and_, bochvar.or_, bochvar.implies], [bochvar.not_])
+
+    def test_n_valued(self):
+        self._test_agrees_with_enumeration(
+            LogicSystem(5, LukasiewiczLogicValue),
+            [lukasiewicz.s_and, lukasiewicz.s_or, goedel.implies,
+                lukasiewicz.implies],
+            [lukasiewicz.not_, goedel.not_],
+        )
+
+    def test_unsatisfiable(self):
+        a = Var('a')
+        formula = Apply(kleene.and_, a, Apply(kleene.not_, a))
+        self.assertFalse(is_satisfiable(formula, kleene.kleene))
+        self.assertEqual({'a': priest.u}, solve(formula, priest.priest))
+
+    def test_targets(self):
+        a = Var('a')
+        formula = Apply(kleene.or_, a, Apply(kleene.not_, a))
+        self.assertEqual({'a': kleene.u}, solve(formula, kleene.kleene,
+            targets=[kleene.u]))
+
+    def test_constants(self):
+        formula = Apply(kleene.and_, Var('a'), 0.5)
+        self.assertEqual({'a': kleene.u},
+            solve(formula, kleene.kleene, targets=[kleene.u]))
+        with self.assertRaises(ValueError):
+            solve(Apply(kleene.and_, Var('a'), 0.3), kleene.kleene)
+        with self.assertRaises(ValueError):
+            solve(formula, kleene.kleene, targets=[0.3])
+
+    def test_constant_formulas(self):
+        self.assertIsNone(solve(Const(0), kleene.kleene))
+        self.assertFalse(is_satisfiable(Const(0.5), kleene.kleene))
+        self.assertEqual({}, solve(Const(1), kleene.kleene))
+        self.assertIsNone(solve(Var('a'), kleene.kleene, targets=[]))
+
+    def test_many_variables(self):
+        # A chain x0 → x1 → ... → x199 which must hold, with x0 true and the
+        # last variable required to be false somewhere down the chain: this is
+        # unsatisfiable, and enumerating 3^200 assignments is not an option.
+        names = ['x{}'.format(i) for i in range(200)]
+        links = [
+            Apply(kleene.implies, Var(a), Var(b))
+            for a, b in zip(names, names[1:])
+        ]
+        chain = reduce(lambda a, b: Apply(kleene.and_, a, b), links)
+        formula = Apply(kleene.and_, chain, Var('x0'))
+
+        solver = Solver(formula, kleene.kleene)
+        model = solver.solve()
+        self.assertEqual({name: kleene.t for name in names}, model)
+        self.assertEqual(0, solver.conflicts)
+
+        contradiction = Apply(kleene.and_, formula,
+            Apply(kleene.not_, Var(names[-1])))
+        self.assertFalse(is_satisfiable(contradiction, kleene.kleene))
+
+
+if __name__ == '__main__':
+    unittest_main()
@@ -0,0 +1,153 @@
+# Imports from third party packages.
+from itertools import product as cartesian_product
+from unittest import TestCase
+from unittest import main as unittest_main
+
+# Imports from the local package.
+from mvl.algebra import (
+    IDEMPOTENT,
+    INVOLUTIONS,
+    LEFT_IDENTITY,
+    RIGHT_IDENTITY,
+)
+from mvl.formula import Apply, Const, Var
+from mvl.simplify import simplify
+import mvl.bochvar as bochvar
+import mvl.goedel as goedel
+import mvl.kleene as kleene
+import mvl.lukasiewicz as lukasiewicz
+import mvl.product as product
+
+
+DEGREES = [0, 0.25, 0.5, 0.75, 1]
+TVL_DEGREES = [0, 0.5, 1]
+x = Var('x')
+y = Var('y')
+
+
+def degrees(op):
+    # The bochvar operators are only defined on the 3 values of the system.
+    return TVL_DEGREES if op.__module__ == 'mvl.bochvar' else DEGREES
+
+
+class TestAlgebra(TestCase):
+    def test_left_identity(self):
+        for op, identity in LEFT_IDENTITY.items():
+            for b in DEGREES:
+                self.assertAlmostEqual(float(op(identity, b)), b, msg=op)
+
+    def test_right_identity(self):
+        for op, identity in RIGHT_IDENTITY.items():
+            for a in DEGREES:
+                self.assertAlmostEqual(float(op(a, identity)), a, msg=op)
+
+    def test_idempotent(self):
+        for op in IDEMPOTENT:
+            for a in DEGREES:
+                self.assertEqual(float(op(a, a)), a, op)
+
+    def test_involutions(self):
+        for op in INVOLUTIONS:
+            for a in degrees(op):
+                self.assertAlmostEqual(float(op(op(a))), a, msg=op)
+
+
+class TestSimplify(TestCase):
+    def assertEquivalent(self, formula, simplified):
+        names = sorted(formula.variables)
+        grid = degrees(formula.op)
+        for values in cartesian_product(grid, repeat=len(names)):
+            env = dict(zip(names, values))
+            self.assertAlmostEqual(
+                float(simplified.evaluate(env)), float(formula.evaluate(env))
+            )
+
+    def test_identities(self):
+        self.assertEqual(simplify(Apply(lukasiewicz.w_and, x, 1)), x)
+        self.assertEqual(simplify(Apply(lukasiewicz.s_or, 0, x)), x)
+        self.assertEqual(simplify(Apply(goedel.or_, x, 0)), x)
+        self.assertEqual(simplify(Apply(product.mult, 1, x)), x)
+        self.assertEqual(simplify(Apply(goedel.implies, 1, x)), x)
+
+    def test_bochvar_identities_are_not_used(self):
+        # 1 is only Bochvar's identity on the 3 values of the system.
+        formula = Apply(bochvar.and_, 1, x)
+        self.assertEqual(simplify(formula), formula)
+        self.assertEqual(simplify(formula)(x=0.3), 1.0)
+        formula = Apply(bochvar.or_, x, x)
+        self.assertEqual(simplify(formula), formula)
+
+    def test_implies_has_no_right_identity(self):
+        formula = Apply(goedel.implies, x, 1)
+        self.assertEqual(simplify(formula), Const(1))
+        formula = Apply(goedel.implies, x, 0)
+        self.assertEqual(simplify(formula), formula)
+
+    def test_absorbing(self):
+        self.assertEqual(simplify(Apply(kleene.and_, kleene.f, x)), Const(0))
+        self.assertEqual(simplify(Apply(kleene.or_, x, kleene.t)), Const(1))
+        self.assertEqual(simplify(Apply(bochvar.or_, x, bochvar.u)), Const(0.5))
+        formula = Apply(kleene.or_, x, kleene.u)
+        self.assertEqual(simplify(formula), formula)
+
+    def test_idempotent(self):
+        self.assertEqual(simplify(Apply(goedel.and_, x, x)), x)
+        formula = Apply(lukasiewicz.s_and, x, x)
+        self.assertEqual(simplify(formula), formula)
+
+    def test_involutions(self):
+        formula = Apply(lukasiewicz.not_, Apply(lukasiewicz.not_, x))
+        self.assertEqual(simplify(formula), x)
+        formula = Apply(goedel.not_, Apply(goedel.not_, x))
+        self.assertEqual(simplify(formula), formula)
+
+    def test_constant_folding(self):
+        formula = Apply(lukasiewicz.s_or, 0.25, Apply(lukasiewicz.not_, 0.5))
+        self.assertEqual(simplify(formula), Const(0.75))
+
+    def test_folding_errors_are_deferred(self):
+        import mvl.post as post
+        formula = Apply(post.not_, 0.5)
+        self.assertEqual(simplify(formula), formula)
+
+    def test_partial_evaluation(self):
+        formula = Apply(
+            kleene.or_,
+            Apply(kleene.and_, x, y),
+            Apply(kleene.not_, y),
+        )
+        self.assertEqual(simplify(formula, {'y': kleene.t}), x)
+        self.assertEqual(simplify(formula, {'y': kleene.f}), Const(1))
+        self.assertEqual(simplify(formula, {'x': 1, 'y': 0.5}), Const(0.5))
+        self.assertEqual(simplify(formula, {'z': 1}), formula)
+
+    def test_rewrites_cascade(self):
+        # !!(x & 1) | (x & x) → x | x → x
+        formula = Apply(
+            kleene.or_,
+            Apply(kleene.not_, Apply(kleene.not_, Apply(kleene.and_, x, 1))),
+            Apply(kleene.and_, x, x),
+        )
+        simplified = simplify(formula)
+        self.assertEqual(simplified, x)
+        self.assertLess(len(simplified.nodes()), len(formula.nodes()))
+
+    def test_equivalent(self):
+        formulas = [
+            Apply(lukasiewicz.implies, Apply(lukasiewicz.w_and, x, 1), y),
+            Apply(goedel.or_, Apply(goedel.and_, y, y), Apply(goedel.or_, x, 0)),
+            Apply(product.and_, Apply(product.mult, 1, x), Apply(
+                product.implies, y, 1)),
+            Apply(bochvar.and_, Apply(bochvar.or_, x, y), Apply(
+                bochvar.implies, bochvar.u, y)),
+            Apply(lukasiewicz.equivalent, Apply(
+                lukasiewicz.not_, Apply(lukasiewicz.not_, y)), 1),
+        ]
+        for formula in formulas:
+            simplified = simplify(formula)
+            self.assertLess(len(simplified.nodes()), len(formula.nodes()))
+            self.assertEquivalent(formula, simplified)
+
+
+if __name__ == '__main__':
+    unittest_main()
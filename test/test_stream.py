@@ -0,0 +1,97 @@
+# Imports from third party packages.
+from itertools import count, islice
+from json import dumps
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest import main as unittest_main
+
+# Imports from the local package.
+from mvl.formula import Apply, Var
+from mvl.stream import filter_rows, read_csv, read_jsonl, to_degree
+import mvl.kleene as kleene
+import mvl.priest as priest
+
+
+# is_red and not is_rotten
+predicate = Apply(kleene.and_, Var('is_red'), Apply(kleene.not_, Var('rotten')))
+
+rows = [
+    {'id': 0, 'is_red': True, 'rotten': False},
+    {'id': 1, 'is_red': True, 'rotten': None},
+    {'id': 2, 'is_red': True},
+    {'id': 3, 'is_red': False, 'rotten': False},
+    {'id': 4, 'is_red': 1.0, 'rotten': 0.0},
+    {'id': 5, 'is_red': kleene.u, 'rotten': kleene.f},
+]
+
+
+class TestStream(TestCase):
+    def _ids(self, rows):
+        return [row['id'] for row in rows]
+
+    def test_to_degree(self):
+        inputs_to_output_map = {
+            None: 0.5,
+            '': 0.5,
+            'NULL': 0.5,
+            'True': 1,
+            'f': 0,
+            True: 1,
+            False: 0,
+            '0.25': 0.25,
+            kleene.t: 1,
+        }
+        for input_, expected_output in inputs_to_output_map.items():
+            self.assertEqual(expected_output, to_degree(input_))
+
+    def test_filter_rows(self):
+        for batch_size in [1, 2, 100]:
+            self.assertEqual([0, 4], self._ids(filter_rows(
+                rows, predicate, batch_size=batch_size
+            )))
+
+    def test_priest_designation(self):
+        self.assertEqual([0, 1, 2, 4, 5], self._ids(filter_rows(
+            rows, predicate, system=priest.priest
+        )))
+
+    def test_fields(self):
+        renamed = [{'is red': row.get('is_red'), 'id': row['id']} for row in rows]
+        actual = filter_rows(renamed, Var('red'), fields={'red': 'is red'})
+        self.assertEqual([0, 1, 2, 4], self._ids(actual))
+
+    def test_lazy(self):
+        # An infinite stream, of which only the first matching rows are read.
+        infinite = ({'id': i, 'is_red': i % 2 == 0, 'rotten': False}
+            for i in count())
+        self.assertEqual(
+            [0, 2, 4], self._ids(islice(filter_rows(infinite, predicate), 3))
+        )
+
+    def test_read_csv(self):
+        with TemporaryDirectory() as directory:
+            file_path = path.join(directory, 'rows.csv')
+            with open(file_path, 'w') as file:
+                file.write('id,is_red,rotten\n0,true,false\n1,true,NULL\n'
+                    '2,true,\n3,false,false\n')
+
+            self.assertEqual(
+                ['0'], self._ids(filter_rows(read_csv(file_path), predicate))
+            )
+
+    def test_read_jsonl(self):
+        with TemporaryDirectory() as directory:
+            file_path = path.join(directory, 'rows.jsonl')
+            with open(file_path, 'w') as file:
+                for row in rows[:5]:
+                    file.write(dumps(row) + '\n')
+                file.write('\n')
+
+            self.assertEqual(
+                [0, 4], self._ids(filter_rows(read_jsonl(file_path), predicate))
+            )
+
+
+if __name__ == '__main__':
+    unittest_main()
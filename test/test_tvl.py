@@ -98,6 +98,18 @@ class OperatorTests(TVLTestCase):
 
 
 class KleenePriestOperatorTests(OperatorTests):
+    def test_all_(self):
+        f, u, t = self.f, self.u, self.t
+        self.assertEqual(t, self.mvl.all_([]))
+        self.assertEqual(u, self.mvl.all_([t, u, t]))
+        self.assertEqual(f, self.mvl.all_(iter([u, f, None])))
+
+    def test_any_(self):
+        f, u, t = self.f, self.u, self.t
+        self.assertEqual(f, self.mvl.any_([]))
+        self.assertEqual(u, self.mvl.any_([f, u, f]))
+        self.assertEqual(t, self.mvl.any_(iter([u, t, None])))
+
     def test_and_(self):
         f = self.f
         u = self.u
@@ -152,6 +164,18 @@ class KleenePriestOperatorTests(OperatorTests):
 
 
 class BochvarOperatorsTests(OperatorTests):
+    def test_all_(self):
+        f, u, t = self.f, self.u, self.t
+        self.assertEqual(t, self.mvl.all_([]))
+        self.assertEqual(f, self.mvl.all_([t, f, t]))
+        self.assertEqual(u, self.mvl.all_(iter([f, u, None])))
+
+    def test_any_(self):
+        f, u, t = self.f, self.u, self.t
+        self.assertEqual(f, self.mvl.any_([]))
+        self.assertEqual(t, self.mvl.any_([f, t, f]))
+        self.assertEqual(u, self.mvl.any_(iter([t, u, None])))
+
     def test_and_(self):
         f = self.f
         u = self.u
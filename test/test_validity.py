@@ -0,0 +1,102 @@
+# Imports from third party packages.
+from unittest import TestCase
+from unittest import main as unittest_main
+
+# Imports from the local package.
+from mvl.formula import Apply, Var
+from mvl.lukasiewicz import LogicSystem, LukasiewiczLogicValue
+from mvl.validity import (
+    are_equivalent,
+    find_counterexample,
+    find_difference,
+    find_model,
+    is_contradiction,
+    is_tautology,
+)
+import mvl.bochvar as bochvar
+import mvl.goedel as goedel
+import mvl.kleene as kleene
+import mvl.lukasiewicz as lukasiewicz
+import mvl.priest as priest
+
+
+a = Var('a')
+b = Var('b')
+c = Var('c')
+
+excluded_middle = Apply(kleene.or_, a, Apply(kleene.not_, a))
+contradiction = Apply(kleene.and_, a, Apply(kleene.not_, a))
+
+
+class TestValidity(TestCase):
+    processes = 1
+    chunk_size = 1 << 16
+
+    def _kwargs(self):
+        return {'processes': self.processes, 'chunk_size': self.chunk_size}
+
+    def test_excluded_middle(self):
+        # Excluded middle fails in kleene logic, where only «True» is
+        # designated, but holds in priest logic, where «Unknown» is too.
+        self.assertFalse(is_tautology(excluded_middle, kleene.kleene,
+            **self._kwargs()))
+        self.assertEqual({'a': kleene.u}, find_counterexample(
+            excluded_middle, kleene.kleene, **self._kwargs()
+        ))
+        self.assertTrue(is_tautology(excluded_middle, priest.priest,
+            **self._kwargs()))
+
+    def test_contradiction(self):
+        self.assertTrue(is_contradiction(contradiction, kleene.kleene,
+            **self._kwargs()))
+        self.assertEqual({'a': priest.u}, find_model(
+            contradiction, priest.priest, **self._kwargs()
+        ))
+
+    def test_lukasiewicz_tautology(self):
+        # a → (b → a) holds in every lukasiewicz logic.
+        formula = Apply(
+            lukasiewicz.implies, a, Apply(lukasiewicz.implies, b, a)
+        )
+        logic_system = LogicSystem(7, LukasiewiczLogicValue)
+        self.assertTrue(is_tautology(formula, logic_system, **self._kwargs()))
+
+    def test_equivalence(self):
+        # De Morgan's laws hold in kleene logic.
+        left = Apply(kleene.not_, Apply(kleene.and_, a, b))
+        right = Apply(kleene.or_, Apply(kleene.not_, a), Apply(kleene.not_, b))
+        self.assertTrue(are_equivalent(left, right, kleene.kleene,
+            **self._kwargs()))
+
+        # But bochvar's and_ is not kleene's.
+        self.assertEqual({'a': bochvar.f, 'b': bochvar.u}, find_difference(
+            Apply(kleene.and_, a, b), Apply(bochvar.and_, a, b),
+            bochvar.bochvar, **self._kwargs()
+        ))
+
+    def test_first_counterexample(self):
+        # Goedel's a → b is not designated whenever a > b.
+        logic_system = LogicSystem(5, LukasiewiczLogicValue)
+        formula = Apply(goedel.implies, Apply(goedel.or_, a, c), b)
+        values = logic_system.values
+
+        self.assertEqual(
+            {'a': values[0], 'c': values[1], 'b': values[0]},
+            find_counterexample(formula, logic_system, **self._kwargs()),
+        )
+
+    def test_constants_must_be_values(self):
+        formula = Apply(kleene.or_, a, 0.5)
+        self.assertFalse(is_tautology(formula, kleene.kleene, **self._kwargs()))
+        with self.assertRaises(ValueError):
+            is_tautology(Apply(kleene.or_, a, 0.3), kleene.kleene,
+                **self._kwargs())
+
+
+class TestParallelValidity(TestValidity):
+    processes = 2
+    chunk_size = 4
+
+
+if __name__ == '__main__':
+    unittest_main()
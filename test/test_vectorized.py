@@ -0,0 +1,354 @@
+# Imports from third party packages.
+from itertools import product as cartesian_product
+from unittest import TestCase
+from unittest import main as unittest_main
+
+import numpy as np
+
+# Imports from the local package.
+from mvl.lukasiewicz import (
+    LogicSystem,
+    LukasiewiczLogicValue,
+    PriestLogicValue,
+)
+import mvl.bochvar as bochvar
+import mvl.goedel as goedel
+import mvl.lukasiewicz as lukasiewicz
+import mvl.post as post
+import mvl.product as product
+import mvl.tvl_operators as tvl_operators
+import mvl.vectorized.bochvar as v_bochvar
+import mvl.vectorized.goedel as v_goedel
+import mvl.vectorized.lukasiewicz as v_lukasiewicz
+import mvl.vectorized.post as v_post
+import mvl.vectorized.product as v_product
+import mvl.vectorized.tvl_operators as v_tvl_operators
+from mvl.vectorized.formula import evaluate_degrees, operator_for
+from mvl.vectorized.systems import index_dtype, TruthTable
+from mvl.formula import Apply, Var
+
+
+class VectorizedOperatorsTestCase(TestCase):
+    """ Checks that every vectorized operator gives the same results as the
+    scalar operator it mirrors.
+    """
+    __test__ = False
+    scalar_module = None
+    vector_module = None
+    binary_operators = []
+    unary_operators = []
+    inputs = [0, 0.2, 0.25, 0.5, 0.6, 0.75, 1]
+
+    def _pairs(self):
+        return list(cartesian_product(self.inputs, repeat=2))
+
+    def test_binary_operators(self):
+        pairs = self._pairs()
+        a = np.array([pair[0] for pair in pairs])
+        b = np.array([pair[1] for pair in pairs])
+
+        for name in self.binary_operators:
+            scalar_op = getattr(self.scalar_module, name)
+            vector_op = getattr(self.vector_module, name)
+
+            expected = [scalar_op(*pair) for pair in pairs]
+            actual = vector_op(a, b)
+
+            self.assertIsInstance(actual, np.ndarray)
+            np.testing.assert_allclose(expected, actual, err_msg=name)
+
+    def test_unary_operators(self):
+        a = np.array(self.inputs)
+
+        for name in self.unary_operators:
+            scalar_op = getattr(self.scalar_module, name)
+            vector_op = getattr(self.vector_module, name)
+
+            expected = [scalar_op(x) for x in self.inputs]
+            actual = vector_op(a)
+
+            np.testing.assert_allclose(expected, actual, err_msg=name)
+
+    def test_broadcasting(self):
+        a = np.array(self.inputs).reshape(-1, 1)
+        b = np.array(self.inputs)
+
+        for name in self.binary_operators:
+            vector_op = getattr(self.vector_module, name)
+            self.assertEqual(
+                (len(self.inputs), len(self.inputs)), vector_op(a, b).shape
+            )
+
+
+class TestVectorizedLukasiewicz(VectorizedOperatorsTestCase):
+    __test__ = True
+    scalar_module = lukasiewicz
+    vector_module = v_lukasiewicz
+    binary_operators = [
+        's_and', 'w_and', 's_or', 'w_or', 'implies', 'equivalent'
+    ]
+    unary_operators = ['not_']
+
+    def test_logic_value_inputs(self):
+        values = LogicSystem(5, LukasiewiczLogicValue).values
+        actual = v_lukasiewicz.not_(values)
+        np.testing.assert_allclose([1, 0.75, 0.5, 0.25, 0], actual)
+
+    def _test_bool(self, class_, array_bool):
+        values = LogicSystem(5, class_).values
+        expected = [bool(value) for value in values]
+        actual = array_bool(values)
+        self.assertEqual(expected, actual.tolist())
+        self.assertEqual(expected, v_lukasiewicz.bool_for(class_)(values).tolist())
+
+    def test_lukasiewicz_bool(self):
+        self._test_bool(LukasiewiczLogicValue, v_lukasiewicz.lukasiewicz_bool)
+
+    def test_priest_bool(self):
+        self._test_bool(PriestLogicValue, v_lukasiewicz.priest_bool)
+
+    def test_bool_for_base_class(self):
+        with self.assertRaises(TypeError):
+            v_lukasiewicz.bool_for(lukasiewicz.LogicValue)
+
+
+class TestVectorizedGoedel(VectorizedOperatorsTestCase):
+    __test__ = True
+    scalar_module = goedel
+    vector_module = v_goedel
+    binary_operators = ['and_', 'or_', 'implies']
+    unary_operators = ['not_']
+
+
+class TestVectorizedProduct(VectorizedOperatorsTestCase):
+    __test__ = True
+    scalar_module = product
+    vector_module = v_product
+    binary_operators = ['mult', 'and_', 'implies']
+    unary_operators = ['not_']
+
+
+class TestVectorizedProductLogSpace(VectorizedOperatorsTestCase):
+    __test__ = True
+    scalar_module = product
+    vector_module = v_product
+    binary_operators = ['log_mult', 'log_and', 'log_implies']
+    unary_operators = ['log_not', 'from_log']
+    inputs = [product.to_log(x) for x in [0, 0.2, 0.25, 0.5, 0.6, 0.75, 1]]
+
+    def test_to_log(self):
+        degrees = [0, 0.2, 0.25, 0.5, 0.6, 0.75, 1]
+        np.testing.assert_allclose(
+            [product.to_log(x) for x in degrees], v_product.to_log(degrees)
+        )
+        with self.assertRaises(ValueError):
+            product.to_log(-0.5)
+        with self.assertRaises(ValueError):
+            v_product.to_log([0.5, -0.5])
+
+    def test_reductions(self):
+        a = v_product.to_log(
+            np.random.default_rng(0).choice([0, 0.1, 0.5, 1], (20, 300))
+        )
+        for scalar, vector in [
+                (product.log_mult_all, v_product.log_mult_all),
+                (product.log_all, v_product.log_all)]:
+            np.testing.assert_allclose(
+                np.apply_along_axis(scalar, 1, a), vector(a, axis=1)
+            )
+        self.assertEqual(0, v_product.log_all([]))
+
+
+class TestVectorizedTVLOperators(VectorizedOperatorsTestCase):
+    __test__ = True
+    scalar_module = tvl_operators
+    vector_module = v_tvl_operators
+    binary_operators = ['and_', 'or_', 'iff', 'xor', 'implies']
+    unary_operators = ['not_']
+    inputs = [0, 0.5, 1]
+
+
+class TestVectorizedBochvar(VectorizedOperatorsTestCase):
+    __test__ = True
+    scalar_module = bochvar
+    vector_module = v_bochvar
+    binary_operators = ['and_', 'or_', 'iff', 'implies']
+    unary_operators = ['not_']
+    inputs = [bochvar.f, bochvar.u, bochvar.t]
+
+
+class TestVectorizedPost(TestCase):
+    def test_not_(self):
+        for class_ in [post.PostLukasiewiczLogicValue, post.PostPriestLogicValue]:
+            values = LogicSystem(6, class_).values
+            expected = [post.not_(value) for value in values]
+            actual = v_post.not_(values, 5)
+            np.testing.assert_allclose(expected, actual)
+
+
+class TestVectorizedReductions(TestCase):
+    def setUp(self):
+        random = np.random.default_rng(0)
+        self.degrees = random.choice([0, 0.25, 0.5, 0.75, 1], (20, 6))
+        self.three_valued = random.choice([0, 0.5, 1], (20, 6))
+
+    def _test_reduction(self, scalar, vector, inputs):
+        for axis in [0, 1]:
+            expected = np.apply_along_axis(scalar, axis, inputs)
+            np.testing.assert_allclose(expected, vector(inputs, axis=axis))
+        self.assertAlmostEqual(scalar(inputs.ravel()), vector(inputs))
+
+    def test_reductions(self):
+        for scalar, vector in [
+                (lukasiewicz.s_all, v_lukasiewicz.s_all),
+                (lukasiewicz.s_any, v_lukasiewicz.s_any),
+                (lukasiewicz.w_all, v_lukasiewicz.w_all),
+                (lukasiewicz.w_any, v_lukasiewicz.w_any),
+                (goedel.all_, v_goedel.all_),
+                (goedel.any_, v_goedel.any_),
+                (product.all_, v_product.all_),
+                (product.mult_all, v_product.mult_all)]:
+            self._test_reduction(scalar, vector, self.degrees)
+
+    def test_three_valued_reductions(self):
+        for scalar, vector in [
+                (tvl_operators.all_, v_tvl_operators.all_),
+                (tvl_operators.any_, v_tvl_operators.any_),
+                (bochvar.all_, v_bochvar.all_),
+                (bochvar.any_, v_bochvar.any_)]:
+            self._test_reduction(scalar, vector, self.three_valued)
+
+    def test_empty(self):
+        self.assertEqual(1, v_lukasiewicz.s_all([]))
+        self.assertEqual(1, v_goedel.all_([]))
+        self.assertEqual(0, v_goedel.any_([]))
+
+
+class TestQuantize(TestCase):
+    def setUp(self):
+        self.logic_system = LogicSystem(11, LukasiewiczLogicValue)
+        self.inputs = np.linspace(0, 1, 101)
+
+    def test_matches_index(self):
+        for rounding in ['nearest', 'floor', 'ceil']:
+            expected = [
+                self.logic_system.index(f, rounding) for f in self.inputs
+            ]
+            actual = self.logic_system.quantize(self.inputs, rounding)
+            self.assertEqual(expected, actual.tolist())
+
+    def test_dtype(self):
+        self.assertEqual(np.uint8, index_dtype(256))
+        self.assertEqual(np.uint16, index_dtype(257))
+        self.assertEqual(np.uint8, self.logic_system.quantize([0.5]).dtype)
+
+    def test_iterables(self):
+        values = self.logic_system.values
+        expected = list(range(11))
+
+        self.assertEqual(expected, self.logic_system.quantize(values).tolist())
+        self.assertEqual(
+            expected, self.logic_system.quantize(iter(values)).tolist()
+        )
+
+    def test_mvl_array(self):
+        actual = self.logic_system.mvl_array([0, 0.52, 1])
+        self.assertEqual(
+            [self.logic_system.values[i] for i in [0, 5, 10]], actual.tolist()
+        )
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            self.logic_system.quantize([0.5, float('nan')])
+        with self.assertRaises(ValueError):
+            self.logic_system.quantize([0.5], 'up')
+
+
+class TestTruthTable(TestCase):
+    def _test_matches_operator(self, logic_system, op):
+        table = logic_system.truth_table(op)
+        values = logic_system.values
+
+        self.assertEqual(np.uint8, table.table.dtype)
+        for indices in np.ndindex(*table.table.shape):
+            expected = op(*[values[i] for i in indices])
+            self.assertAlmostEqual(expected, values[table(*indices)])
+
+    def test_three_valued_operators(self):
+        for module in [tvl_operators, bochvar]:
+            for op in [module.and_, module.or_, module.not_, module.implies,
+                    module.iff]:
+                self._test_matches_operator(bochvar.bochvar, op)
+
+    def test_n_valued_operators(self):
+        logic_system = LogicSystem(5, post.PostLukasiewiczLogicValue)
+        for op in [lukasiewicz.s_and, lukasiewicz.s_or, lukasiewicz.implies,
+                lukasiewicz.equivalent, goedel.implies, goedel.not_,
+                product.not_, post.not_]:
+            self._test_matches_operator(logic_system, op)
+
+    def test_product_operators(self):
+        for op in [product.and_, product.implies]:
+            self._test_matches_operator(bochvar.bochvar, op)
+        logic_system = LogicSystem(2, LukasiewiczLogicValue)
+        table = logic_system.truth_table(product.mult)
+        self.assertEqual([[0, 0], [0, 1]], table.table.tolist())
+
+    def test_mult_works_on_arrays(self):
+        np.testing.assert_array_equal(
+            product.mult(np.array([0.5, 1]), np.array([0.5, 0.25])),
+            [0.25, 0.25],
+        )
+
+    def test_array_lookup(self):
+        table = bochvar.bochvar.truth_table(bochvar.or_)
+        a = np.array([0, 0, 2, 1])
+        b = np.array([0, 2, 0, 2])
+
+        self.assertEqual([0, 2, 2, 1], table(a, b).tolist())
+        self.assertEqual((4, 4), table(a.reshape(-1, 1), b).shape)
+
+    def test_value(self):
+        table = bochvar.bochvar.truth_table(bochvar.implies)
+        self.assertIs(bochvar.t, table.value(bochvar.f, bochvar.t))
+
+    def test_cached(self):
+        self.assertIs(
+            bochvar.bochvar.truth_table(bochvar.and_),
+            bochvar.bochvar.truth_table(bochvar.and_),
+        )
+
+    def test_not_closed(self):
+        logic_system = LogicSystem(5, LukasiewiczLogicValue)
+        with self.assertRaises(ValueError):
+            TruthTable(logic_system, product.implies)
+
+
+class TestEvaluateDegrees(TestCase):
+    def test_operator_for(self):
+        self.assertIs(v_goedel.and_, operator_for(goedel.and_))
+        self.assertIs(v_lukasiewicz.w_and, operator_for(tvl_operators.and_))
+        self.assertIs(v_bochvar.not_, operator_for(bochvar.not_))
+
+    def test_matches_evaluate(self):
+        a = Var('a')
+        b = Var('b')
+        formula = Apply(
+            lukasiewicz.s_or,
+            Apply(product.and_, a, Apply(lukasiewicz.not_, b)),
+            Apply(lambda x, y: max(x, y), a, 0.3), # Not provided by MVL.
+        )
+        inputs = np.linspace(0, 1, 11)
+
+        expected = [
+            formula.evaluate({'a': x, 'b': y})
+            for x in inputs for y in inputs
+        ]
+        actual = evaluate_degrees(
+            formula, {'a': inputs.reshape(-1, 1), 'b': inputs}
+        )
+        np.testing.assert_allclose(expected, actual.ravel())
+
+
+if __name__ == '__main__':
+    unittest_main()